@@ -2,8 +2,21 @@
 """
 Generate PowerPoint presentation for Design-Build Phase Research
 AI Code Assistants for Federal Environments
+
+Slide content comes from a JSON (or YAML) deck spec; see 00-DESIGN-BUILD-DECK.json.
 """
 
+from pathlib import Path
+import sys
+
+# Shared deck helpers live in the deckkit package at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+from deckkit import daemon
+
+# Hand --daemon runs to the warm render daemon before paying for python-pptx
+if __name__ == "__main__":
+    daemon.hand_off(__file__)
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
@@ -11,7 +24,24 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.oxml.ns import qn
 from pptx.oxml import parse_xml
+import argparse
+import hashlib
+import inspect
+import itertools
+import json
 import os
+from functools import lru_cache
+from deckkit.bulk import ShapeBatch, cell_prototype, fill_table, shape_prototype
+from deckkit.cache import atomic_write_bytes
+from deckkit.fragments import append_fragment, export_fragments
+from deckkit.logos import LogoError, add_logo, default_cache, logo_png
+from deckkit.package_writer import format_stats, parse_compression
+from deckkit.reproducible import save_deck
+from deckkit.styles import StyleRegistry
+from deckkit.trace import session as trace_session, traced
+
+# Tool logos: this deck's own first, then the repository-wide set
+LOGO_DIRS = (Path(__file__).with_name("logos"), Path(__file__).resolve().parents[4] / "logos")
 
 # Color scheme
 BRAND_PURPLE = RGBColor(117, 0, 192)  # #7500c0
@@ -22,6 +52,30 @@ WHITE = RGBColor(255, 255, 255)
 PROCEED_GREEN = RGBColor(16, 185, 129)  # #10B981
 CAUTION_AMBER = RGBColor(245, 158, 11)  # #F59E0B
 
+# Text styles, compiled once and applied as a single XML element
+STYLES = StyleRegistry()
+STYLES.define('cover-title', size=Pt(40), bold=True, color=WHITE)
+STYLES.define('cover-subtitle', size=Pt(18), color=WHITE)
+STYLES.define('cover-footer', size=Pt(10), color=LIGHT_GRAY)
+STYLES.define('section-title', size=Pt(36), bold=True, color=BRAND_PURPLE)
+STYLES.define('section-subtitle', size=Pt(18), color=DARK_GRAY)
+STYLES.define('bar-title', size=Pt(28), bold=True, color=WHITE)
+STYLES.define('bar-title-small', size=Pt(24), bold=True, color=WHITE)
+STYLES.define('bullet', size=Pt(18), color=DARK_GRAY)
+STYLES.define('bullet-lead', size=Pt(18), bold=True, color=BRAND_PURPLE)
+STYLES.define('table-header', size=Pt(12), bold=True, color=WHITE)
+STYLES.define('table-cell', size=Pt(11), color=DARK_GRAY)
+STYLES.define('score', size=Pt(18), bold=True, color=WHITE)
+STYLES.define('path', size=Pt(14), color=LIGHT_GRAY)
+STYLES.define('feature', size=Pt(16), color=DARK_GRAY)
+STYLES.define('recommendation', size=Pt(14), bold=True, color=BRAND_PURPLE)
+STYLES.define('decision-need', size=Pt(12), color=DARK_GRAY)
+STYLES.define('decision-choice', size=Pt(12), bold=True, color=BRAND_PURPLE)
+STYLES.define('decision-reason', size=Pt(11), italic=True, color=LIGHT_GRAY)
+STYLES.define('summary-title', size=Pt(36), bold=True, color=WHITE)
+STYLES.define('takeaway', size=Pt(20), color=WHITE)
+STYLES.define('summary-footer', size=Pt(12), color=RGBColor(200, 200, 220))
+
 
 def set_slide_background(slide, color):
     """Set solid background color for a slide"""
@@ -31,7 +85,9 @@ def set_slide_background(slide, color):
     fill.fore_color.rgb = color
 
 
-def add_title_slide(prs, title, subtitle):
+@traced('slide')
+def add_title_slide(prs, title, subtitle,
+                    footer="GenAI COTS Team | Accenture Federal Services | December 2025"):
     """Add title slide with gradient-style header"""
     slide_layout = prs.slide_layouts[6]  # Blank layout
     slide = prs.slides.add_slide(slide_layout)
@@ -55,9 +111,7 @@ def add_title_slide(prs, title, subtitle):
     tf.word_wrap = True
     p = tf.paragraphs[0]
     p.text = title
-    p.font.size = Pt(40)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
+    STYLES['cover-title'].apply(p)
     p.alignment = PP_ALIGN.LEFT
 
     # Subtitle
@@ -68,8 +122,7 @@ def add_title_slide(prs, title, subtitle):
     tf = subtitle_box.text_frame
     p = tf.paragraphs[0]
     p.text = subtitle
-    p.font.size = Pt(18)
-    p.font.color.rgb = WHITE
+    STYLES['cover-subtitle'].apply(p)
     p.alignment = PP_ALIGN.LEFT
 
     # Footer
@@ -79,13 +132,13 @@ def add_title_slide(prs, title, subtitle):
     )
     tf = footer_box.text_frame
     p = tf.paragraphs[0]
-    p.text = "GenAI COTS Team | Accenture Federal Services | December 2025"
-    p.font.size = Pt(10)
-    p.font.color.rgb = LIGHT_GRAY
+    p.text = footer
+    STYLES['cover-footer'].apply(p)
 
     return slide
 
 
+@traced('slide')
 def add_section_header(prs, title, subtitle=None):
     """Add section header slide"""
     slide_layout = prs.slide_layouts[6]  # Blank
@@ -109,19 +162,17 @@ def add_section_header(prs, title, subtitle=None):
     tf = title_box.text_frame
     p = tf.paragraphs[0]
     p.text = title
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = BRAND_PURPLE
+    STYLES['section-title'].apply(p)
 
     if subtitle:
         p = tf.add_paragraph()
         p.text = subtitle
-        p.font.size = Pt(18)
-        p.font.color.rgb = DARK_GRAY
+        STYLES['section-subtitle'].apply(p)
 
     return slide
 
 
+@traced('slide')
 def add_content_slide(prs, title, content_items, highlight_first=False):
     """Add content slide with bullets"""
     slide_layout = prs.slide_layouts[6]  # Blank
@@ -145,9 +196,7 @@ def add_content_slide(prs, title, content_items, highlight_first=False):
     tf = title_box.text_frame
     p = tf.paragraphs[0]
     p.text = title
-    p.font.size = Pt(28)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
+    STYLES['bar-title'].apply(p)
 
     # Content
     content_box = slide.shapes.add_textbox(
@@ -164,17 +213,35 @@ def add_content_slide(prs, title, content_items, highlight_first=False):
             p = tf.add_paragraph()
 
         p.text = f"• {item}"
-        p.font.size = Pt(18)
-        p.font.color.rgb = DARK_GRAY
+        STYLES['bullet-lead' if highlight_first and i == 0 else 'bullet'].apply(p)
         p.space_after = Pt(12)
 
-        if highlight_first and i == 0:
-            p.font.bold = True
-            p.font.color.rgb = BRAND_PURPLE
-
     return slide
 
 
+@lru_cache(maxsize=None)
+def table_cell_prototypes():
+    """Styled header, body and highlight cells that table slides are filled with"""
+    def styled(fill, style):
+        def build(cell):
+            cell.text = 'x'
+            cell.fill.solid()
+            cell.fill.fore_color.rgb = fill
+            for paragraph in cell.text_frame.paragraphs:
+                STYLES[style].apply(paragraph)
+                paragraph.alignment = PP_ALIGN.CENTER
+            cell.vertical_anchor = MSO_ANCHOR.MIDDLE
+        return cell_prototype(build)
+
+    return {
+        'header': styled(BRAND_PURPLE, 'table-header'),
+        'even': styled(RGBColor(245, 245, 250), 'table-cell'),  # Alternate row colors
+        'odd': styled(WHITE, 'table-cell'),
+        'highlight': styled(RGBColor(243, 232, 255), 'table-cell'),  # Light purple
+    }
+
+
+@traced('slide')
 def add_table_slide(prs, title, headers, rows, highlight_col=None):
     """Add slide with table"""
     slide_layout = prs.slide_layouts[6]  # Blank
@@ -198,9 +265,7 @@ def add_table_slide(prs, title, headers, rows, highlight_col=None):
     tf = title_box.text_frame
     p = tf.paragraphs[0]
     p.text = title
-    p.font.size = Pt(24)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
+    STYLES['bar-title-small'].apply(p)
 
     # Calculate table dimensions
     num_rows = len(rows) + 1  # +1 for header
@@ -215,52 +280,28 @@ def add_table_slide(prs, title, headers, rows, highlight_col=None):
         table_width, table_height
     ).table
 
-    # Style header row
-    for col_idx, header in enumerate(headers):
-        cell = table.cell(0, col_idx)
-        cell.text = header
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = BRAND_PURPLE
-
-        for paragraph in cell.text_frame.paragraphs:
-            paragraph.font.bold = True
-            paragraph.font.size = Pt(12)
-            paragraph.font.color.rgb = WHITE
-            paragraph.alignment = PP_ALIGN.CENTER
-
-        cell.vertical_anchor = MSO_ANCHOR.MIDDLE
-
-    # Fill data rows
-    for row_idx, row_data in enumerate(rows):
-        for col_idx, cell_value in enumerate(row_data):
-            cell = table.cell(row_idx + 1, col_idx)
-            cell.text = str(cell_value)
-
-            # Alternate row colors
-            if row_idx % 2 == 0:
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = RGBColor(245, 245, 250)
-            else:
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = WHITE
-
-            # Highlight column if specified
-            if highlight_col is not None and col_idx == highlight_col:
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = RGBColor(243, 232, 255)  # Light purple
-
-            for paragraph in cell.text_frame.paragraphs:
-                paragraph.font.size = Pt(11)
-                paragraph.font.color.rgb = DARK_GRAY
-                paragraph.alignment = PP_ALIGN.CENTER
-
-            cell.vertical_anchor = MSO_ANCHOR.MIDDLE
+    # Header row and data rows, cloned from pre-styled cells
+    prototypes = table_cell_prototypes()
+    header_cells = ((0, col_idx, prototypes['header'], header)
+                    for col_idx, header in enumerate(headers))
+    body_cells = ((row_idx + 1, col_idx,
+                   prototypes['highlight' if col_idx == highlight_col
+                              else 'even' if row_idx % 2 == 0 else 'odd'],
+                   str(cell_value))
+                  for row_idx, row_data in enumerate(rows)
+                  for col_idx, cell_value in enumerate(row_data))
+    fill_table(table, itertools.chain(header_cells, body_cells))
 
     return slide
 
 
-def add_tool_highlight_slide(prs, tool_name, score, path, features, recommendation):
-    """Add individual tool highlight slide"""
+@traced('slide')
+def add_tool_highlight_slide(prs, tool_name, score, path, features, recommendation, logo=True):
+    """Add individual tool highlight slide
+
+    logo: True to look the tool's logo up in LOGO_DIRS, False for none, or a
+    logo file path (relative paths are resolved against this script's directory)
+    """
     slide_layout = prs.slide_layouts[6]  # Blank
     slide = prs.slides.add_slide(slide_layout)
 
@@ -282,9 +323,7 @@ def add_tool_highlight_slide(prs, tool_name, score, path, features, recommendati
     tf = title_box.text_frame
     p = tf.paragraphs[0]
     p.text = tool_name
-    p.font.size = Pt(28)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
+    STYLES['bar-title'].apply(p)
 
     # Score badge
     score_box = slide.shapes.add_shape(
@@ -293,7 +332,11 @@ def add_tool_highlight_slide(prs, tool_name, score, path, features, recommendati
         Inches(2.2), Inches(0.7)
     )
     score_box.fill.solid()
-    score_box.fill.fore_color.rgb = PROCEED_GREEN if float(score.split('/')[0]) >= 8.5 else CAUTION_AMBER
+    try:
+        proceed = float(score.split('/')[0]) >= 8.5
+    except ValueError:  # free-text score: flag it for review rather than abort the deck
+        proceed = False
+    score_box.fill.fore_color.rgb = PROCEED_GREEN if proceed else CAUTION_AMBER
     score_box.line.fill.background()
 
     score_text = slide.shapes.add_textbox(
@@ -303,9 +346,7 @@ def add_tool_highlight_slide(prs, tool_name, score, path, features, recommendati
     tf = score_text.text_frame
     p = tf.paragraphs[0]
     p.text = f"Score: {score}"
-    p.font.size = Pt(18)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
+    STYLES['score'].apply(p)
     p.alignment = PP_ALIGN.CENTER
 
     # Path indicator
@@ -316,8 +357,20 @@ def add_tool_highlight_slide(prs, tool_name, score, path, features, recommendati
     tf = path_box.text_frame
     p = tf.paragraphs[0]
     p.text = f"Path: {path}"
-    p.font.size = Pt(14)
-    p.font.color.rgb = LIGHT_GRAY
+    STYLES['path'].apply(p)
+
+    # Tool logo, top right of the content area
+    if logo is True:
+        logo_file = logo_png(tool_name, LOGO_DIRS)
+    elif logo:
+        try:
+            logo_file = default_cache().png(Path(__file__).parent / logo)
+        except (LogoError, OSError) as e:
+            raise RuntimeError(f"logo for {tool_name}: {e}")
+    else:
+        logo_file = None
+    if logo_file:
+        add_logo(slide.shapes, logo_file, Inches(9.5), Inches(1.1), Inches(0.45), Inches(1.8))
 
     # Key features
     features_box = slide.shapes.add_textbox(
@@ -333,8 +386,7 @@ def add_tool_highlight_slide(prs, tool_name, score, path, features, recommendati
         else:
             p = tf.add_paragraph()
         p.text = f"✓ {feature}"
-        p.font.size = Pt(16)
-        p.font.color.rgb = DARK_GRAY
+        STYLES['feature'].apply(p)
         p.space_after = Pt(8)
 
     # Recommendation box
@@ -354,15 +406,41 @@ def add_tool_highlight_slide(prs, tool_name, score, path, features, recommendati
     tf = rec_text.text_frame
     p = tf.paragraphs[0]
     p.text = f"Recommendation: {recommendation}"
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = BRAND_PURPLE
+    STYLES['recommendation'].apply(p)
 
     return slide
 
 
-def add_decision_matrix_slide(prs):
-    """Add when-to-choose decision matrix"""
+@lru_cache(maxsize=None)
+def decision_row_prototypes():
+    """Need, arrow, choice and reason shapes of a decision matrix row"""
+    def textbox(style):
+        def build(shapes):
+            box = shapes.add_textbox(0, 0, 0, 0)
+            p = box.text_frame.paragraphs[0]
+            p.text = 'x'
+            STYLES[style].apply(p)
+            return box
+        return shape_prototype(build)
+
+    def arrow(shapes):
+        shape = shapes.add_shape(MSO_SHAPE.RIGHT_ARROW, 0, 0, 0, 0)
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = BRAND_PURPLE
+        shape.line.fill.background()
+        return shape
+
+    return {
+        'need': textbox('decision-need'),
+        'arrow': shape_prototype(arrow),
+        'choice': textbox('decision-choice'),
+        'reason': textbox('decision-reason'),
+    }
+
+
+@traced('slide')
+def add_decision_matrix_slide(prs, decisions, title="Decision Matrix: When to Choose Each Tool"):
+    """Add when-to-choose decision matrix of (need, choice, reason) rows"""
     slide_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(slide_layout)
 
@@ -382,74 +460,26 @@ def add_decision_matrix_slide(prs):
     )
     tf = title_box.text_frame
     p = tf.paragraphs[0]
-    p.text = "Decision Matrix: When to Choose Each Tool"
-    p.font.size = Pt(24)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-
-    # Decision items
-    decisions = [
-        ("Maximum air-gap security", "Tabby", "Zero cloud deps, Rust, local models"),
-        ("FedRAMP SaaS with full features", "Windsurf", "Only FedRAMP High certified"),
-        ("Open-source flexibility", "Continue.dev", "Apache 2.0, 20+ LLM providers"),
-        ("Terminal/CLI workflow", "Claude Code", "Native terminal, agentic"),
-        ("Enterprise air-gap + support", "Tabnine", "SOC 2, IP indemnification"),
-        ("Code review + testing focus", "Qodo", "PR-Agent, test generation"),
-    ]
+    p.text = title
+    STYLES['bar-title-small'].apply(p)
 
+    # Four shapes per row, emitted in one batch
+    prototypes = decision_row_prototypes()
     y_pos = 1.1
-    for need, choice, reason in decisions:
-        # Need
-        need_box = slide.shapes.add_textbox(
-            Inches(0.3), Inches(y_pos),
-            Inches(3.2), Inches(0.5)
-        )
-        tf = need_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = need
-        p.font.size = Pt(12)
-        p.font.color.rgb = DARK_GRAY
-
-        # Arrow
-        arrow = slide.shapes.add_shape(
-            MSO_SHAPE.RIGHT_ARROW,
-            Inches(3.5), Inches(y_pos + 0.1),
-            Inches(0.4), Inches(0.25)
-        )
-        arrow.fill.solid()
-        arrow.fill.fore_color.rgb = BRAND_PURPLE
-        arrow.line.fill.background()
-
-        # Choice
-        choice_box = slide.shapes.add_textbox(
-            Inches(4), Inches(y_pos),
-            Inches(1.8), Inches(0.5)
-        )
-        tf = choice_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = choice
-        p.font.size = Pt(12)
-        p.font.bold = True
-        p.font.color.rgb = BRAND_PURPLE
-
-        # Reason
-        reason_box = slide.shapes.add_textbox(
-            Inches(5.8), Inches(y_pos),
-            Inches(4), Inches(0.5)
-        )
-        tf = reason_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = reason
-        p.font.size = Pt(11)
-        p.font.italic = True
-        p.font.color.rgb = LIGHT_GRAY
-
-        y_pos += 0.65
+    with ShapeBatch(slide) as batch:
+        for need, choice, reason in decisions:
+            batch.add(prototypes['need'], Inches(0.3), Inches(y_pos), Inches(3.2), Inches(0.5), text=need)
+            batch.add(prototypes['arrow'], Inches(3.5), Inches(y_pos + 0.1), Inches(0.4), Inches(0.25))
+            batch.add(prototypes['choice'], Inches(4), Inches(y_pos), Inches(1.8), Inches(0.5), text=choice)
+            batch.add(prototypes['reason'], Inches(5.8), Inches(y_pos), Inches(4), Inches(0.5), text=reason)
+            y_pos += 0.65
 
     return slide
 
 
-def add_summary_slide(prs):
+@traced('slide')
+def add_summary_slide(prs, takeaways, title="Key Takeaways",
+                      contact="christopher.g.roge@afs.com"):
     """Add final summary slide"""
     slide_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(slide_layout)
@@ -464,18 +494,8 @@ def add_summary_slide(prs):
     )
     tf = title_box.text_frame
     p = tf.paragraphs[0]
-    p.text = "Key Takeaways"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-
-    takeaways = [
-        "Air-Gapped/Classified: Tabby is the gold standard",
-        "AWS GovCloud: Claude Code via Bedrock offers FedRAMP High",
-        "Flexibility: Continue.dev provides maximum LLM choice",
-        "Enterprise SaaS: Windsurf is the only FedRAMP High certified",
-        "All six tools provide viable federal paths"
-    ]
+    p.text = title
+    STYLES['summary-title'].apply(p)
 
     content_box = slide.shapes.add_textbox(
         Inches(0.5), Inches(1.8),
@@ -490,8 +510,7 @@ def add_summary_slide(prs):
         else:
             p = tf.add_paragraph()
         p.text = f"→ {takeaway}"
-        p.font.size = Pt(20)
-        p.font.color.rgb = WHITE
+        STYLES['takeaway'].apply(p)
         p.space_after = Pt(16)
 
     # Footer
@@ -501,184 +520,286 @@ def add_summary_slide(prs):
     )
     tf = footer_box.text_frame
     p = tf.paragraphs[0]
-    p.text = "Contact: christopher.g.roge@afs.com"
-    p.font.size = Pt(12)
-    p.font.color.rgb = RGBColor(200, 200, 220)
+    p.text = f"Contact: {contact}"
+    STYLES['summary-footer'].apply(p)
 
     return slide
 
 
-def main():
-    """Generate the Design-Build research presentation"""
+@traced('slide')
+def add_research_table_slides(prs, title, project, columns, headers=None,
+                              rows_per_slide=8, entity_type=None, highlight_col=None):
+    """Add table slides with one row per project entity, read from the research database"""
+    from deckkit.research_db import default_db
+
+    headers = headers or ['Tool'] + [c.title() for c in columns]
+    rows = default_db().table_rows(project, columns, entity_type)
+    page_title = title
+    while True:
+        page = list(itertools.islice(rows, rows_per_slide))
+        if not page:
+            break
+        add_table_slide(prs, page_title, headers, page, highlight_col)
+        page_title = f"{title} (cont.)"
+
+
+@traced('slide')
+def add_research_tool_slides(prs, project, entity_type='tool'):
+    """Add a tool highlight slide per project entity, read from the research database"""
+    from deckkit.research_db import default_db
+
+    for tool in default_db().tool_highlights(project, entity_type):
+        add_tool_highlight_slide(prs, **tool)
+
+
+# Deck spec slide "type" -> helper; the remaining keys are the helper's arguments
+SLIDE_TYPES = {
+    'title': add_title_slide,
+    'section': add_section_header,
+    'content': add_content_slide,
+    'table': add_table_slide,
+    'tool': add_tool_highlight_slide,
+    'decision_matrix': add_decision_matrix_slide,
+    'summary': add_summary_slide,
+    'research_table': add_research_table_slides,
+    'research_tools': add_research_tool_slides,
+}
+
+# Arguments that must be lists (of strings, or of rows for the nested ones)
+LIST_ARGS = {'content_items', 'headers', 'features', 'takeaways', 'columns'}
+ROW_ARGS = {'rows', 'decisions'}
+
+DEFAULT_SPEC = Path(__file__).with_name("00-DESIGN-BUILD-DECK.json")
+PLAN_CACHE_DIR = ".deck-cache"
+# Bump when the plan format or a helper signature changes so cached plans are recompiled
+PLAN_VERSION = "2"
+# Smaller plans render faster in-process than through a worker pool
+PARALLEL_MIN_SLIDES = 24
+
+
+class DeckSpecError(ValueError):
+    """Raised when a deck spec is malformed"""
+
+
+def load_spec(spec_path):
+    """Read a JSON or YAML deck spec"""
+    spec_path = Path(spec_path)
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        if spec_path.suffix in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise DeckSpecError(f"{spec_path}: PyYAML is required for YAML specs")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def validate_slide(index, slide):
+    """Check one slide entry against its helper's signature, returning (type, kwargs)"""
+    where = f"slides[{index}]"
+    if not isinstance(slide, dict):
+        raise DeckSpecError(f"{where}: expected a mapping, got {type(slide).__name__}")
+    kwargs = dict(slide)
+    slide_type = kwargs.pop('type', None)
+    if slide_type not in SLIDE_TYPES:
+        raise DeckSpecError(f"{where}: unknown slide type {slide_type!r}, "
+                            f"expected one of {', '.join(SLIDE_TYPES)}")
+
+    try:
+        inspect.signature(SLIDE_TYPES[slide_type]).bind(None, **kwargs)
+    except TypeError as e:
+        raise DeckSpecError(f"{where} ({slide_type}): {e}")
+
+    for name, value in kwargs.items():
+        if name in LIST_ARGS | ROW_ARGS and not isinstance(value, list):
+            raise DeckSpecError(f"{where}.{name}: expected a list")
+        if name in ROW_ARGS and not all(isinstance(row, list) for row in value):
+            raise DeckSpecError(f"{where}.{name}: expected a list of rows")
+
+    if slide_type == 'table':
+        width = len(kwargs['headers'])
+        for row_index, row in enumerate(kwargs['rows']):
+            if len(row) != width:
+                raise DeckSpecError(f"{where}.rows[{row_index}]: has {len(row)} cells, "
+                                    f"expected {width}")
+    if slide_type == 'decision_matrix':
+        for row_index, row in enumerate(kwargs['decisions']):
+            if len(row) != 3:
+                raise DeckSpecError(f"{where}.decisions[{row_index}]: expected [need, choice, reason]")
+
+    return slide_type, kwargs
+
+
+def compile_spec(spec):
+    """Validate a loaded spec and compile it into a render plan"""
+    if not isinstance(spec, dict) or not isinstance(spec.get('slides'), list):
+        raise DeckSpecError("spec must be a mapping with a 'slides' list")
+    return {
+        'output': spec.get('output', '00-DECK.pptx'),
+        'slide_width': float(spec.get('slide_width', 10)),
+        'slide_height': float(spec.get('slide_height', 5.63)),
+        'slides': [validate_slide(i, slide) for i, slide in enumerate(spec['slides'])],
+    }
+
+
+@traced('plan')
+def load_plan(spec_path):
+    """Compiled render plan for a spec file, cached on disk by content hash"""
+    spec_path = Path(spec_path)
+    raw = spec_path.read_bytes()
+    key = hashlib.sha256(PLAN_VERSION.encode() + raw).hexdigest()
+    # JSON, not pickle: the cache sits in the working tree, where a planted
+    # pickle would run code at build time
+    cache_path = spec_path.parent / PLAN_CACHE_DIR / f"{key}.json"
+
+    try:
+        return json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    plan = compile_spec(load_spec(spec_path))
+    try:
+        atomic_write_bytes(cache_path, json.dumps(plan).encode())
+    except OSError:
+        pass  # Caching is best effort, e.g. on a read-only checkout
+    return plan
+
+
+def new_presentation(slide_width, slide_height):
+    """Empty Presentation with the given slide size in inches"""
     prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(5.63)  # 16:9 aspect ratio
-
-    # 1. Title Slide
-    add_title_slide(
-        prs,
-        "AI Code Assistants for Federal Environments",
-        "Design-Build Phase | Agentic SDLC Research"
-    )
-
-    # 2. Executive Summary
-    add_content_slide(prs, "Executive Summary", [
-        "Evaluated 22 AI code assistants for federal deployment viability",
-        "Two deployment paths: Path A (FedRAMP SaaS) and Path B (Self-Hosted with GovCloud LLMs)",
-        "Top recommendations: Tabby (9/10), Continue.dev (8.5/10), Claude Code (8.5/10), Windsurf (8.5/10)",
-        "All six evaluated tools provide viable federal paths",
-        "Choice depends on security requirements, infrastructure, and feature priorities"
-    ], highlight_first=True)
-
-    # 3. Federal Deployment Paths
-    add_section_header(prs, "Federal Deployment Paths", "Understanding Path A vs Path B")
-
-    add_content_slide(prs, "Path A: FedRAMP Cloud Deployment", [
-        "Tool vendor provides FedRAMP-authorized cloud service",
-        "Lower infrastructure burden - vendor manages compute",
-        "Limited to unclassified workloads (IL2-IL4)",
-        "Currently only Windsurf has actual FedRAMP High authorization",
-        "GitHub Copilot expected to follow (verify status)"
-    ])
-
-    add_content_slide(prs, "Path B: Self-Hosted with GovCloud LLMs", [
-        "Tool runs on-premises or in agency cloud",
-        "Connects to authorized LLM backends (AWS Bedrock, Azure OpenAI)",
-        "Supports air-gapped and classified workloads (IL5+)",
-        "Higher infrastructure responsibility",
-        "Multiple excellent options: Tabby, Continue.dev, Tabnine, Qodo"
-    ])
-
-    # 4. Federal Viability Matrix
-    add_section_header(prs, "Federal Viability Matrix", "Comparing Top 6 Candidates")
-
-    add_table_slide(
-        prs,
-        "Federal Compliance Comparison",
-        ["Tool", "Score", "Path", "FedRAMP", "Air-Gap", "GovCloud LLM"],
-        [
-            ["Tabby", "9/10", "B", "N/A", "Yes", "Bedrock, Azure"],
-            ["Continue.dev", "8.5/10", "B", "N/A", "Yes", "Bedrock, Azure"],
-            ["Claude Code", "8.5/10", "B", "Via Bedrock", "No", "Bedrock"],
-            ["Windsurf", "8.5/10", "A+B", "High", "BYOL only", "Bedrock, Azure"],
-            ["Tabnine", "8/10", "B", "No", "Yes", "Bedrock, Azure"],
-            ["Qodo", "8/10", "B", "No", "Yes", "Bedrock, Azure"],
-        ],
-        highlight_col=1
-    )
-
-    add_table_slide(
-        prs,
-        "Architecture & Capabilities",
-        ["Tool", "Architecture", "Self-Hosted", "Agentic", "Code Review"],
-        [
-            ["Tabby", "Rust binary", "Full features", "Limited", "No"],
-            ["Continue.dev", "IDE extension", "Full features", "Yes", "No"],
-            ["Claude Code", "CLI client", "N/A", "Native", "Yes"],
-            ["Windsurf", "IDE (fork)", "Reduced*", "Cascade", "No"],
-            ["Tabnine", "IDE extension", "Full features", "Limited", "No"],
-            ["Qodo", "IDE extension", "Full features", "Yes", "PR-Agent"],
-        ]
-    )
-
-    # 5. Tool Highlights
-    add_section_header(prs, "Top Recommendations", "Detailed Tool Profiles")
-
-    add_tool_highlight_slide(
-        prs,
-        "Tabby",
-        "9/10",
-        "B (Self-Hosted)",
-        [
-            "Zero cloud dependencies - fully air-gapped capable",
-            "Written in Rust for memory safety and performance",
-            "Apache 2.0 open-source - no vendor lock-in",
-            "Supports AWS Bedrock via OpenAI-compatible API",
-            "~$500-2K/month infrastructure for 50 engineers"
-        ],
-        "PROCEED - Best for air-gapped/IL5+ environments"
-    )
+    prs.slide_width = Inches(slide_width)
+    prs.slide_height = Inches(slide_height)  # 16:9 aspect ratio
+    return prs
+
+
+@traced('render')
+def render_fragment(slide_size, entries):
+    """Render plan entries in a scratch presentation, returning their slides as fragments"""
+    prs = new_presentation(*slide_size)
+    for slide_type, kwargs in entries:
+        SLIDE_TYPES[slide_type](prs, **kwargs)
+    return export_fragments(prs)
+
+
+@traced('render')
+def render_plan(plan, workers=1):
+    """Build the Presentation described by a compiled plan
+
+    With several workers and a large plan, contiguous runs of entries are
+    rendered in worker processes and their slides merged back in declaration
+    order. The result is the same as rendering in-process.
+    """
+    slide_size = (plan['slide_width'], plan['slide_height'])
+    prs = new_presentation(*slide_size)
+    entries = plan['slides']
+
+    if workers > 1 and len(entries) >= PARALLEL_MIN_SLIDES:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # A few chunks per worker evens out slides of different cost
+        size = -(-len(entries) // (workers * 4))
+        chunks = [entries[i:i + size] for i in range(0, len(entries), size)]
+        # Forked workers would share this process's research database connections
+        # (default_db), and a connection used from two processes corrupts its protocol
+        context = multiprocessing.get_context('forkserver')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            # map yields results in submission order, whichever worker finishes first
+            for fragments in pool.map(render_fragment, itertools.repeat(slide_size), chunks):
+                for fragment in fragments:
+                    append_fragment(prs, fragment)
+        return prs
+
+    for slide_type, kwargs in entries:
+        SLIDE_TYPES[slide_type](prs, **kwargs)
+
+    return prs
+
+
+def _run(args):
+    """Build, or with --check validate, every spec main() was given"""
+    compression = args.compression
+    spec_paths = []
+    for path in args.specs:
+        if path.is_dir():
+            spec_paths.extend(sorted(p for p in path.iterdir()
+                                     if p.suffix in ('.json', '.yaml', '.yml')))
+        else:
+            spec_paths.append(path)
+
+    failed = False
+    written = []
+    for spec_path in spec_paths:
+        try:
+            plan = load_plan(spec_path)
+        except (DeckSpecError, ValueError, OSError) as e:
+            print(f"Error: {spec_path}: {e}")
+            failed = True
+            continue
+
+        if args.check:
+            print(f"OK: {spec_path} ({len(plan['slides'])} slides)")
+            continue
+
+        try:
+            prs = render_plan(plan, args.workers)
+        except RuntimeError as e:  # e.g. research database slides without psycopg
+            print(f"Error: {spec_path}: {e}")
+            failed = True
+            continue
+        output_path = os.path.join(os.path.dirname(os.path.abspath(spec_path)), plan['output'])
+        stats = []
+        if save_deck(prs, output_path, compression, stats):
+            print(f"Presentation saved to: {output_path}")
+        else:
+            print(f"Presentation unchanged: {output_path}")
+        if args.save_stats:
+            print('\n'.join(format_stats(stats)))
+        written.append(output_path)
+        print(f"Total slides: {len(prs.slides)}")
 
-    add_tool_highlight_slide(
-        prs,
-        "Continue.dev",
-        "8.5/10",
-        "B (Self-Hosted)",
-        [
-            "Apache 2.0 open-source with 30K+ GitHub stars",
-            "Native AWS Bedrock and Azure OpenAI providers",
-            "Full offline mode with Ollama local models",
-            "20+ LLM providers supported",
-            "Enterprise: SSO, governance, managed proxy"
-        ],
-        "PROCEED - Best open-source option with GovCloud flexibility"
-    )
+    if args.verify_render and written:
+        from deckkit.render_check import RenderError, verify_renders
+        try:
+            failed |= not verify_renders(written)
+        except RenderError as e:
+            print(f"Error: {e}")
+            failed = True
 
-    add_tool_highlight_slide(
-        prs,
-        "Claude Code",
-        "8.5/10",
-        "B (Via Bedrock)",
-        [
-            "CLAUDE_CODE_USE_BEDROCK=1 routes to GovCloud",
-            "FedRAMP High, DoD IL4/5 via Bedrock",
-            "Telemetry auto-disabled with Bedrock",
-            "Terminal-native (no IDE required)",
-            "MCP protocol for enterprise integrations"
-        ],
-        "CONDITIONAL - Best for AWS GovCloud users (requires internet)"
-    )
+    if failed:
+        raise SystemExit(1)
 
-    add_tool_highlight_slide(
-        prs,
-        "Windsurf",
-        "8.5/10",
-        "A+B (Hybrid)",
-        [
-            "FedRAMP High authorized (March 2025) via Palantir FedStart",
-            "DoD IL4, IL5, IL6, ITAR compliant",
-            "Hybrid deployment with full features",
-            "Self-hosted loses Cascade agentic feature",
-            "$60/user/month, 2-4 week setup"
-        ],
-        "PROCEED - Only actual FedRAMP High certified option"
-    )
-
-    # 6. Path Recommendations
-    add_section_header(prs, "Path-Based Recommendations", "Match Tools to Requirements")
-
-    add_table_slide(
-        prs,
-        "Recommendations by Environment",
-        ["Environment", "Rank 1", "Rank 2", "Rank 3"],
-        [
-            ["Air-Gapped/IL5+", "Tabby", "Tabnine", "Continue+Ollama"],
-            ["AWS GovCloud", "Claude Code", "Continue.dev", "Windsurf"],
-            ["Azure GovCloud", "Continue.dev", "Tabnine", "Qodo"],
-            ["FedRAMP SaaS", "Windsurf", "GitHub Copilot*", "Amazon Q*"],
-        ]
-    )
 
-    # 7. Decision Matrix
-    add_decision_matrix_slide(prs)
-
-    # 8. Next Steps
-    add_content_slide(prs, "Recommended Next Steps", [
-        "POC Deployment: Deploy Tabby or Continue.dev in non-production environment (1-3 days)",
-        "Pilot Program: 5-10 developers for 2-4 weeks with metrics collection",
-        "Security Review: Source code audit for classified deployments",
-        "Infrastructure Planning: GPU provisioning for self-hosted options",
-        "Vendor Engagement: Contact Windsurf for FedRAMP hybrid deployment timeline"
-    ])
-
-    # 9. Summary
-    add_summary_slide(prs)
-
-    # Save
-    output_path = os.path.join(os.path.dirname(__file__), "00-DESIGN-BUILD-RESEARCH.pptx")
-    prs.save(output_path)
-    print(f"Presentation saved to: {output_path}")
-    print(f"Total slides: {len(prs.slides)}")
+def main():
+    """Generate a presentation for each deck spec given (default: the Design-Build deck)"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('specs', nargs='*', type=Path, default=[DEFAULT_SPEC],
+                        help='Deck spec files (.json, .yaml) or directories containing them')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Run in the warm render daemon if one is listening (python -m deckkit.daemon)')
+    parser.add_argument('--check', action='store_true',
+                        help='Validate the specs without writing any decks')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(),
+                        help=f'Worker processes for plans of {PARALLEL_MIN_SLIDES}+ slides (default: CPU count)')
+    parser.add_argument('--verify-render', action='store_true',
+                        help='Render the written decks headlessly and diff them against their baselines '
+                             '(python -m deckkit.render_check)')
+    parser.add_argument('--compression', action='append', default=[], metavar='EXT=LEVEL',
+                        help='Deflate level (0-9) or "store" for parts with this extension, '
+                             'or "*" for the rest; repeatable (default: images stored, the rest at 6)')
+    parser.add_argument('--save-stats', action='store_true',
+                        help='Report the size and save time of each part type')
+    parser.add_argument('--trace', type=Path, default=None, metavar='PATH',
+                        help='Write a Chrome trace-event JSON of the run to PATH and print a time '
+                             'summary per span (also enabled by $DECKKIT_TRACE)')
+    args = parser.parse_args()
+    try:
+        args.compression = parse_compression(args.compression)
+    except ValueError as e:
+        parser.error(f"--compression: {e}")
+    with trace_session(args.trace):
+        _run(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTML one-pager to PowerPoint pipeline
+Times parsing, slide construction and saving on synthetic one-pagers of increasing size
+"""
+
+from bs4 import BeautifulSoup
+import argparse
+import copy
+import json
+import multiprocessing
+import platform
+import resource
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import create_pptx_from_html as converter
+from deckkit.one_pager import build_pptx_slide
+from deckkit.reproducible import deck_bytes
+
+REPO_ROOT = Path(__file__).resolve().parent
+DEFAULT_TEMPLATE = REPO_ROOT / 'ARCHIVE' / 'Harness-Efficacy' / '01-one-pager.html'
+DEFAULT_SCALES = (1, 2, 4, 8, 16, 32)
+STAGES = ('parse', 'build', 'save')
+
+
+def scale_one_pager(template_html, scale):
+    """Grow a one-pager template: scale x the overview, callouts and table rows"""
+    soup = BeautifulSoup(template_html, 'html.parser')
+
+    overview = soup.find('div', class_='overview-text')
+    if overview:
+        original = list(overview.contents)
+        for _ in range(scale - 1):
+            overview.append(' ')
+            for node in original:
+                overview.append(copy.copy(node))
+
+    callouts = soup.find_all('div', class_='callout-container')
+    if callouts:
+        anchor = callouts[-1]
+        for _ in range(scale - 1):
+            for callout in callouts:
+                clone = copy.copy(callout)
+                anchor.insert_after(clone)
+                anchor = clone
+
+    table = soup.find('table')
+    if table:
+        rows = table.find_all('tr')[1:]
+        parent = rows[-1].parent if rows else table
+        for _ in range(scale - 1):
+            for row in rows:
+                parent.append(copy.copy(row))
+
+    return str(soup)
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarise(samples):
+    """Latency statistics in milliseconds plus throughput in operations per second"""
+    mean = statistics.fmean(samples)
+    return {
+        'p50_ms': round(percentile(samples, 50) * 1000, 3),
+        'p95_ms': round(percentile(samples, 95) * 1000, 3),
+        'mean_ms': round(mean * 1000, 3),
+        'throughput_per_s': round(1 / mean, 2) if mean else None,
+    }
+
+
+def run_scale(html_path, iterations, backend):
+    """Time each pipeline stage on one synthetic one-pager (runs in a fresh process)"""
+    timings = {stage: [] for stage in STAGES}
+    output_bytes = 0
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        data = converter.parse_html_one_pager(html_path, backend)
+        parsed = time.perf_counter()
+        prs = build_pptx_slide(data)
+        built = time.perf_counter()
+        deck = deck_bytes(prs)
+        saved = time.perf_counter()
+
+        timings['parse'].append(parsed - start)
+        timings['build'].append(built - parsed)
+        timings['save'].append(saved - built)
+        output_bytes = len(deck)
+
+    total = [sum(stage) for stage in zip(*timings.values())]
+    return {
+        'input_bytes': Path(html_path).stat().st_size,
+        'output_bytes': output_bytes,
+        'stages': {stage: summarise(samples) for stage, samples in timings.items()},
+        'total': summarise(total),
+        # ru_maxrss is reported in KiB on Linux
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def git_commit():
+    """Current commit hash, or None outside a git checkout"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(template_path, scales, iterations, backend=None):
+    """Benchmark every scale, each in its own process so peak RSS is per scale"""
+    template_html = Path(template_path).read_text(encoding='utf-8')
+    backend = backend or converter.default_parser_backend()
+    results = []
+
+    ctx = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            html_path = Path(tmp) / f'scale-{scale}.html'
+            html_path.write_text(scale_one_pager(template_html, scale), encoding='utf-8')
+
+            with ctx.Pool(1) as pool:
+                result = pool.apply(run_scale, (html_path, iterations, backend))
+            result['scale'] = scale
+            results.append(result)
+
+            total = result['total']
+            print(f"scale {scale:>3}: {total['p50_ms']:>8.2f} ms p50  "
+                  f"{total['p95_ms']:>8.2f} ms p95  "
+                  f"{total['throughput_per_s']:>7.1f} decks/s  "
+                  f"{result['peak_rss_kb'] / 1024:>6.1f} MiB RSS")
+
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'template': str(template_path),
+        'parser_backend': backend,
+        'iterations': iterations,
+        'results': results,
+    }
+
+
+def compare(baseline, current):
+    """Print the p50 change per scale and stage between two benchmark reports"""
+    old = {r['scale']: r for r in baseline['results']}
+    print(f"\nvs {baseline.get('commit') or 'baseline'}:")
+    for result in current['results']:
+        before = old.get(result['scale'])
+        if not before:
+            continue
+        changes = []
+        for stage in STAGES + ('total',):
+            new_ms = (result['total'] if stage == 'total' else result['stages'][stage])['p50_ms']
+            old_ms = (before['total'] if stage == 'total' else before['stages'][stage])['p50_ms']
+            changes.append(f"{stage} {(new_ms - old_ms) / old_ms * 100:+6.1f}%" if old_ms else f"{stage} n/a")
+        print(f"scale {result['scale']:>3}: " + '  '.join(changes))
+
+
+def main():
+    """Run the pipeline benchmark and write the JSON report"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--template', type=Path, default=DEFAULT_TEMPLATE,
+                        help='One-pager HTML used as the synthetic template')
+    parser.add_argument('--scales', type=int, nargs='+', default=list(DEFAULT_SCALES),
+                        help='Size multipliers for overview, callouts and table rows')
+    parser.add_argument('-i', '--iterations', type=int, default=20,
+                        help='Timed runs per scale (default: 20)')
+    parser.add_argument('--parser', choices=list(converter.PARSER_BACKENDS), default=None,
+                        help='HTML parser backend (default: fastest installed)')
+    parser.add_argument('-o', '--output', type=Path, default=Path('bench_results.json'),
+                        help='Where to write the JSON report')
+    parser.add_argument('--compare', type=Path,
+                        help='Earlier JSON report to compare p50 latencies against')
+    args = parser.parse_args()
+
+    report = run_benchmark(args.template, args.scales, args.iterations, args.parser)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to: {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(json.load(f), report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark wall-clock start-up of the deck generator scripts
+Times one-deck invocations as fresh processes, cold and handed to a warm render daemon
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmark_pptx_pipeline import DEFAULT_TEMPLATE, REPO_ROOT, git_commit, summarise
+
+CONVERTER = REPO_ROOT / 'create_pptx_from_html.py'
+GENERATE_DECK = REPO_ROOT / 'RESEARCH' / 'Agentic-SDLC' / 'Design-Build' / 'Deliverables' / 'generate_deck.py'
+DECK_SPEC = GENERATE_DECK.with_name('00-DESIGN-BUILD-DECK.json')
+
+
+def cases(root, spec):
+    """(name, argv) for every timed invocation"""
+    python = sys.executable
+    return [
+        ('interpreter', [python, '-c', 'pass']),
+        ('import converter', [python, '-c', 'import create_pptx_from_html']),
+        ('one-pager dry run', [python, CONVERTER, root, '-n']),
+        ('one-pager up to date', [python, CONVERTER, root]),
+        ('one-pager build', [python, CONVERTER, root, '-f', '-j1']),
+        ('one-pager build (daemon)', [python, CONVERTER, root, '-f', '-j1', '--daemon']),
+        ('generate_deck', [python, GENERATE_DECK, spec]),
+        ('generate_deck (daemon)', [python, GENERATE_DECK, spec, '--daemon']),
+    ]
+
+
+def time_command(argv, iterations, env):
+    """Wall-clock seconds for each run of argv as a new process"""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        subprocess.run(argv, cwd=REPO_ROOT, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def start_daemon(socket_path, env):
+    """Launch a render daemon and wait until it accepts jobs"""
+    proc = subprocess.Popen([sys.executable, '-m', 'deckkit.daemon', '--socket', socket_path],
+                            cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while not os.path.exists(socket_path):
+        if proc.poll() is not None or time.monotonic() > deadline:
+            proc.kill()
+            raise RuntimeError('render daemon failed to start')
+        time.sleep(0.05)
+    return proc
+
+
+def run_benchmark(iterations, template=DEFAULT_TEMPLATE):
+    """Time every start-up case against a scratch one-pager root and deck spec"""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / 'one-pagers'
+        (root / template.parent.name).mkdir(parents=True)
+        shutil.copy(template, root / template.parent.name / template.name)
+        spec = Path(tmp) / DECK_SPEC.name
+        shutil.copy(DECK_SPEC, spec)
+
+        socket_path = str(Path(tmp) / 'deckkit.sock')
+        env = dict(os.environ, DECKKIT_SOCKET=socket_path)
+        daemon = start_daemon(socket_path, env)
+        try:
+            for name, argv in cases(root, spec):
+                time_command(argv, 1, env)  # Warm the page cache and build the manifest
+                samples = time_command(argv, iterations, env)
+                results[name] = summarise(samples)
+                print(f"{name:<26}{results[name]['p50_ms']:>9.1f} ms p50"
+                      f"{results[name]['p95_ms']:>9.1f} ms p95")
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'iterations': iterations,
+        'results': results,
+    }
+
+
+def main():
+    """Run the start-up benchmark and write the JSON report"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-i', '--iterations', type=int, default=10,
+                        help='Timed runs per case (default: 10)')
+    parser.add_argument('-o', '--output', type=Path, default=Path('bench_startup.json'),
+                        help='Where to write the JSON report')
+    args = parser.parse_args()
+
+    report = run_benchmark(args.iterations)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,57 +4,290 @@ Create PowerPoint slides from 01-one-pager.html files
 Faithfully recreates the HTML design in a single slide PowerPoint
 """
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.dml.color import RGBColor
-from bs4 import BeautifulSoup
-import re
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+import time
+from functools import lru_cache, partial
+from html.parser import HTMLParser
 from pathlib import Path
 
+from deckkit import daemon, trace
+
+DEFAULT_ROOT = Path('/home/christopher.g.roge/REPOS/00-TOOLS-RESEARCH')
+ONE_PAGER_NAME = '01-one-pager.html'
+MANIFEST_NAME = '.one-pager-manifest.json'
+LOGO_DIR = Path(__file__).resolve().parent / 'logos'
+IO_WORKERS = 4  # Reader and writer threads each in the batch pipeline
+
+# Bump whenever parsing or slide layout changes so cached decks get rebuilt
+CONVERTER_VERSION = '5'
+
+
+# Elements that never have content, so never appear on the open-element stack
+VOID_ELEMENTS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr',
+})
+PRESERVE_WHITESPACE = frozenset({'pre', 'textarea'})
+ASCII_SPACES = ' \n\t\x0c\r'
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class _Capture:
+    """Text collected from one element until its end tag"""
+    __slots__ = ('depth', 'strings', 'on_close')
+
+    def __init__(self, depth, on_close):
+        self.depth = depth
+        self.strings = []
+        self.on_close = on_close
+
+
+class OnePagerExtractor(HTMLParser):
+    """Single-pass, event-based extractor for the one-pager layout
+
+    Produces the same data dict as the BeautifulSoup parser without building a
+    tree: each element of interest is captured as its start tag streams past
+    and finalised at its end tag, so memory is bounded by the open captures.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.data = {
+            'title': '',
+            'overview': '',
+            'overview_highlights': [],
+            'overview_highlight_spans': [],
+            'callouts': [],
+            'table_headers': [],
+            'table_content': [],
+            'footer_contact': ''
+        }
+        self._stack = []
+        self._captures = []
+        self._pending = []
+        self._seen = set()
+        self._overview = None
+        self._callout = None
+        self._in_table = False
+        self._row_index = -1
+        self._row = None
+
+    def handle_data(self, data):
+        self._pending.append(data)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        classes = []
+        for name, value in attrs:
+            if name == 'class' and value:
+                classes = value.split()
+        if tag in VOID_ELEMENTS:
+            return
+        self._stack.append(tag)
+        self._open(tag, classes)
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush()
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag not in self._stack:
+            return  # Stray end tag, ignored like BeautifulSoup does
+        depth = len(self._stack) - 1 - self._stack[::-1].index(tag)
+        del self._stack[depth:]
+        self._close_to(depth)
+
+    def close(self):
+        super().close()
+        self._flush()
+        self._close_to(0)
+
+    def _flush(self):
+        """Hand buffered text to every open capture as one string, like a DOM text node"""
+        if not self._pending:
+            return
+        text = ''.join(self._pending)
+        self._pending = []
+        if self._stack and self._stack[-1] in ('script', 'style'):
+            return
+        # Whitespace-only nodes collapse to one character, as in BeautifulSoup
+        if not text.strip(ASCII_SPACES) and not PRESERVE_WHITESPACE.intersection(self._stack):
+            text = '\n' if '\n' in text else ' '
+        for capture in self._captures:
+            if capture.strings is not None:
+                capture.strings.append(text)
+
+    def _capture(self, on_close, text=True):
+        """Call on_close(strings) when the element just opened is closed"""
+        capture = _Capture(len(self._stack), on_close)
+        if not text:
+            capture.strings = None
+        self._captures.append(capture)
+
+    def _close_to(self, depth):
+        """Finalise captures whose element was opened deeper than depth"""
+        while self._captures and self._captures[-1].depth > depth:
+            capture = self._captures.pop()
+            capture.on_close(capture.strings)
+
+    def _first(self, key):
+        """True the first time key is seen, mirroring soup.find()"""
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        return True
+
+    def _set(self, key, value):
+        self.data[key] = value
+
+    def _open(self, tag, classes):
+        data = self.data
+
+        if tag == 'h1' and self._first('h1'):
+            self._capture(lambda s: self._set('title', ''.join(s)))
+
+        elif tag == 'div' and 'overview-text' in classes and self._first('overview'):
+            self._capture(self._close_overview)
+            self._overview = self._captures[-1]
+
+        elif tag == 'span' and 'purple-highlight' in classes and self._overview is not None:
+            self._open_highlight()
+
+        elif tag == 'div' and 'callout-container' in classes:
+            self._open_callout(classes)
+
+        elif tag == 'div' and self._callout is not None and (
+                'callout-title' in classes or 'callout-content' in classes):
+            field = 'title' if 'callout-title' in classes else 'content'
+            callout = self._callout
+            if field not in callout:
+                callout[field] = ''
+                self._capture(lambda s: callout.__setitem__(field, _strip_join(s)))
+
+        elif tag == 'table' and self._first('table'):
+            self._in_table = True
+            self._capture(self._close_table, text=False)
+
+        elif self._in_table and tag == 'th':
+            self._capture(lambda s: data['table_headers'].append(''.join(s)))
+
+        elif self._in_table and tag == 'tr':
+            self._row_index += 1
+            if self._row_index > 0:  # Skip header row
+                self._row = []
+                data['table_content'].append(self._row)
+                self._capture(self._close_row, text=False)
+
+        elif self._in_table and tag == 'td' and self._row is not None:
+            row = self._row
+            self._capture(lambda s: row.append(_strip_join(s)))
+
+        elif tag == 'div' and 'footer-info' in classes and self._first('footer'):
+            self._capture(lambda s: self._set('footer_contact', _strip_join(s, ' | ')))
+
+    def _close_overview(self, strings):
+        self._overview = None
+        self.data['overview'] = ''.join(strings)
+
+    def _open_highlight(self):
+        # Offset in the overview text so far; slots are taken in document order
+        start = sum(map(len, self._overview.strings))
+        highlights, spans = self.data['overview_highlights'], self.data['overview_highlight_spans']
+        index = len(highlights)
+        highlights.append('')
+        spans.append(None)
+
+        def close(strings):
+            highlights[index] = text = ''.join(strings)
+            spans[index] = (start, start + len(text))
+
+        self._capture(close)
+
+    def _open_callout(self, classes):
+        # Get callout type from class
+        callout_type = 'default'
+        if 'critical-finding' in classes:
+            callout_type = 'critical'
+        elif 'recommendation' in classes:
+            callout_type = 'recommendation'
+        elif 'bottom-line' in classes:
+            callout_type = 'bottom-line'
 
-def hex_to_rgb(hex_color):
-    """Convert hex color to RGB tuple"""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        callout = {'type': callout_type}
+        outer, self._callout = self._callout, callout
 
+        def close(strings):
+            self._callout = outer
+            if 'title' in callout and 'content' in callout:
+                self.data['callouts'].append(callout)
 
-def remove_shadow(shape):
-    """Completely remove shadow from a shape by clearing XML elements"""
-    try:
-        # Access the shape's XML element
-        sp = shape._element
-        spPr = sp.spPr
+        self._capture(close, text=False)
+
+    def _close_row(self, strings):
+        self._row = None
 
-        # Find and remove effect list elements (which contain shadows)
-        for elem in list(spPr):
-            if 'effectLst' in str(elem.tag) or 'outerShdw' in str(elem.tag):
-                spPr.remove(elem)
-    except:
-        pass  # If XML manipulation fails, continue anyway
+    def _close_table(self, strings):
+        self._in_table = False
+        self._row = None
 
 
-def parse_html_one_pager(html_path):
-    """Parse HTML one-pager and extract content"""
+def _strip_join(strings, separator=''):
+    """Equivalent of BeautifulSoup's get_text(separator, strip=True)"""
+    return separator.join(s.strip() for s in strings if s.strip())
+
+
+def _read_html(html_path):
     with open(html_path, 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
+        return f.read()
+
+
+def parse_html_one_pager_stream(html_path, markup=None):
+    """Parse HTML one-pager in a single streaming pass and extract content"""
+    extractor = OnePagerExtractor()
+    if markup is not None:
+        extractor.feed(markup)
+    else:
+        with open(html_path, 'r', encoding='utf-8') as f:
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), ''):
+                extractor.feed(chunk)
+    extractor.close()
+    return extractor.data
+
+
+def parse_html_one_pager_soup(html_path, markup=None, features='html.parser'):
+    """Parse HTML one-pager with BeautifulSoup (reference implementation)"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(_read_html(html_path) if markup is None else markup, features)
 
     data = {
         'title': soup.find('h1').text if soup.find('h1') else '',
         'overview': '',
         'overview_highlights': [],
+        'overview_highlight_spans': [],
         'callouts': [],
         'table_headers': [],
         'table_content': [],
         'footer_contact': ''
     }
 
-    # Extract overview with highlights
+    # Extract overview with highlights and their offsets in it
     overview_div = soup.find('div', class_='overview-text')
     if overview_div:
         data['overview'] = overview_div.get_text()
-        highlights = overview_div.find_all('span', class_='purple-highlight')
-        data['overview_highlights'] = [h.text for h in highlights]
+        offset = 0
+        for node in overview_div.descendants:
+            if type(node) in overview_div.interesting_string_types:
+                offset += len(node)
+            elif node.name == 'span' and 'purple-highlight' in node.get('class', []):
+                text = node.text
+                data['overview_highlights'].append(text)
+                data['overview_highlight_spans'].append((offset, offset + len(text)))
 
     # Extract callouts
     callouts = soup.find_all('div', class_='callout-container')
@@ -99,303 +332,554 @@ def parse_html_one_pager(html_path):
     return data
 
 
-def create_pptx_slide(data, output_path, tool_name):
-    """Create PowerPoint slide from parsed data"""
-
-    # Create presentation with 16:9 aspect ratio
-    prs = Presentation()
-    prs.slide_width = Inches(13.333)  # 16:9 widescreen
-    prs.slide_height = Inches(7.5)
-
-    # Add blank slide
-    blank_layout = prs.slide_layouts[6]  # Blank layout
-    slide = prs.slides.add_slide(blank_layout)
-
-    # Color definitions
-    PURPLE_CORE = RGBColor(117, 0, 192)      # #7500c0
-    PURPLE_ACCENT = RGBColor(160, 85, 245)   # #a055f5
-    BLACK = RGBColor(0, 0, 0)
-    GRAY = RGBColor(127, 140, 141)
-    AMBER = RGBColor(217, 119, 6)            # #D97706
-    GREEN = RGBColor(16, 185, 129)           # #10B981
-
-    # Gradient colors for callouts
-    GRADIENT_AMBER_START = RGBColor(254, 243, 199)  # #FEF3C7
-    GRADIENT_GREEN_START = RGBColor(209, 250, 229)  # #D1FAE5
-    GRADIENT_PURPLE_START = RGBColor(243, 232, 255) # #F3E8FF
-
-    # Layout margins
-    MARGIN = Inches(0.5)
-    CONTENT_WIDTH = prs.slide_width - (2 * MARGIN)
-
-    y_pos = MARGIN
-
-    # Title
-    title_box = slide.shapes.add_textbox(
-        MARGIN, y_pos,
-        CONTENT_WIDTH, Inches(0.6)
-    )
-    title_frame = title_box.text_frame
-    title_frame.word_wrap = True
-    p = title_frame.paragraphs[0]
-    p.text = data['title']
-    p.font.name = 'Graphik'
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = BLACK
-
-    # Add underline manually with a shape
-    underline = slide.shapes.add_shape(
-        1,  # Rectangle
-        MARGIN, y_pos + Inches(0.55),
-        CONTENT_WIDTH, Inches(0.03)
-    )
-    underline.fill.solid()
-    underline.fill.fore_color.rgb = PURPLE_CORE
-    underline.line.fill.background()  # No outline
-
-    y_pos += Inches(0.75)
-
-    # Overview text
-    overview_box = slide.shapes.add_textbox(
-        MARGIN, y_pos,
-        CONTENT_WIDTH, Inches(0.8)
-    )
-    overview_frame = overview_box.text_frame
-    overview_frame.word_wrap = True
-    p = overview_frame.paragraphs[0]
-
-    # Add overview with purple highlights
-    overview_text = data['overview']
-    for highlight in data['overview_highlights']:
-        overview_text = overview_text.replace(highlight, f'[[{highlight}]]')
-
-    parts = re.split(r'\[\[(.*?)\]\]', overview_text)
-    for i, part in enumerate(parts):
-        if part in data['overview_highlights']:
-            run = p.add_run()
-            run.text = part
-            run.font.name = 'Graphik'
-            run.font.size = Pt(18)
-            run.font.bold = True
-            run.font.color.rgb = PURPLE_CORE
-        elif part:
-            run = p.add_run()
-            run.text = part
-            run.font.name = 'Graphik'
-            run.font.size = Pt(18)
-            run.font.bold = True
-            run.font.color.rgb = BLACK
-
-    y_pos += Inches(1.0)
-
-    # Callouts (first 2: critical finding and recommendation)
-    callout_height = Inches(0.7)
-    for callout in data['callouts'][:2]:
-        # Determine colors
-        if callout['type'] == 'critical':
-            bg_color = GRADIENT_AMBER_START
-            border_color = AMBER
-        elif callout['type'] == 'recommendation':
-            bg_color = GRADIENT_GREEN_START
-            border_color = GREEN
-        else:
-            bg_color = GRADIENT_PURPLE_START
-            border_color = PURPLE_CORE
-
-        # Background box
-        bg_box = slide.shapes.add_shape(
-            1,  # Rectangle
-            MARGIN, y_pos,
-            CONTENT_WIDTH, callout_height
-        )
-        bg_box.fill.solid()
-        bg_box.fill.fore_color.rgb = bg_color
-        bg_box.line.fill.background()  # No outline
-        remove_shadow(bg_box)  # Remove shadow completely
-
-        # Title (left side, bold)
-        title_width = Inches(2.5)
-        title_box = slide.shapes.add_textbox(
-            MARGIN + Inches(0.2), y_pos + Inches(0.15),
-            title_width, Inches(0.4)
-        )
-        tf = title_box.text_frame
-        tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.text = callout['title']
-        p.font.name = 'Graphik'
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.color.rgb = BLACK
-
-        # Content (right side)
-        content_box = slide.shapes.add_textbox(
-            MARGIN + title_width + Inches(0.3), y_pos + Inches(0.1),
-            CONTENT_WIDTH - title_width - Inches(0.5), callout_height - Inches(0.2)
-        )
-        cf = content_box.text_frame
-        cf.word_wrap = True
-        cf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        cp = cf.paragraphs[0]
-        cp.text = callout['content']
-        cp.font.name = 'Graphik'
-        cp.font.size = Pt(12)
-        cp.font.color.rgb = BLACK
-
-        y_pos += callout_height + Inches(0.15)
-
-    # Table
-    if data['table_headers'] and data['table_content']:
-        table_top = y_pos
-        num_cols = len(data['table_headers'])
-        col_width = CONTENT_WIDTH / num_cols
-
-        # Header row
-        header_height = Inches(0.5)
-        for i, header in enumerate(data['table_headers']):
-            header_box = slide.shapes.add_shape(
-                1,  # Rectangle
-                MARGIN + (i * col_width), table_top,
-                col_width, header_height
-            )
-            header_box.fill.solid()
-            header_box.fill.fore_color.rgb = PURPLE_CORE
-            header_box.line.fill.background()  # No outline
-            remove_shadow(header_box)  # Remove shadow completely
-
-            tf = header_box.text_frame
-            tf.word_wrap = True
-            tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-            p = tf.paragraphs[0]
-            p.text = header
-            p.font.name = 'Graphik'
-            p.font.size = Pt(14)
-            p.font.bold = True
-            p.font.color.rgb = RGBColor(255, 255, 255)
-            p.alignment = PP_ALIGN.LEFT
-
-        # Content row
-        content_row_height = Inches(0.9)
-        y_content = table_top + header_height
-
-        if data['table_content']:
-            for i, cell_text in enumerate(data['table_content'][0]):
-                cell_box = slide.shapes.add_textbox(
-                    MARGIN + (i * col_width) + Inches(0.1), y_content + Inches(0.1),
-                    col_width - Inches(0.2), content_row_height - Inches(0.2)
-                )
-                cf = cell_box.text_frame
-                cf.word_wrap = True
-                cf.vertical_anchor = MSO_ANCHOR.TOP
-                cp = cf.paragraphs[0]
-                cp.text = cell_text
-                cp.font.name = 'Graphik'
-                cp.font.size = Pt(11)
-                cp.font.color.rgb = BLACK
-
-        y_pos = y_content + content_row_height + Inches(0.35)
-
-    # Bottom line callout
-    if len(data['callouts']) > 2:
-        callout = data['callouts'][2]
-        bg_color = GRADIENT_GREEN_START if 'recommendation' in callout['type'] else GRADIENT_PURPLE_START
-        border_color = GREEN if 'recommendation' in callout['type'] else PURPLE_CORE
-
-        bg_box = slide.shapes.add_shape(
-            1,  # Rectangle
-            MARGIN, y_pos,
-            CONTENT_WIDTH, Inches(0.6)
-        )
-        bg_box.fill.solid()
-        bg_box.fill.fore_color.rgb = bg_color
-        bg_box.line.fill.background()  # No outline
-        remove_shadow(bg_box)  # Remove shadow completely
-
-        title_width = Inches(2.0)
-        title_box = slide.shapes.add_textbox(
-            MARGIN + Inches(0.2), y_pos + Inches(0.12),
-            title_width, Inches(0.35)
-        )
-        tf = title_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = callout['title']
-        p.font.name = 'Graphik'
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.color.rgb = BLACK
-
-        content_box = slide.shapes.add_textbox(
-            MARGIN + title_width + Inches(0.3), y_pos + Inches(0.08),
-            CONTENT_WIDTH - title_width - Inches(0.5), Inches(0.44)
-        )
-        cf = content_box.text_frame
-        cf.word_wrap = True
-        cf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        cp = cf.paragraphs[0]
-        cp.text = callout['content']
-        cp.font.name = 'Graphik'
-        cp.font.size = Pt(11)
-        cp.font.color.rgb = BLACK
-
-        y_pos += Inches(0.75)
-
-    # Footer with > symbol on left and info on right
-    footer_y = prs.slide_height - Inches(0.7)  # Adjusted to prevent bleeding below slide
-
-    # Greater than symbol (left)
-    gt_box = slide.shapes.add_textbox(
-        MARGIN, footer_y,
-        Inches(0.5), Inches(0.4)
-    )
-    gt_frame = gt_box.text_frame
-    p = gt_frame.paragraphs[0]
-    p.text = '>'
-    p.font.name = 'Graphik'
-    p.font.size = Pt(48)
-    p.font.bold = True
-    p.font.color.rgb = PURPLE_CORE
-
-    # Footer info (right)
-    footer_box = slide.shapes.add_textbox(
-        prs.slide_width - Inches(4.5), footer_y,
-        Inches(4.0), Inches(0.4)
-    )
-    footer_frame = footer_box.text_frame
-    p = footer_frame.paragraphs[0]
-    p.text = data['footer_contact']
-    p.font.name = 'Graphik'
-    p.font.size = Pt(10)
-    p.font.color.rgb = GRAY
-    p.alignment = PP_ALIGN.RIGHT
-
-    # Save
-    prs.save(output_path)
-    print(f"Created: {output_path}")
+def _selectolax_string(node):
+    """Text of a text node with BeautifulSoup's whitespace collapsing applied, else None"""
+    if node.tag != '-text' or node.parent.tag in ('script', 'style'):
+        return None
+    text = node.text_content
+    if not text.strip(ASCII_SPACES):
+        ancestor = node.parent
+        while ancestor is not None and ancestor.tag not in PRESERVE_WHITESPACE:
+            ancestor = ancestor.parent
+        if ancestor is None:
+            text = '\n' if '\n' in text else ' '
+    return text
 
 
-def main():
-    """Process all 01-one-pager.html files"""
+def _selectolax_strings(node):
+    """Text nodes under node, with BeautifulSoup's whitespace collapsing applied"""
+    strings = (_selectolax_string(child) for child in node.traverse(include_text=True))
+    return [text for text in strings if text is not None]
+
+
+def parse_html_one_pager_selectolax(html_path, markup=None):
+    """Parse HTML one-pager with selectolax's lexbor engine"""
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(_read_html(html_path) if markup is None else markup)
+
+    h1 = tree.css_first('h1')
+    data = {
+        'title': ''.join(_selectolax_strings(h1)) if h1 else '',
+        'overview': '',
+        'overview_highlights': [],
+        'overview_highlight_spans': [],
+        'callouts': [],
+        'table_headers': [],
+        'table_content': [],
+        'footer_contact': ''
+    }
+
+    overview_div = tree.css_first('div.overview-text')
+    if overview_div:
+        strings = []
+        offset = 0
+        for node in overview_div.traverse(include_text=True):
+            text = _selectolax_string(node)
+            if text is not None:
+                strings.append(text)
+                offset += len(text)
+            elif node.tag == 'span' and 'purple-highlight' in (node.attributes.get('class') or '').split():
+                text = ''.join(_selectolax_strings(node))
+                data['overview_highlights'].append(text)
+                data['overview_highlight_spans'].append((offset, offset + len(text)))
+        data['overview'] = ''.join(strings)
+
+    for callout in tree.css('div.callout-container'):
+        title_elem = callout.css_first('div.callout-title')
+        content_elem = callout.css_first('div.callout-content')
+        classes = (callout.attributes.get('class') or '').split()
+
+        callout_type = 'default'
+        if 'critical-finding' in classes:
+            callout_type = 'critical'
+        elif 'recommendation' in classes:
+            callout_type = 'recommendation'
+        elif 'bottom-line' in classes:
+            callout_type = 'bottom-line'
+
+        if title_elem and content_elem:
+            data['callouts'].append({
+                'type': callout_type,
+                'title': _strip_join(_selectolax_strings(title_elem)),
+                'content': _strip_join(_selectolax_strings(content_elem))
+            })
+
+    table = tree.css_first('table')
+    if table:
+        data['table_headers'] = [''.join(_selectolax_strings(h)) for h in table.css('th')]
+        for row in table.css('tr')[1:]:  # Skip header row
+            data['table_content'].append(
+                [_strip_join(_selectolax_strings(c)) for c in row.css('td')])
+
+    footer_info = tree.css_first('div.footer-info')
+    if footer_info:
+        data['footer_contact'] = _strip_join(_selectolax_strings(footer_info), ' | ')
+
+    return data
+
+
+def _parse_html_one_pager_lxml(html_path, markup=None):
+    return parse_html_one_pager_soup(html_path, markup, features='lxml')
+
+
+# Backend name -> (parse function, module that must be importable)
+PARSER_BACKENDS = {
+    'selectolax': (parse_html_one_pager_selectolax, 'selectolax'),
+    'stream': (parse_html_one_pager_stream, None),
+    'lxml': (_parse_html_one_pager_lxml, 'lxml'),
+    'html.parser': (parse_html_one_pager_soup, None),
+}
+
+# Fastest first, ordered by `--verify-parser` timings on the ARCHIVE one-pagers:
+# selectolax 0.4, stream 1.2, lxml 3.4, html.parser 5.2 ms/file
+PARSER_PREFERENCE = ('selectolax', 'stream', 'lxml', 'html.parser')
+
+
+def available_parser_backends():
+    """Names of the parser backends whose dependencies are installed"""
+    return [
+        name for name in PARSER_PREFERENCE
+        if PARSER_BACKENDS[name][1] is None or importlib.util.find_spec(PARSER_BACKENDS[name][1])
+    ]
+
+
+@lru_cache(maxsize=None)
+def default_parser_backend():
+    """Fastest installed parser backend"""
+    return available_parser_backends()[0]
 
-    tools = [
-        ('Harness-Efficacy', 'Harness'),
-        ('CoTester-Efficacy', 'CoTester'),
-        ('Braintrust-Efficacy', 'Braintrust')
+
+@trace.traced('parse')
+def parse_html_one_pager(html_path, backend=None, markup=None):
+    """Parse HTML one-pager into a OnePager record with the given or fastest installed backend
+
+    markup, if given, is the file's already-read content.
+    """
+    from deckkit.records import OnePager
+
+    parse, _ = PARSER_BACKENDS[backend or default_parser_backend()]
+    return OnePager.from_dict(parse(html_path, markup))
+
+
+@trace.traced('parse')
+def load_one_pager(html_path, backend=None, source=None):
+    """OnePager record for a one-pager, parsed only if its HTML is not in the parse cache
+
+    source, if given, is the file's already-read bytes.
+    """
+    from deckkit.records import load_cached
+
+    if source is None:
+        source = Path(html_path).read_bytes()
+    return load_cached(source, lambda: parse_html_one_pager(html_path, backend, source.decode('utf-8')),
+                       salt=CONVERTER_VERSION)
+
+
+def find_one_pagers(root, names=(ONE_PAGER_NAME,)):
+    """Find every one-pager HTML file with one of the given names under root, in a stable order"""
+    return sorted(path for name in names for path in Path(root).rglob(name))
+
+
+def tool_name(html_path):
+    """Tool a one-pager describes, from its <Tool>-Efficacy directory"""
+    return Path(html_path).parent.name.removesuffix('-Efficacy')
+
+
+def one_pager_logo(html_path):
+    """Cached PNG of the tool's logo, from beside the one-pager or the shared logos/ directory"""
+    from deckkit.logos import logo_png
+
+    return logo_png(tool_name(html_path), (Path(html_path).parent, LOGO_DIR))
+
+
+def one_pager_logo_hash(html_path):
+    """SHA-256 of the logo file one_pager_logo tries first, or None without one"""
+    from deckkit.logos import find_logos
+
+    sources = find_logos(tool_name(html_path), (Path(html_path).parent, LOGO_DIR))
+    return hash_file(sources[0]) if sources else None
+
+
+def convert_one_pager(html_path, backend=None, compression=None, stats=None):
+    """Parse a single one-pager and write its .pptx next to the HTML
+
+    compression and stats are passed on to deckkit.reproducible.save_deck.
+    """
+    from deckkit.one_pager import create_pptx_slide
+
+    html_path = Path(html_path)
+    output_path = html_path.with_suffix('.pptx')
+    data = load_one_pager(html_path, backend)
+    create_pptx_slide(data, output_path, tool_name(html_path), one_pager_logo(html_path),
+                      compression, stats)
+    return output_path
+
+
+_PRINT_LOCK = threading.Lock()
+
+
+def _read_one_pager(html_path):
+    """Pipeline I/O stage: html path -> (html path, HTML bytes)"""
+    return html_path, html_path.read_bytes()
+
+
+def _build_one_pager(item, backend=None, compression=None):
+    """Pipeline CPU stage: (html path, HTML bytes) -> (html path, deck bytes, part stats)"""
+    from deckkit.one_pager import build_pptx_slide
+    from deckkit.reproducible import deck_bytes
+
+    html_path, source = item
+    data = load_one_pager(html_path, backend, source)
+    stats = []
+    deck = deck_bytes(build_pptx_slide(data, one_pager_logo(html_path)), compression, stats)
+    return html_path, deck, stats
+
+
+def _write_one_pager(item):
+    """Pipeline I/O stage: (html path, deck bytes, part stats) -> (html path, output path, written, part stats)"""
+    from deckkit.reproducible import write_if_changed
+
+    html_path, deck, stats = item
+    output_path = html_path.with_suffix('.pptx')
+    written = write_if_changed(output_path, deck)
+    with _PRINT_LOCK:  # Whole lines from concurrent writers
+        print(f"{'Created' if written else 'Unchanged'}: {output_path}")
+    return html_path, output_path, written, stats
+
+
+def convert_batch(html_paths, workers=None, backend=None, compression=None, stats=None,
+                  io_workers=IO_WORKERS, queue_depth=None, report=False):
+    """Convert one-pagers in a read -> build -> write pipeline, returning (created, unchanged, failed)
+
+    created lists the (html path, output path) pairs of the decks written and
+    unchanged those of the decks whose file already held the same bytes.
+
+    Reads and writes run on io_workers threads each and parsing and building
+    on workers processes, with at most queue_depth (default: twice workers)
+    one-pagers waiting between stages. A list passed as stats receives the
+    part stats of every deck saved; report prints the pipeline's stage stats.
+    """
+    from deckkit import pipeline
+
+    workers = workers or os.cpu_count()
+    stages = [
+        pipeline.Stage('read', _read_one_pager, io_workers),
+        pipeline.Stage('build', partial(_build_one_pager, backend=backend, compression=compression),
+                       workers, processes=True),
+        pipeline.Stage('write', _write_one_pager, io_workers),
     ]
+    results, failed, stage_stats, wall = pipeline.run_pipeline(
+        [Path(p) for p in html_paths], stages, queue_depth or 2 * workers)
+
+    created, unchanged = [], []
+    for html_path, output_path, written, deck_stats in results:
+        (created if written else unchanged).append((html_path, output_path))
+        if stats is not None:
+            stats.extend(deck_stats)
+    if report:
+        print('\n'.join(pipeline.format_stats(stage_stats, wall)))
+    return created, unchanged, failed
+
+
+def parse_batch(html_paths, workers=None, backend=None):
+    """Parse one-pagers across a process pool, returning OnePager records in input order
+
+    Records come from the parse cache when the HTML is unchanged.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if workers == 1 or len(html_paths) <= 1:
+        return [load_one_pager(p, backend) for p in html_paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(load_one_pager, html_paths, [backend] * len(html_paths),
+                             chunksize=max(1, len(html_paths) // (4 * (workers or os.cpu_count())))))
 
-    for folder, tool_name in tools:
-        html_path = Path(f'/home/christopher.g.roge/REPOS/00-TOOLS-RESEARCH/{folder}/01-one-pager.html')
-        output_path = Path(f'/home/christopher.g.roge/REPOS/00-TOOLS-RESEARCH/{folder}/01-one-pager.pptx')
 
-        if html_path.exists():
-            print(f"\nProcessing {tool_name}...")
-            data = parse_html_one_pager(html_path)
-            create_pptx_slide(data, output_path, tool_name)
-        else:
-            print(f"Warning: {html_path} not found")
+def create_combined_deck(html_paths, output_path, workers=None, backend=None, index=False,
+                         compression=None, stats=None):
+    """Write every one-pager as a slide of a single presentation, saved once"""
+    from deckkit.one_pager import build_combined_deck
+    from deckkit.reproducible import save_deck
+
+    datas = parse_batch(html_paths, workers, backend)
+    logos = [one_pager_logo(html_path) for html_path in html_paths]
+    prs = build_combined_deck(datas, index=index, logos=logos)
+    written = save_deck(prs, output_path, compression, stats)
+    print(f"{'Created' if written else 'Unchanged'}: {output_path} ({len(prs.slides)} slides)")
+    return prs
+
+
+def hash_file(path):
+    """Return the SHA-256 hex digest of a file's contents"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def load_manifest(manifest_path):
+    """Load the build manifest, returning an empty one if missing or unreadable"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {'entries': {}}
+    manifest.setdefault('entries', {})
+    return manifest
+
+
+def save_manifest(manifest_path, manifest):
+    """Atomically write the build manifest"""
+    from deckkit.cache import atomic_write_bytes
+
+    atomic_write_bytes(manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode())
+
+
+def plan_rebuild(html_paths, root, manifest, force=False):
+    """Split one-pagers into (stale, hashes): those needing a rebuild and every input hash
+
+    The inputs of a deck are its one-pager and its logo, so hashes maps each
+    one-pager to {'hash': ..., 'logo': ...} and a changed or added logo makes
+    the deck stale too.
+    """
+    stale, hashes = [], {}
+    for html_path in html_paths:
+        key = html_path.relative_to(root).as_posix()
+        hashes[key] = {'hash': hash_file(html_path), 'logo': one_pager_logo_hash(html_path)}
+        entry = manifest['entries'].get(key)
+        if (force or entry is None
+                or entry.get('hash') != hashes[key]['hash']
+                or entry.get('logo') != hashes[key]['logo']
+                or entry.get('converter_version') != CONVERTER_VERSION
+                or not (root / entry.get('output', '')).is_file()):
+            stale.append(html_path)
+    return stale, hashes
+
+
+def record_builds(manifest, root, built, hashes):
+    """Point the manifest entries of freshly built decks, (html path, output path) pairs, at their input hashes"""
+    for html_path, output_path in built:
+        key = html_path.relative_to(root).as_posix()
+        manifest['entries'][key] = {
+            **hashes[key],
+            'converter_version': CONVERTER_VERSION,
+            'output': output_path.relative_to(root).as_posix(),
+        }
+
+
+def verify_renders(pptx_paths, workers=None):
+    """Check decks against their render baselines, exiting non-zero on a regression"""
+    from deckkit.render_check import RenderError, verify_renders as check
+
+    try:
+        ok = check(pptx_paths, workers=workers)
+    except RenderError as e:
+        raise SystemExit(f"Error: {e}")
+    if not ok:
+        raise SystemExit(1)
+
+
+def watch_one_pagers(root, names=(ONE_PAGER_NAME,), backend=None):
+    """Rebuild the deck next to each one-pager whenever it is saved, until interrupted"""
+    from deckkit.one_pager import slide_template
+    from deckkit.watch import watch
+
+    # Pay for parser selection and template compilation before the first edit
+    backend = backend or default_parser_backend()
+    slide_template()
+
+    manifest_path = root / MANIFEST_NAME
+    print(f"Watching {root} for {', '.join(names)} changes (Ctrl+C to stop)...")
+    for html_paths in watch(root, names):
+        manifest = load_manifest(manifest_path)
+        # Saves that leave the content unchanged are skipped by the hash check
+        stale, hashes = plan_rebuild(html_paths, root, manifest)
+        for html_path in stale:
+            start = time.perf_counter()
+            try:
+                output_path = convert_one_pager(html_path, backend)
+            except Exception as e:
+                print(f"Error: {html_path.relative_to(root)}: {e}")
+                continue
+            record_builds(manifest, root, [(html_path, output_path)], hashes)
+            print(f"✓ {output_path.relative_to(root)} "
+                  f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+        if stale:
+            save_manifest(manifest_path, manifest)
+
+
+def verify_parser(html_paths, repeat=5):
+    """Run every installed backend against the html.parser reference
+
+    Returns (backend, mismatches, ms_per_file) rows, where mismatches lists
+    (html_path, fields) for each one-pager whose data dict differs.
+    """
+    expected = {p: parse_html_one_pager_soup(p) for p in html_paths}
+    rows = []
+    for backend in available_parser_backends():
+        parse, _ = PARSER_BACKENDS[backend]
+        mismatches = []
+        for html_path in html_paths:
+            actual = parse(html_path)
+            fields = [key for key in expected[html_path] if expected[html_path][key] != actual.get(key)]
+            if fields:
+                mismatches.append((html_path, fields))
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for html_path in html_paths:
+                parse(html_path)
+        ms_per_file = (time.perf_counter() - start) * 1000 / (repeat * len(html_paths))
+        rows.append((backend, mismatches, ms_per_file))
+    return rows
+
+
+def _run(args):
+    """Carry out the run main() parsed and validated the arguments for"""
+    from deckkit.package_writer import format_stats
+
+    root = args.root.resolve()
+    compression = args.compression
+    save_stats = [] if args.save_stats else None
+
+    if args.watch:
+        try:
+            watch_one_pagers(root, args.names, args.parser)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    html_paths = find_one_pagers(root, args.names)
+    if not html_paths:
+        print(f"Warning: no {', '.join(args.names)} files found under {root}")
+        return
+
+    if args.verify_parser:
+        rows = verify_parser(html_paths)
+        print(f"{'Backend':<14}{'ms/file':>10}  Identical")
+        for backend, mismatches, ms_per_file in rows:
+            print(f"{backend:<14}{ms_per_file:>10.2f}  {len(html_paths) - len(mismatches)}/{len(html_paths)}")
+        for backend, mismatches, _ in rows:
+            for html_path, fields in mismatches:
+                print(f"Mismatch ({backend}): {html_path.relative_to(root)}: {', '.join(fields)}")
+        raise SystemExit(1 if any(mismatches for _, mismatches, _ in rows) else 0)
+
+    if args.combined:
+        if args.dry_run:
+            for html_path in html_paths:
+                print(html_path.relative_to(root))
+            print(f"\n{len(html_paths)} one-pagers would be combined into {args.combined}")
+            return
+        create_combined_deck(html_paths, args.combined, args.workers, args.parser, args.index,
+                             compression, save_stats)
+        if save_stats is not None:
+            print('\n'.join(format_stats(save_stats)))
+        if args.verify_render:
+            verify_renders([args.combined], args.workers)
+        return
+
+    manifest_path = root / MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+    stale, hashes = plan_rebuild(html_paths, root, manifest, force=args.force)
+
+    if args.dry_run:
+        for html_path in stale:
+            print(html_path.relative_to(root))
+        print(f"\n{len(stale)} of {len(html_paths)} one-pagers would be rebuilt")
+        return
+
+    if not stale:
+        print(f"✓ All {len(html_paths)} PowerPoint decks are up to date")
+        if args.verify_render:
+            verify_renders([p.with_suffix('.pptx') for p in html_paths], args.workers)
+        return
+
+    print(f"Converting {len(stale)} of {len(html_paths)} one-pagers with {args.workers} workers...")
+    created, unchanged, failed = convert_batch(stale, args.workers, args.parser, compression, save_stats,
+                                               args.io_workers, args.queue_depth, args.pipeline_stats)
+
+    # Record only successful builds; drop entries whose HTML no longer exists
+    manifest['entries'] = {key: entry for key, entry in manifest['entries'].items() if (root / key).is_file()}
+    record_builds(manifest, root, created + unchanged, hashes)
+    save_manifest(manifest_path, manifest)
+
+    for html_path, error in failed:
+        print(f"Error: {html_path}: {error}")
+
+    if failed:
+        print(f"\n✗ {len(failed)} of {len(html_paths)} one-pagers failed")
+        raise SystemExit(1)
+
+    if unchanged:
+        print(f"\n✓ {len(created)} PowerPoint decks created, {len(unchanged)} unchanged")
+    else:
+        print(f"\n✓ All {len(created)} PowerPoint decks created!")
+    if save_stats is not None:
+        print(f"Save stats for {len(created) + len(unchanged)} decks:")
+        print('\n'.join(format_stats(save_stats, top=0)))
+
+    if args.verify_render:
+        verify_renders([p.with_suffix('.pptx') for p in html_paths], args.workers)
+
+
+def main():
+    """Process every 01-one-pager.html under the research root, once or in watch mode"""
+    from deckkit.package_writer import parse_compression
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('root', nargs='?', type=Path, default=DEFAULT_ROOT,
+                        help='Directory searched recursively for one-pagers')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(),
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--name', nargs='+', default=[ONE_PAGER_NAME], dest='names',
+                        help=f'One-pager file names to look for (default: {ONE_PAGER_NAME})')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='Rebuild every deck, ignoring the build manifest')
+    parser.add_argument('-n', '--dry-run', action='store_true',
+                        help='List the one-pagers that would be rebuilt and exit')
+    parser.add_argument('--parser', choices=list(PARSER_BACKENDS), default=None,
+                        help='HTML parser backend (default: fastest installed)')
+    parser.add_argument('--combined', type=Path, metavar='OUTPUT',
+                        help='Write all one-pagers as slides of one deck instead (ignores the manifest)')
+    parser.add_argument('--index', action='store_true',
+                        help='With --combined, lead the deck with index slides')
+    parser.add_argument('--verify-parser', action='store_true',
+                        help='Check and time every installed parser backend against html.parser, then exit')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Run in the warm render daemon if one is listening (python -m deckkit.daemon)')
+    parser.add_argument('-w', '--watch', action='store_true',
+                        help='Stay running and rebuild each deck when its one-pager is saved')
+    parser.add_argument('--verify-render', action='store_true',
+                        help='Afterwards, render every deck headlessly and diff it against its baselines '
+                             '(python -m deckkit.render_check)')
+    parser.add_argument('--compression', action='append', default=[], metavar='EXT=LEVEL',
+                        help='Deflate level (0-9) or "store" for parts with this extension, '
+                             'or "*" for the rest; repeatable (default: images stored, the rest at 6)')
+    parser.add_argument('--save-stats', action='store_true',
+                        help='Report the size and save time of each part type across the decks written')
+    parser.add_argument('--io-workers', type=int, default=IO_WORKERS,
+                        help=f'Reader and writer threads each (default: {IO_WORKERS})')
+    parser.add_argument('--queue-depth', type=int, default=None,
+                        help='One-pagers allowed to wait between pipeline stages (default: 2 x workers)')
+    parser.add_argument('--pipeline-stats', action='store_true',
+                        help='Report per-stage utilisation and queue depths of the batch pipeline')
+    parser.add_argument('--trace', type=Path, default=None, metavar='PATH',
+                        help='Write a Chrome trace-event JSON of the run to PATH and print a time '
+                             'summary per span (also enabled by $DECKKIT_TRACE)')
+    args = parser.parse_args()
+
+    try:
+        args.compression = parse_compression(args.compression)
+    except ValueError as e:
+        parser.error(f"--compression: {e}")
+    if args.parser and args.parser not in available_parser_backends():
+        parser.error(f"parser backend '{args.parser}' is not installed")
+    if args.index and not args.combined:
+        parser.error("--index requires --combined")
 
-    print("\n✓ All PowerPoint decks created!")
+    with trace.session(args.trace):
+        _run(args)
 
 
 if __name__ == '__main__':
+    daemon.hand_off(__file__)
     main()
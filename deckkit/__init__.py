@@ -0,0 +1,4 @@
+"""
+Shared helpers for the python-pptx deck generators
+Used by create_pptx_from_html.py and the per-project generate_deck.py scripts
+"""
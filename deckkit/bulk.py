@@ -0,0 +1,163 @@
+"""
+Bulk shape emission for slides with many shapes
+
+Every python-pptx `add_shape` / `add_textbox` call scans all `@id` values
+in the slide for the next shape id, builds the element from scratch and
+wraps it in a proxy whose property setters rewrite the XML one attribute at
+a time. For a slide of n shapes that is O(n²) id scanning plus the churn.
+
+A ShapeBatch instead deep-copies prototype elements built once with
+python-pptx, allocates shape ids from a single scan, and adds the whole
+batch to the shape tree in one lxml operation, so emission is linear in the
+number of shapes. Ids, names and XML are identical to what the equivalent
+python-pptx calls produce. `fill_table` does the same for table cells,
+cloning pre-styled `a:tc` prototypes instead of styling cell by cell.
+"""
+
+import copy
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _scratch_shapes():
+    """Shapes of a throwaway blank slide that prototypes are built on"""
+    from pptx import Presentation
+
+    prs = Presentation()
+    return prs.slides.add_slide(prs.slide_layouts[6]).shapes
+
+
+def shape_prototype(build):
+    """Detached shape element built by build(shapes) with python-pptx
+
+    build adds one shape to the given shapes and returns it, giving text
+    frames a placeholder first paragraph that carries the wanted style.
+    """
+    elm = build(_scratch_shapes())._element
+    elm.getparent().remove(elm)
+    return elm
+
+
+def cell_prototype(build):
+    """Detached a:tc element styled by build(cell) on a one-cell python-pptx table"""
+    from pptx.util import Inches
+
+    shapes = _scratch_shapes()
+    frame = shapes.add_table(1, 1, 0, 0, Inches(1), Inches(1))
+    cell = frame.table.cell(0, 0)
+    build(cell)
+    tc = copy.deepcopy(cell._tc)
+    frame._element.getparent().remove(frame._element)
+    return tc
+
+
+def set_paragraph_text(elm, text):
+    """Replace the text of a shape's first paragraph, as `paragraph.text = text` does"""
+    p = elm.txBody.p_lst[0]
+    for child in p.content_children:
+        p.remove(child)
+    p.append_text(text)
+
+
+def set_frame_text(elm, text):
+    """Replace the text of a shape or cell, as `text_frame.text = text` does
+
+    Each line becomes a paragraph carrying the prototype's first-paragraph
+    properties, which is what styling every paragraph after setting the
+    text gives.
+    """
+    tx_body = elm.txBody
+    paragraphs = tx_body.p_lst
+    template = paragraphs[0]
+    for p in paragraphs:
+        tx_body.remove(p)
+    for line in text.split('\n'):
+        p = copy.deepcopy(template)
+        for child in p.content_children:
+            p.remove(child)
+        p.append_text(line)
+        tx_body.append(p)
+
+
+def set_fill(elm, color):
+    """Set the solid fill colour of a cloned shape"""
+    elm.spPr.xpath('./a:solidFill/a:srgbClr')[0].set('val', str(color))
+
+
+def set_font_size(elm, size):
+    """Override the font size (points) of every run and paragraph default under elm"""
+    from pptx.oxml.ns import qn
+
+    sz = str(int(round(size * 100)))
+    for rpr in elm.iter(qn('a:defRPr'), qn('a:rPr')):
+        rpr.set('sz', sz)
+
+
+def renumber_shapes(sp_tree):
+    """Assign sequential ids and python-pptx style names in z-order"""
+    for index, elm in enumerate(sp_tree.iter_shape_elms(), start=1):
+        c_nv_pr = elm.xpath('./*[1]/p:cNvPr')[0]
+        c_nv_pr.set('id', str(index + 1))
+        c_nv_pr.set('name', f"{c_nv_pr.get('name').rsplit(' ', 1)[0]} {index}")
+
+
+class ShapeBatch:
+    """Shapes cloned from prototypes and added to a slide in one operation
+
+        with ShapeBatch(slide) as batch:
+            for row in rows:
+                batch.add(NEED_BOX, x, y, cx, cy, text=row.need)
+
+    Shapes are added to the slide when the block exits (or on `emit`), in
+    the order they were added to the batch.
+    """
+
+    def __init__(self, slide):
+        self._sp_tree = slide.shapes._spTree
+        # Scanned once; python-pptx rescans for every shape
+        self._next_id = self._sp_tree.max_shape_id + 1
+        self._elements = []
+
+    def add(self, prototype, x, y, cx, cy, text=None):
+        """Queue a copy of prototype at (x, y) sized (cx, cy), returning its element"""
+        elm = copy.deepcopy(prototype)
+        c_nv_pr = elm.xpath('./*[1]/p:cNvPr')[0]
+        c_nv_pr.set('id', str(self._next_id))
+        c_nv_pr.set('name', f"{c_nv_pr.get('name').rsplit(' ', 1)[0]} {self._next_id - 1}")
+        self._next_id += 1
+        elm.x, elm.y, elm.cx, elm.cy = int(x), int(y), int(cx), int(cy)
+        if text is not None:
+            set_paragraph_text(elm, text)
+        self._elements.append(elm)
+        return elm
+
+    def emit(self):
+        """Add the queued shapes to the slide"""
+        successor = self._sp_tree.first_child_found_in('p:extLst')
+        if successor is None:
+            self._sp_tree.extend(self._elements)
+        else:
+            for elm in self._elements:
+                successor.addprevious(elm)
+        self._elements = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.emit()
+
+
+def fill_table(table, cells):
+    """Replace table cells with text-filled copies of cell prototypes
+
+    cells yields (row index, column index, prototype a:tc, text); cells not
+    mentioned keep their content.
+    """
+    tr_lst = table._tbl.tr_lst
+    for row_idx, col_idx, prototype, text in cells:
+        tc = copy.deepcopy(prototype)
+        set_frame_text(tc, text)
+        tr = tr_lst[row_idx]
+        tr.replace(tr.tc_lst[col_idx], tc)
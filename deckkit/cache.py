@@ -0,0 +1,39 @@
+"""
+Cache directories and atomic file writes
+
+Every on-disk cache (parsed records, logos, text metrics, renders) lives in
+a directory named by an environment variable, else deckkit/<name> under the
+user cache directory ($XDG_CACHE_HOME, else ~/.cache).
+
+Cache entries, decks, manifests and traces are written to a temporary file
+beside the target and renamed over it, so a reader never sees a partly
+written file and concurrent writers of the same entry cannot interleave.
+"""
+
+import os
+from pathlib import Path
+
+
+def cache_dir(env_var, name):
+    """$env_var, else deckkit/<name> under the user cache directory"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(os.environ.get(env_var) or Path(cache_home) / 'deckkit' / name)
+
+
+def temp_path(path):
+    """Hidden per-process temporary file beside path, to be renamed over it"""
+    path = Path(path)
+    return path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+
+
+def atomic_write_bytes(path, data):
+    """Write data to path atomically, creating its directory if needed"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = temp_path(path)
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,206 @@
+"""
+Persistent render daemon for the deck generator scripts
+
+Importing python-pptx and compiling the slide templates costs more than
+rendering a single deck. `python -m deckkit.daemon` pays for that once: it
+listens on a Unix socket and runs the `main()` of create_pptx_from_html.py or
+a generate_deck.py in-process, with the client's arguments and working
+directory. The scripts hand their job over when run with --daemon (see
+`hand_off`) and render locally when no daemon is listening.
+
+Scripts are reloaded when their file changes; restart the daemon after
+changing deckkit itself. Output printed by worker processes (e.g. batch
+conversions with -j > 1) goes to the daemon's terminal, not the client's.
+"""
+
+import argparse
+import contextlib
+import importlib
+import importlib.util
+import io
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+# Imported and warmed before the first job
+WARM_MODULES = ('pptx', 'deckkit.styles', 'deckkit.one_pager')
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon cannot safely listen on its socket"""
+
+
+def socket_path():
+    """Daemon socket: $DECKKIT_SOCKET, else a per-user socket in the runtime directory
+
+    Without $XDG_RUNTIME_DIR the socket goes in a deckkit-<uid> directory
+    under the temporary directory, which the daemon creates private to the
+    user rather than putting the socket straight into a world-writable /tmp.
+    """
+    if os.environ.get('DECKKIT_SOCKET'):
+        return os.environ['DECKKIT_SOCKET']
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, f'deckkit-{os.getuid()}.sock')
+    return os.path.join(tempfile.gettempdir(), f'deckkit-{os.getuid()}', 'daemon.sock')
+
+
+def submit(script, argv, cwd=None, path=None):
+    """Run script's main() with argv in the daemon, returning its status and output"""
+    request = {'script': os.path.abspath(script), 'argv': list(argv), 'cwd': cwd or os.getcwd()}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path or socket_path())
+        sock.sendall(json.dumps(request).encode() + b'\n')
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile('rb') as f:
+            return json.loads(f.read())
+
+
+def hand_off(script):
+    """With --daemon on the command line, run this invocation in the daemon and exit
+
+    Returns (with --daemon removed from sys.argv) when no daemon is listening,
+    so the caller falls back to rendering locally.
+    """
+    if '--daemon' not in sys.argv[1:]:
+        return
+    sys.argv = [arg for arg in sys.argv if arg != '--daemon']
+    try:
+        response = submit(script, sys.argv[1:])
+    except OSError:
+        print("Render daemon not running (start it with: python -m deckkit.daemon); "
+              "rendering locally", file=sys.stderr)
+        return
+    sys.stdout.write(response['stdout'])
+    sys.stderr.write(response['stderr'])
+    sys.exit(response['status'])
+
+
+class RenderDaemon:
+    """Sequential job server keeping script modules and their caches warm"""
+
+    def __init__(self, path=None):
+        self.path = path or socket_path()
+        self._scripts = {}  # path -> (mtime_ns, module)
+
+    def load(self, script):
+        """Import a script by path, reusing the module until the file changes"""
+        mtime = os.stat(script).st_mtime_ns
+        cached = self._scripts.get(script)
+        if cached and cached[0] == mtime:
+            module = cached[1]
+        else:
+            spec = importlib.util.spec_from_file_location(Path(script).stem, script)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module.__name__] = module
+            spec.loader.exec_module(module)
+            self._scripts[script] = (mtime, module)
+        # Process pools pickle functions by module name, so it must resolve to this script
+        sys.modules[module.__name__] = module
+        return module
+
+    def run(self, request):
+        """Run one job, capturing its output and exit status"""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        status = 0
+        saved_argv, saved_cwd = sys.argv, os.getcwd()
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    os.chdir(request['cwd'])
+                    module = self.load(request['script'])
+                    sys.argv = [request['script']] + request['argv']
+                    module.main()
+                except SystemExit as e:
+                    if isinstance(e.code, str):
+                        print(e.code, file=sys.stderr)
+                    status = e.code if isinstance(e.code, int) else int(e.code is not None)
+                except Exception:
+                    traceback.print_exc()
+                    status = 1
+        finally:
+            sys.argv = saved_argv
+            os.chdir(saved_cwd)
+        return {'status': status, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+    def warm(self):
+        for name in WARM_MODULES:
+            importlib.import_module(name)
+        from deckkit.one_pager import slide_template
+        from deckkit.textmetrics import font_metrics
+        slide_template()
+        for bold in (False, True):
+            font_metrics('Graphik', bold)
+
+    def _prepare_path(self):
+        """Make the socket's directory if needed and clear a stale socket of ours from the path
+
+        Refuses a directory owned by another user, and any existing file that
+        is not a socket owned by this user.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if os.stat(directory).st_uid not in (os.getuid(), 0):
+            raise DaemonError(f"{directory} is owned by another user")
+        try:
+            existing = os.lstat(self.path)
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(existing.st_mode) or existing.st_uid != os.getuid():
+            raise DaemonError(f"{self.path} exists and is not a socket of this user; not replacing it")
+        os.unlink(self.path)
+
+    def serve_forever(self):
+        self.warm()
+        self._prepare_path()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            # Created 0600 from the start: chmod after bind would leave a window
+            # in which another local user could connect and submit jobs
+            umask = os.umask(0o077)
+            try:
+                server.bind(self.path)
+            finally:
+                os.umask(umask)
+            server.listen()
+            print(f"Render daemon listening on {self.path} (Ctrl+C to stop)")
+            try:
+                while True:
+                    conn, _ = server.accept()
+                    try:
+                        with conn, conn.makefile('rwb') as f:
+                            request = json.loads(f.readline())
+                            response = self.run(request)
+                            f.write(json.dumps(response).encode())
+                            f.flush()
+                    except (OSError, ValueError, KeyError):
+                        continue  # Malformed request or client gone
+                    print(f"[{response['status']}] {Path(request['script']).name} "
+                          f"{' '.join(request['argv'])}")
+            finally:
+                os.unlink(self.path)
+
+
+def main():
+    """Start the render daemon"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--socket', default=None,
+                        help=f'Unix socket path (default: $DECKKIT_SOCKET or {socket_path()})')
+    args = parser.parse_args()
+    # Unwind on SIGTERM too, so the socket file is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        RenderDaemon(args.socket).serve_forever()
+    except DaemonError as e:
+        raise SystemExit(f"Error: {e}")
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Slide fragments: slides built in one presentation and merged into another
+
+Lets independent slides be rendered in worker processes. A fragment is a
+picklable copy of one slide: its XML, the index of its slide layout, and
+the images and external links it refers to. `append_fragment` adds it to
+a presentation as a new slide. Images are re-added through python-pptx,
+so an image used on several slides is still stored once, and the
+relationship ids in the XML are rewritten to the new ones.
+
+Shape ids are scoped to their slide and carry over unchanged. Appending
+the same fragments in the same order therefore gives the same package as
+building the slides there directly, whichever process built each one.
+"""
+
+import io
+
+from lxml import etree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+
+from deckkit.trace import traced
+
+R_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+
+def _rid_order(rId):
+    """Sort key putting rId10 after rId9"""
+    return (len(rId), rId)
+
+
+@traced('merge')
+def export_fragments(prs):
+    """[(slide XML, layout index, relationships)] for every slide of prs"""
+    fragments = []
+    for slide in prs.slides:
+        rels = []
+        for rId in sorted(slide.part.rels.keys(), key=_rid_order):
+            rel = slide.part.rels[rId]
+            if rel.reltype == RT.SLIDE_LAYOUT:
+                continue  # Recreated by add_slide
+            if rel.is_external:
+                rels.append((rId, rel.reltype, rel.target_ref, True))
+            elif rel.reltype == RT.IMAGE:
+                rels.append((rId, rel.reltype, rel.target_part.blob, False))
+            else:
+                raise ValueError(f"slide {prs.slides.index(slide) + 1}: cannot export a "
+                                 f"relationship of type {rel.reltype.rsplit('/', 1)[-1]}")
+        layout_index = prs.slide_layouts.index(slide.slide_layout)
+        fragments.append((etree.tostring(slide._element), layout_index, rels))
+    return fragments
+
+
+@traced('merge')
+def append_fragment(prs, fragment):
+    """Add an exported slide to prs, returning the new slide"""
+    xml, layout_index, rels = fragment
+    slide = prs.slides.add_slide(prs.slide_layouts[layout_index])
+    part = slide.part
+
+    rid_map = {}
+    for rId, reltype, target, is_external in rels:
+        if is_external:
+            rid_map[rId] = part.relate_to(target, reltype, is_external=True)
+        else:
+            _, rid_map[rId] = part.get_or_add_image_part(io.BytesIO(target))
+
+    # Take over the fragment's content in place, so the Slide object stays valid
+    sld = slide._element
+    source = parse_xml(xml)
+    for elm in source.iter():
+        for name, value in elm.attrib.items():
+            if name.startswith(R_NS) and value in rid_map:
+                elm.set(name, rid_map[value])
+    for child in list(sld):
+        sld.remove(child)
+    sld.attrib.clear()
+    sld.attrib.update(source.attrib)
+    sld.extend(list(source))
+    return slide
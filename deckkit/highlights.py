@@ -0,0 +1,107 @@
+"""
+Highlight segmentation: splitting text into plain and highlighted runs
+
+`segments` turns a text and its highlight spans, as (start, end) offsets,
+into ordered (text, highlighted) runs in one pass. The parsers record the
+spans of the overview's purple highlights straight from the DOM, so only the
+marked occurrence of a phrase is highlighted, and overlapping or nested
+spans merge instead of being marked twice.
+
+Text that comes with phrases but no offsets goes through a PhraseMatcher,
+an Aho-Corasick automaton that finds every occurrence of every phrase in a
+single scan of the text, whatever the number of phrases. The same pair
+works for any styled span: bold or emphasis in callouts and table cells
+needs only the spans, or the phrases, of its text.
+"""
+
+from collections import deque
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton over a set of phrases
+
+    Building is linear in the total length of the phrases and matching is
+    linear in the length of the text plus the number of matches.
+    """
+
+    def __init__(self, phrases):
+        self._goto = [{}]     # State -> {character: next state}
+        self._fail = [0]      # State -> longest proper suffix that is also a state
+        self._out = [()]      # State -> lengths of the phrases ending in this state
+        for phrase in dict.fromkeys(phrases):
+            if not phrase:
+                continue
+            state = 0
+            for ch in phrase:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                    self._goto[state][ch] = nxt
+                state = nxt
+            self._out[state] += (len(phrase),)
+
+        # Failure links breadth first, so a state's suffix is finished before it
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def find_all(self, text):
+        """Yield (start, end) of every phrase occurrence, overlapping ones included, by end"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length in out[state]:
+                yield i + 1 - length, i + 1
+
+    def spans(self, text):
+        """Non-overlapping occurrences, leftmost first and longest at each start, in order"""
+        longest = [0] * (len(text) + 1)  # Start -> end of the longest match there
+        for start, end in self.find_all(text):
+            longest[start] = max(longest[start], end)
+        spans = []
+        pos = 0
+        for start, end in enumerate(longest):
+            if end and start >= pos:
+                spans.append((start, end))
+                pos = end
+        return spans
+
+
+def segments(text, spans):
+    """Yield (run text, highlighted) covering text, given highlight spans ordered by start
+
+    Spans overlapping an earlier one are clipped to the text after it; empty
+    runs are skipped.
+    """
+    pos = 0
+    for start, end in spans:
+        start = max(start, pos)
+        end = min(end, len(text))
+        if end <= start:
+            continue
+        if start > pos:
+            yield text[pos:start], False
+        yield text[start:end], True
+        pos = end
+    if pos < len(text):
+        yield text[pos:], False
+
+
+def highlight_segments(text, spans=None, phrases=()):
+    """Runs of text highlighted by spans, or, without spans, by every occurrence of phrases"""
+    if spans is None:
+        spans = PhraseMatcher(phrases).spans(text)
+    return segments(text, spans)
@@ -0,0 +1,185 @@
+"""
+Content-addressed logo cache for deck embedding
+
+Tool logos come as SVG, PNG, AVIF, WebP or JPEG. python-pptx embeds only
+raster images, so each logo is rasterised and normalised once: transparent
+borders trimmed, scaled down to at most LOGO_HEIGHT_PX and reduced to a
+256-colour palette. The result is stored as a PNG
+named by the SHA-256 of the source bytes and the normalisation settings.
+Repeated builds reuse the cached bytes. Because identical bytes are embedded
+every time, python-pptx stores each logo once per presentation however many
+slides show it.
+
+Raster formats are handled by Pillow. SVG needs cairosvg, or the
+`rsvg-convert` command from librsvg. Without either, SVG logos are skipped.
+"""
+
+import hashlib
+import io
+import re
+import shutil
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+
+from deckkit import cache
+
+LOGO_HEIGHT_PX = 256
+# Bump when the normalisation changes so cached PNGs are regenerated
+LOGO_CACHE_VERSION = '1'
+LOGO_EXTENSIONS = ('.svg', '.png', '.avif', '.webp', '.jpg', '.jpeg')
+
+
+class LogoError(ValueError):
+    """Raised when a logo cannot be rasterised"""
+
+
+def slugify(name):
+    """'Continue.dev' -> 'continue-dev', matching the logo file naming"""
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def find_logos(name, search_dirs):
+    """Logo files for a tool name, best first
+
+    Looks in each directory in turn for <slug>.<ext> or <slug>-<hash>.<ext>, as
+    written by the logo fetcher, preferring SVG. Matches on the first word of
+    the name ('continue' for 'Continue.dev') rank after full-name matches.
+    """
+    slug = slugify(name)
+    slugs = [slug] + ([slug.split('-')[0]] if '-' in slug else [])
+    found = []
+    for candidate in slugs:
+        pattern = re.compile(rf'{re.escape(candidate)}(-[0-9a-f]{{6}})?')
+        for directory in search_dirs:
+            try:
+                files = sorted(Path(directory).iterdir())
+            except OSError:
+                continue
+            found.extend(sorted(
+                (f for f in files
+                 if f.suffix.lower() in LOGO_EXTENSIONS and pattern.fullmatch(f.stem.lower())),
+                key=lambda f: LOGO_EXTENSIONS.index(f.suffix.lower())))
+    return found
+
+
+def _rasterise_svg(svg_bytes, height):
+    """PNG bytes for an SVG at the given pixel height"""
+    try:
+        import cairosvg
+    except ImportError:
+        cairosvg = None
+    if cairosvg is not None:
+        return cairosvg.svg2png(bytestring=svg_bytes, output_height=height)
+
+    rsvg = shutil.which('rsvg-convert')
+    if rsvg is None:
+        raise LogoError('SVG logos need cairosvg or rsvg-convert')
+    result = subprocess.run([rsvg, '--height', str(height), '--keep-aspect-ratio'],
+                            input=svg_bytes, capture_output=True)
+    if result.returncode:
+        raise LogoError(result.stderr.decode(errors='replace').strip() or 'rsvg-convert failed')
+    return result.stdout
+
+
+def normalise(source_bytes, suffix, height=LOGO_HEIGHT_PX):
+    """Rasterise and normalise a logo: palette PNG, transparent margins trimmed, at most height pixels tall"""
+    from PIL import Image
+
+    if suffix == '.svg':
+        # Render at twice the target height so trimming the margins keeps detail
+        source_bytes = _rasterise_svg(source_bytes, height * 2)
+    try:
+        image = Image.open(io.BytesIO(source_bytes))
+        image.load()
+    except Exception as e:  # Pillow raises a variety of errors for unreadable data
+        raise LogoError(f'unreadable image: {e}')
+
+    image = image.convert('RGBA')
+    bbox = image.getchannel('A').getbbox()
+    if bbox:
+        image = image.crop(bbox)
+    if image.height > height:
+        width = max(1, round(image.width * height / image.height))
+        image = image.resize((width, height), Image.LANCZOS)
+    # Fast octree is the quantizer that keeps the alpha channel
+    image = image.quantize(256, method=Image.Quantize.FASTOCTREE)
+
+    out = io.BytesIO()
+    image.save(out, 'PNG', optimize=True)
+    return out.getvalue()
+
+
+class LogoCache:
+    """On-disk cache of normalised logo PNGs keyed by source content"""
+
+    def __init__(self, cache_dir=None, height=LOGO_HEIGHT_PX):
+        self.cache_dir = Path(cache_dir) if cache_dir else cache.cache_dir('DECKKIT_LOGO_CACHE', 'logos')
+        self.height = height
+        self._memo = {}  # (path, mtime_ns, size) -> cached PNG path
+
+    def key(self, source_bytes):
+        settings = f'{LOGO_CACHE_VERSION}:{self.height}:'.encode()
+        return hashlib.sha256(settings + source_bytes).hexdigest()
+
+    def png(self, source_path):
+        """Path of the cached PNG for a logo file, rasterising it on first use
+
+        The cache is best effort: if the PNG cannot be written, the logo is
+        returned as an in-memory file instead, which add_logo also accepts.
+        """
+        source_path = Path(source_path)
+        stat = source_path.stat()
+        memo_key = (source_path, stat.st_mtime_ns, stat.st_size)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+
+        source_bytes = source_path.read_bytes()
+        key = self.key(source_bytes)
+        cached = self.cache_dir / key[:2] / f'{key}.png'
+        if not cached.is_file():
+            png_bytes = normalise(source_bytes, source_path.suffix.lower(), self.height)
+            try:
+                cache.atomic_write_bytes(cached, png_bytes)
+            except OSError:
+                cached = io.BytesIO(png_bytes)
+
+        self._memo[memo_key] = cached
+        return cached
+
+
+@lru_cache(maxsize=None)
+def default_cache():
+    """Process-wide LogoCache"""
+    return LogoCache()
+
+
+def logo_png(name, search_dirs):
+    """Cached PNG for the best usable logo of a tool (see LogoCache.png), or None"""
+    for source in find_logos(name, search_dirs):
+        try:
+            return default_cache().png(source)
+        except (LogoError, OSError) as e:
+            _warn_once(source, str(e))
+    return None
+
+
+def add_logo(shapes, png_path, right, top, height, max_width):
+    """Add a logo picture ending at right, height tall unless that makes it wider than max_width
+
+    png_path is a path or an in-memory PNG file, as returned by LogoCache.png.
+    """
+    if isinstance(png_path, Path):
+        png_path = str(png_path)  # python-pptx treats anything but str as a file object
+    picture = shapes.add_picture(png_path, 0, top, height=height)
+    if picture.width > max_width:
+        picture.height = int(picture.height * max_width / picture.width)
+        picture.width = max_width
+        picture.top = top + (height - picture.height) // 2
+    picture.left = right - picture.width
+    return picture
+
+
+@lru_cache(maxsize=None)
+def _warn_once(source, error):
+    print(f"Warning: logo {source} not embedded: {error}")
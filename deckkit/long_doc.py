@@ -0,0 +1,856 @@
+"""
+Long documents to multi-slide decks, streamed section by section
+
+create_pptx_from_html.py lays a one-pager out on a single slide. The long
+deliverables (00-DEEP-RESEARCH, 00-EFFICACY-BRIEF, as .html or .md) run to
+dozens of sections, so this converter reads them as a stream of blocks
+(headings, paragraphs, list items, tables and callouts) and lays each block
+onto slides as it arrives:
+- the h1 and the short lines under it open the first slide
+- every heading down to the split level (h3 by default) starts a new slide
+  titled by it
+- deeper headings become subheadings within the slide
+
+A capacity model decides what fits. Every block is measured with the Graphik
+metrics of deckkit.textmetrics, as the one-pager's frames are, against the
+body area under the slide title. A block that does not fit goes on a
+"(continued)" slide: tables split between rows, callouts between paragraphs,
+and a paragraph taller than a whole slide between words.
+
+Memory stays flat however long the document. HTML is fed to an HTMLParser in
+READ_CHUNK_SIZE chunks and Markdown is read line by line, so only the block
+being assembled is held, and each finished slide is written straight into
+the output package (deckkit.package_writer.PackageStream) and dropped. What
+remains per slide is python-pptx's bookkeeping for its part.
+
+    python -m deckkit.long_doc 00-EFFICACY-BRIEF.html -o brief.pptx
+"""
+
+import argparse
+import copy
+import io
+import re
+from collections import namedtuple
+from html.parser import HTMLParser
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Emu, Inches, Pt
+
+from deckkit import trace
+from deckkit.bulk import renumber_shapes, set_fill, set_font_size, set_paragraph_text
+from deckkit.highlights import highlight_segments
+from deckkit.one_pager import (
+    BLACK, CONTENT_BOTTOM, CONTENT_WIDTH, CONTINUATION_TOP, GRADIENT_AMBER_START,
+    GRADIENT_GREEN_START, GRADIENT_PURPLE_START, GRAY, MARGIN, PURPLE_CORE, STYLES as PAGE_STYLES,
+    TABLE_HEADER_HEIGHT, TEXTBOX_INSETS, TITLE_HEIGHT, TITLE_MIN_SIZE, add_chrome_slide,
+    add_one_pager_table, estimate_row_height, fit_text, paginate_rows, slide_template,
+)
+from deckkit.records import TableRow
+from deckkit.reproducible import streamed_deck
+from deckkit.styles import StyleRegistry
+from deckkit.textmetrics import LINE_SPACING, font_metrics
+from deckkit.trace import traced
+
+READ_CHUNK_SIZE = 64 * 1024
+DEFAULT_SPLIT_LEVEL = 3   # Headings down to h3 start a slide
+MARKDOWN_SUFFIXES = ('.md', '.markdown')
+
+# Body area and spacing
+BODY_TOP = CONTINUATION_TOP
+BODY_BOTTOM = CONTENT_BOTTOM
+BLOCK_GAP = Inches(0.15)          # Between a text group, table or callout and the next
+PARAGRAPH_GAP = Pt(6)             # Space after each paragraph
+LIST_INDENT = Inches(0.3)         # Per list level
+BULLET_HANG = Inches(0.2)         # Bullet or number hanging left of the item text
+CALLOUT_PADDING = Inches(0.15)
+KEEP_WITH_NEXT = Inches(0.5)      # Room a subheading needs below it on the same slide
+COVER_LINES = 3                   # Short lines under the h1 shown as its subtitle
+COVER_LINE_MAX_CHARS = 160
+
+CALLOUT_COLORS = {'critical': GRADIENT_AMBER_START, 'success': GRADIENT_GREEN_START}
+
+STYLES = StyleRegistry(name='Graphik')
+STYLES.define('subtitle', size=Pt(20), bold=True, color=PURPLE_CORE)
+STYLES.define('meta', size=Pt(14), color=GRAY)
+STYLES.define('body', size=Pt(14), color=BLACK)
+STYLES.define('body-bold', size=Pt(14), bold=True, color=BLACK)
+STYLES.define('subheading', size=Pt(18), bold=True, color=PURPLE_CORE)
+STYLES.define('callout-title', size=Pt(16), bold=True, color=BLACK)
+STYLES.define('callout-body', size=Pt(12), color=BLACK)
+STYLES.define('callout-bold', size=Pt(12), bold=True, color=BLACK)
+
+# Blocks, the unit the parsers stream. spans are the (start, end) offsets
+# of bold text; level is the list depth, 0 outside lists.
+Heading = namedtuple('Heading', 'level text')
+Paragraph = namedtuple('Paragraph', 'text spans level bullet')
+Table = namedtuple('Table', 'headers rows')
+Callout = namedtuple('Callout', 'kind title paragraphs')
+
+
+class _TextBuffer:
+    """Text of one block with whitespace collapsed as HTML renders it, and its bold spans"""
+    __slots__ = ('parts', 'length', 'spans', 'bold', '_bold_start', '_space')
+
+    def __init__(self):
+        self.parts = []
+        self.length = 0
+        self.spans = []
+        self.bold = 0
+        self._bold_start = None
+        self._space = False
+
+    def add(self, data):
+        words = data.split()
+        if not words:
+            self._space = self._space or bool(data)
+            return
+        if self.length and (self._space or data[0].isspace()):
+            self.parts.append(' ')
+            self.length += 1
+        if self.bold and self._bold_start is None:
+            self._bold_start = self.length
+        text = ' '.join(words)
+        self.parts.append(text)
+        self.length += len(text)
+        self._space = data[-1].isspace()
+
+    def open_bold(self):
+        self.bold += 1
+
+    def close_bold(self):
+        self.bold = max(0, self.bold - 1)
+        if not self.bold and self._bold_start is not None:
+            self.spans.append((self._bold_start, self.length))
+            self._bold_start = None
+
+    def finish(self):
+        """(text, spans) collected"""
+        if self._bold_start is not None:
+            self.spans.append((self._bold_start, self.length))
+            self._bold_start = None
+        return ''.join(self.parts), self.spans
+
+
+# Elements whose text is not document content, and those that never close
+SKIPPED_ELEMENTS = frozenset({'head', 'script', 'style', 'template', 'noscript', 'svg'})
+SKIPPED_CLASSES = frozenset({'gt-symbol'})
+VOID_ELEMENTS = frozenset({'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                           'link', 'meta', 'param', 'source', 'track', 'wbr'})
+BOLD_ELEMENTS = frozenset({'strong', 'b'})
+# Elements that end the loose text before them, e.g. a label in a <div>
+BLOCK_ELEMENTS = frozenset({'p', 'div', 'section', 'header', 'footer', 'article', 'main',
+                            'ul', 'ol', 'li', 'table', 'hr', 'blockquote', 'pre',
+                            'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+HEADING_LEVELS = {f'h{n}': n for n in range(1, 7)}
+
+
+class HtmlBlockParser(HTMLParser):
+    """Event-based HTML to block converter: completed blocks collect in `blocks`
+
+    Nothing but the open block is kept, so the caller can feed any length of
+    markup in chunks and take the blocks after each feed.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = []
+        self._skip = 0           # Open elements inside a skipped one
+        self._text = None        # _TextBuffer of the block being read
+        self._heading = None     # Its level, when it is a heading
+        self._lists = []         # Per open list: next item number, or None when unordered
+        self._in_item = False
+        self._rows = None        # Rows of the open table
+        self._row = None
+        self._cell = None
+        self._divs = []          # Per open <div>: its callout kind, or None
+        self._callout = None     # [kind, title, paragraphs] of the open callout
+
+    def handle_starttag(self, tag, attrs):
+        if self._skip:
+            if tag not in VOID_ELEMENTS:
+                self._skip += 1
+            return
+        classes = (dict(attrs).get('class') or '').split()
+        if tag in SKIPPED_ELEMENTS or SKIPPED_CLASSES.intersection(classes):
+            self._skip = 1
+            return
+
+        if tag in BLOCK_ELEMENTS and not (tag == 'p' and self._in_item):
+            self._flush()
+        if tag in HEADING_LEVELS:
+            self._text, self._heading = _TextBuffer(), HEADING_LEVELS[tag]
+        elif tag == 'p' and not self._in_item:
+            self._text = _TextBuffer()
+        elif tag in ('ul', 'ol'):
+            self._in_item = False
+            start = dict(attrs).get('start')
+            self._lists.append((int(start) if start and start.isdigit() else 1) if tag == 'ol' else None)
+        elif tag == 'li':
+            self._text, self._in_item = _TextBuffer(), True
+        elif tag == 'div':
+            kind = None
+            if 'callout' in classes:
+                kind = next((c for c in classes if c in CALLOUT_COLORS), 'default')
+                self._end_callout()
+                self._callout = [kind, '', []]
+            self._divs.append(kind)
+        elif tag == 'table':
+            self._end_callout()  # Tables are blocks of their own, even inside a callout
+            self._rows = []
+        elif tag == 'tr' and self._rows is not None:
+            self._row = []
+        elif tag in ('td', 'th') and self._row is not None:
+            self._cell = _TextBuffer()
+        elif tag == 'br':
+            self.handle_data('\n')
+        elif tag in BOLD_ELEMENTS:
+            buffer = self._buffer()
+            if buffer is not None:
+                buffer.open_bold()
+
+    def handle_endtag(self, tag):
+        if self._skip:
+            self._skip -= 1
+            return
+        if tag in BOLD_ELEMENTS:
+            buffer = self._cell or self._text
+            if buffer is not None:
+                buffer.close_bold()
+        elif tag in ('td', 'th') and self._cell is not None:
+            self._row.append(self._cell.finish()[0])
+            self._cell = None
+        elif tag == 'tr' and self._row is not None:
+            if self._row:
+                self._rows.append(tuple(self._row))
+            self._row = None
+        elif tag == 'table' and self._rows is not None:
+            if self._rows:
+                headers, *rows = self._rows
+                self.blocks.append(Table(headers, rows))
+            self._rows = None
+            kind = next((kind for kind in reversed(self._divs) if kind), None)
+            if kind:
+                self._callout = [kind, '', []]  # The rest of the callout around the table
+        elif tag == 'li':
+            self._flush()
+            self._in_item = False
+        elif tag in ('ul', 'ol') and self._lists:
+            self._flush()
+            self._lists.pop()
+            self._in_item = bool(self._lists)  # Back in the item holding a nested list
+        elif tag == 'div' and self._divs:
+            self._flush()
+            if self._divs.pop():
+                self._end_callout()
+        elif tag in BLOCK_ELEMENTS and not (tag == 'p' and self._in_item):
+            self._flush()
+
+    def handle_startendtag(self, tag, attrs):
+        # <br/> and the like: a void element's end tag would unbalance the skip depth
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        buffer = self._buffer(create=not data.isspace())
+        if buffer is not None:
+            buffer.add(data)
+
+    def _buffer(self, create=True):
+        """Buffer for text here; loose text outside any block starts a paragraph"""
+        if self._cell is not None:
+            return self._cell
+        if self._rows is not None:
+            return None  # Between cells
+        if self._text is None and create:
+            self._text = _TextBuffer()
+        return self._text
+
+    def _flush(self):
+        """Finish the open block, if it has any text"""
+        buffer, level = self._text, self._heading
+        self._text = self._heading = None
+        if buffer is None:
+            return
+        text, spans = buffer.finish()
+        if not text:
+            return
+        if level is not None and self._callout is None:
+            self.blocks.append(Heading(level, text))
+            return
+        if level is not None:
+            spans = [(0, len(text))]  # Headings inside a callout read as bold lines
+        depth, bullet = 0, False
+        if self._in_item and self._lists:
+            depth = len(self._lists)
+            number = self._lists[-1]
+            if number is None:
+                bullet = True
+            else:
+                self._lists[-1] += 1
+                marker = f'{number}. '
+                text = marker + text
+                spans = [(start + len(marker), end + len(marker)) for start, end in spans]
+        self._paragraph(Paragraph(text, spans, depth, bullet))
+
+    def _paragraph(self, paragraph):
+        if self._callout is None:
+            self.blocks.append(paragraph)
+        elif not self._callout[1] and not self._callout[2] and not paragraph.level:
+            self._callout[1] = paragraph.text  # Leading line of a callout is its title
+        else:
+            self._callout[2].append(paragraph)
+
+    def _end_callout(self):
+        self._flush()
+        if self._callout is not None:
+            kind, title, paragraphs = self._callout
+            if title or paragraphs:
+                self.blocks.append(Callout(kind, title, paragraphs))
+            self._callout = None
+
+    def close(self):
+        super().close()
+        self._end_callout()
+
+
+def iter_html_blocks(path, chunk_size=READ_CHUNK_SIZE):
+    """Yield the blocks of an HTML document, reading it chunk_size characters at a time"""
+    parser = HtmlBlockParser()
+    with open(path, 'r', encoding='utf-8') as f:
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            parser.feed(chunk)
+            yield from parser.blocks
+            parser.blocks.clear()
+    parser.close()
+    yield from parser.blocks
+
+
+_INLINE = re.compile(
+    r'(\*\*|__)(?P<bold>.+?)\1'                 # **bold**
+    r'|\[(?P<link>[^\]]*)\]\([^)]*\)'           # [text](url)
+    r'|`(?P<code>[^`]*)`'                       # `code`
+    r'|(?<![\w*])\*(?!\s)(?P<em>.+?)\*(?!\w)'   # *emphasis*
+)
+_LIST_ITEM = re.compile(r'(\s*)([-*+]|\d+[.)])\s+(.*)')
+_RULE = re.compile(r'(?:-{3,}|\*{3,}|_{3,})')
+_TABLE_RULE = re.compile(r'\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?')
+
+
+def markdown_inline(text):
+    """(plain text, bold spans) of a line of Markdown"""
+    parts, spans, length, pos = [], [], 0, 0
+    for match in _INLINE.finditer(text):
+        parts.append(text[pos:match.start()])
+        length += match.start() - pos
+        pos = match.end()
+        if match.group('code') is not None:
+            inner, inner_spans = match.group('code'), []
+        else:
+            inner, inner_spans = markdown_inline(
+                match.group('bold') or match.group('link') or match.group('em') or '')
+        if match.group('bold') is not None:
+            spans.append((length, length + len(inner)))
+        else:
+            spans.extend((length + start, length + end) for start, end in inner_spans)
+        parts.append(inner)
+        length += len(inner)
+    parts.append(text[pos:])
+    return ''.join(parts), spans
+
+
+def _table_cells(line):
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|'):
+        line = line[:-1]
+    return tuple(markdown_inline(cell.strip())[0] for cell in line.split('|'))
+
+
+def markdown_blocks(source):
+    """Yield the blocks of Markdown given as an iterable of lines
+
+    Blockquotes become callouts, their first line the title. A line that is
+    bold or emphasised throughout stands as a paragraph of its own, as the
+    label lines of the briefs are meant to.
+    """
+    lines = []           # Of the open paragraph or list item
+    item = None          # (level, bullet) when the open paragraph is a list item
+    rows = []            # Of the open table
+    quote = []           # Lines of the open blockquote
+    fenced = False
+
+    def paragraph():
+        nonlocal item
+        blocks = []
+        if lines:
+            text, spans = markdown_inline(' '.join(lines))
+            level, bullet = item or (0, False)
+            blocks.append(Paragraph(text, spans, level, bullet))
+            lines.clear()
+        item = None
+        return blocks
+
+    def table():
+        blocks = [Table(rows[0], rows[1:])] if rows else []
+        rows.clear()
+        return blocks
+
+    def callout():
+        if not quote:
+            return []
+        paragraphs = [b for b in markdown_blocks(quote) if isinstance(b, Paragraph)]
+        quote.clear()
+        if not paragraphs:
+            return []
+        if paragraphs[0].level:
+            return [Callout('default', '', paragraphs)]
+        return [Callout('default', paragraphs[0].text, paragraphs[1:])]
+
+    def flush():
+        return paragraph() + table() + callout()
+
+    for line in source:
+        line = line.rstrip('\n')
+        stripped = line.strip()
+        if stripped.startswith('```'):
+            yield from flush()
+            fenced = not fenced
+        elif fenced:
+            if stripped:
+                yield Paragraph(stripped, [], 0, False)
+        elif stripped.startswith('>'):
+            yield from paragraph() + table()
+            quote.append(stripped[1:].strip())
+        elif not stripped or _RULE.fullmatch(stripped):
+            yield from flush()
+        elif stripped.startswith('#'):
+            yield from flush()
+            hashes = len(stripped) - len(stripped.lstrip('#'))
+            yield Heading(hashes, markdown_inline(stripped[hashes:].strip().rstrip('#').strip())[0])
+        elif stripped.startswith('|'):
+            yield from paragraph() + callout()
+            if not _TABLE_RULE.fullmatch(stripped):
+                rows.append(_table_cells(stripped))
+        else:
+            yield from table() + callout()
+            match = _LIST_ITEM.match(line)
+            if match:
+                yield from paragraph()
+                indent, marker, text = match.groups()
+                if marker[0].isdigit():
+                    text = f'{marker[:-1]}. {text}'
+                lines.append(text)
+                item = (1 + len(indent.expandtabs(4)) // 2, not marker[0].isdigit())
+            elif _is_label(stripped):
+                yield from paragraph()
+                lines.append(stripped)
+                yield from paragraph()
+            else:
+                lines.append(stripped)
+    yield from flush()
+
+
+def iter_markdown_blocks(path):
+    """Yield the blocks of a Markdown document, reading it a line at a time"""
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from markdown_blocks(f)
+
+
+def _is_label(line):
+    """True for a line that is bold or emphasised throughout"""
+    for marker in ('**', '__', '*'):
+        if line.startswith(marker) and line.endswith(marker) and len(line) > 2 * len(marker):
+            return marker not in line[len(marker):-len(marker)]
+    return False
+
+
+def iter_blocks(path):
+    """Blocks of a .html or .md document, streamed"""
+    if Path(path).suffix.lower() in MARKDOWN_SUFFIXES:
+        return iter_markdown_blocks(path)
+    return iter_html_blocks(path)
+
+
+def text_height(style, text, width, bold=False):
+    """Height of text wrapped into a frame of width (EMU) in a style, bold if any of it is"""
+    style = STYLES[style]
+    metrics = font_metrics(style.name, bool(style.bold) or bold, bool(style.italic))
+    return Emu(int(Pt(metrics.text_height(text, style.size.pt, Emu(width).pt))))
+
+
+def split_text(text, spans, fits):
+    """(head, head spans, tail, tail spans): the most whole words of text for which fits(head)
+
+    The head holds at least one word, so an oversized word still moves on.
+    """
+    words = text.split(' ')
+    low, high = 1, len(words)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits(' '.join(words[:middle])):
+            low = middle
+        else:
+            high = middle - 1
+    cut = len(' '.join(words[:low]))
+    head_spans = [(start, min(end, cut)) for start, end in spans if start < cut]
+    tail_spans = [(max(start, cut + 1) - cut - 1, end - cut - 1) for start, end in spans if end > cut + 1]
+    return text[:cut], head_spans, text[cut + 1:], tail_spans
+
+
+class Line:
+    """One paragraph laid out in a text frame: its text, styles, list indent and measured height"""
+    __slots__ = ('text', 'spans', 'style', 'bold_style', 'level', 'bullet', 'width', 'height')
+
+    def __init__(self, text, spans, style, bold_style, width, level=0, bullet=False):
+        self.text = text
+        self.spans = spans
+        self.style = style
+        self.bold_style = bold_style
+        self.level = level
+        self.bullet = bullet
+        self.width = width - TEXTBOX_INSETS[0] - level * LIST_INDENT
+        self.height = text_height(style, text, self.width, bool(spans)) + PARAGRAPH_GAP
+
+    def split(self, height):
+        """(head, tail) Lines, the head fitting height, split between words"""
+        head, head_spans, tail, tail_spans = split_text(
+            self.text, self.spans,
+            lambda text: text_height(self.style, text, self.width, bool(self.spans)) + PARAGRAPH_GAP <= height)
+        width = self.width + TEXTBOX_INSETS[0] + self.level * LIST_INDENT
+        return (Line(head, head_spans, self.style, self.bold_style, width, self.level, self.bullet),
+                Line(tail, tail_spans, self.style, self.bold_style, width, self.level, self.bullet))
+
+    def add_to(self, text_frame, first):
+        """Append the paragraph to a text frame; first fills its initial empty paragraph"""
+        p = text_frame.paragraphs[0] if first else text_frame.add_paragraph()
+        STYLES[self.style].apply(p)
+        p.space_after = PARAGRAPH_GAP
+        if self.level:
+            p_pr = p._p.get_or_add_pPr()
+            p_pr.set('marL', str(int(self.level * LIST_INDENT)))
+            p_pr.set('indent', str(-int(BULLET_HANG)))
+            if self.bullet:
+                p_pr.insert_element_before(parse_xml(f'<a:buChar {nsdecls("a")} char="•"/>'),
+                                           'a:tabLst', 'a:defRPr', 'a:extLst')
+        for text, bold in highlight_segments(self.text, self.spans):
+            run = p.add_run()
+            run.text = text
+            STYLES[self.bold_style if bold else self.style].apply_run(run)
+
+
+class SlideFlow:
+    """Lays blocks onto slides top to bottom, passing each finished slide to emit
+
+    The first slide is the template slide already in prs; the others are
+    appended. Text blocks in a row share one text frame; tables and
+    callouts are shapes of their own.
+    """
+
+    def __init__(self, prs, emit, split_level=DEFAULT_SPLIT_LEVEL, title=''):
+        self.prs = prs
+        self.emit = emit
+        self.split_level = split_level
+        self.doc_title = self.section = title
+        self.slides = 0
+        self.slide = None
+        self._template_slide = prs.slides[0]
+        self._titled = False
+        self._slide_level = 0      # Level of the heading that opened the slide
+        self._cover_lines = None   # Subtitle lines still allowed on the first slide
+        self._title = None         # Title shape of the current slide
+        self._frame = None         # Text frame of the open text group
+        self._shape = None
+        self._empty = True
+        self.y = BODY_TOP
+
+    # Slides
+
+    def _new_slide(self, title):
+        self._finish_slide()
+        if self._template_slide is not None:
+            slide, self._template_slide = self._template_slide, None
+        else:
+            slide = add_chrome_slide(self.prs)
+        self.slide = slide
+        self._underline, self._glyph, footer = list(slide.shapes._spTree.iter_shape_elms())
+        set_paragraph_text(footer, self.doc_title)
+        self._title = None
+        self._set_title(title)
+        self.y = BODY_TOP
+        self._empty = True
+        self._frame = self._shape = None
+
+    def _set_title(self, title):
+        if self._title is None:
+            self._title = copy.deepcopy(slide_template().prototypes['title'])
+            self._title.x, self._title.y = MARGIN, MARGIN
+            self._title.cx, self._title.cy = CONTENT_WIDTH, TITLE_HEIGHT
+            self._underline.addprevious(self._title)
+        set_paragraph_text(self._title, title)
+        # Shrunk to stay on one line above the underline, as on the one-pager
+        title_size = PAGE_STYLES['title'].size.pt
+        one_line = Pt(title_size * LINE_SPACING) + TEXTBOX_INSETS[1]
+        size, _ = fit_text('title', title, CONTENT_WIDTH, one_line, TITLE_MIN_SIZE)
+        set_font_size(self._title, size)
+
+    def _ensure_slide(self):
+        """Open the first slide for content that comes before any heading"""
+        if self.slide is None:
+            self._new_slide(self.section)
+
+    def _continue_slide(self):
+        self._new_slide(f'{self.section} (continued)')
+
+    def _finish_slide(self):
+        if self.slide is None:
+            return
+        renumber_shapes(self.slide.shapes._spTree)
+        with trace.span('write_slide', 'save'):
+            self.emit(self.slide)
+        self.slides += 1
+        self.slide = None
+
+    def _place(self, elm):
+        """Move a new shape element below the footer chrome, as the one-pager does"""
+        self._glyph.addprevious(elm)
+        self._empty = False
+
+    def _room(self):
+        return BODY_BOTTOM - self.y
+
+    # Blocks
+
+    def add(self, block):
+        """Lay out the next block of the document"""
+        if isinstance(block, Heading):
+            self.heading(block)
+        elif isinstance(block, Paragraph):
+            self.paragraph(block)
+        elif isinstance(block, Table):
+            self.table(block)
+        else:
+            self.callout(block)
+
+    def heading(self, block):
+        self._cover_lines = None
+        if block.level == 1 and not self._titled:
+            self._titled = True
+            self.doc_title = self.section = block.text
+            self._new_slide(block.text)
+            self._slide_level = 1
+            self._cover_lines = COVER_LINES
+        elif block.level <= self.split_level:
+            if self._empty and self.slide is not None and 1 < self._slide_level < block.level:
+                # Nothing under the parent heading yet: one slide titled by both
+                self.section = f'{self.section}: {block.text}'
+                self._set_title(self.section)
+            else:
+                self.section = block.text
+                self._new_slide(block.text)
+            self._slide_level = block.level
+        else:
+            self._text(Line(block.text, [], 'subheading', 'subheading', CONTENT_WIDTH), KEEP_WITH_NEXT)
+
+    def paragraph(self, block):
+        if self._cover_lines and block.level == 0 and len(block.text) <= COVER_LINE_MAX_CHARS:
+            style = 'subtitle' if self._cover_lines == COVER_LINES else 'meta'
+            self._cover_lines -= 1
+            self._text(Line(block.text, [], style, style, CONTENT_WIDTH))
+            return
+        self._cover_lines = None
+        # A line bold throughout is a label for what follows, so it is kept with it
+        label = block.spans == [(0, len(block.text))]
+        self._text(Line(block.text, block.spans, 'body', 'body-bold', CONTENT_WIDTH,
+                        block.level, block.bullet), KEEP_WITH_NEXT if label else 0)
+
+    def _text(self, line, keep=0):
+        """Add a line to the open text group, continuing on new slides as it overflows
+
+        keep is room that must remain below the line, so a subheading is not
+        left at the foot of a slide.
+        """
+        while True:
+            self._ensure_slide()
+            top = 0 if self._frame is not None else TEXTBOX_INSETS[1]
+            if line.height + (0 if self._empty else keep) <= self._room() - top:
+                break
+            if not self._empty:
+                self._continue_slide()
+                continue
+            # Taller than a whole slide: fill this one and carry the rest over
+            head, line = line.split(self._room() - top)
+            self._add_line(head)
+            if not line.text:
+                return  # A single word taller than the slide
+            self._continue_slide()
+        self._add_line(line)
+
+    def _add_line(self, line):
+        if self._frame is None:
+            self._shape = self.slide.shapes.add_textbox(MARGIN, self.y, CONTENT_WIDTH, TEXTBOX_INSETS[1])
+            self._frame = self._shape.text_frame
+            self._frame.word_wrap = True
+            self._place(self._shape._element)
+            self.y += TEXTBOX_INSETS[1]
+            line.add_to(self._frame, first=True)
+        else:
+            line.add_to(self._frame, first=False)
+        self._shape.height = self._shape.height + line.height
+        self.y += line.height
+
+    def _end_text(self):
+        """Close the open text group, leaving a gap before the next block"""
+        if self._frame is not None:
+            self._frame = self._shape = None
+            self.y += BLOCK_GAP
+
+    def table(self, block):
+        self._cover_lines = None
+        self._end_text()
+        headers = block.headers
+        rows = [TableRow(cells) for cells in block.rows]
+        if not rows:
+            # A lone header row reads as a line of text
+            self.paragraph(Paragraph(' | '.join(headers), [], 0, False))
+            return
+        self._ensure_slide()
+        row_heights = [estimate_row_height(row.cells, len(headers)) for row in rows]
+        pages = paginate_rows(row_heights, self._room() - TABLE_HEADER_HEIGHT,
+                              BODY_BOTTOM - BODY_TOP - TABLE_HEADER_HEIGHT)
+        for page_index, (start, end) in enumerate(pages):
+            if page_index:
+                self._continue_slide()
+            if start == end:
+                continue  # No room for the first row; the table starts on the next slide
+            frame = add_one_pager_table(self.slide, headers, rows[start:end],
+                                        row_heights[start:end], self.y)
+            self._place(frame)
+            self.y += frame.cy + BLOCK_GAP
+
+    def callout(self, block):
+        self._cover_lines = None
+        self._end_text()
+        width = CONTENT_WIDTH - 2 * CALLOUT_PADDING
+        title = Line(block.title, [], 'callout-title', 'callout-title', width) if block.title else None
+        lines = [Line(p.text, p.spans, 'callout-body', 'callout-bold', width, p.level, p.bullet)
+                 for p in block.paragraphs]
+        chrome = 2 * CALLOUT_PADDING + TEXTBOX_INSETS[1]
+
+        while title or lines:
+            self._ensure_slide()
+            room = self._room() - chrome - (title.height if title else 0)
+            count, used = 0, 0
+            while count < len(lines) and used + lines[count].height <= room:
+                used += lines[count].height
+                count += 1
+            if not self._empty and (room < 0 or count < len(lines) and (count == 0 or title is None)):
+                self._continue_slide()  # Start afresh rather than show a title or a fragment alone
+                continue
+            if count == 0 and lines:
+                head, lines[0] = lines[0].split(room)
+                box = [head]
+                if not lines[0].text:
+                    lines.pop(0)
+            else:
+                box, lines = lines[:count], lines[count:]
+            self._add_callout(block.kind, ([title] if title else []) + box)
+            if lines:
+                self._continue_slide()
+                if block.title:
+                    title = Line(f'{block.title} (continued)', [], 'callout-title',
+                                 'callout-title', width)
+            else:
+                title = None
+
+    def _add_callout(self, kind, lines):
+        height = 2 * CALLOUT_PADDING + TEXTBOX_INSETS[1] + sum(line.height for line in lines)
+        background = copy.deepcopy(slide_template().prototypes['callout_bg'])
+        background.x, background.y, background.cx, background.cy = MARGIN, self.y, CONTENT_WIDTH, height
+        set_fill(background, CALLOUT_COLORS.get(kind, GRADIENT_PURPLE_START))
+        self._place(background)
+
+        shape = self.slide.shapes.add_textbox(
+            MARGIN + CALLOUT_PADDING, self.y + CALLOUT_PADDING,
+            CONTENT_WIDTH - 2 * CALLOUT_PADDING, height - 2 * CALLOUT_PADDING)
+        shape.text_frame.word_wrap = True
+        for index, line in enumerate(lines):
+            line.add_to(shape.text_frame, first=not index)
+        self._place(shape._element)
+        self.y += height + BLOCK_GAP
+
+    def finish(self):
+        """Emit the last slide; a document with no content still gets its title slide"""
+        if self.slide is None and not self.slides:
+            self._new_slide(self.doc_title)
+        self._finish_slide()
+
+
+@traced('build')
+def convert_document(path, output, split_level=DEFAULT_SPLIT_LEVEL, compression=None, stats=None):
+    """Convert a long .html or .md document into a deck at output, returning (slides, written)
+
+    compression and stats are as for deckkit.reproducible.save_deck.
+    """
+    prs = Presentation(io.BytesIO(slide_template().blob))
+    with streamed_deck(prs, output, compression, stats) as stream:
+        flow = SlideFlow(prs, stream.write_slide, split_level, title=Path(path).stem)
+        for block in iter_blocks(path):
+            flow.add(block)
+        flow.finish()
+    return flow.slides, stream.changed
+
+
+def main():
+    """Convert long documents into multi-slide decks"""
+    from deckkit.package_writer import format_stats, parse_compression
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('documents', nargs='+', type=Path, help='.html or .md documents to convert')
+    parser.add_argument('-o', '--output', type=Path, default=None,
+                        help='Deck to write, for a single document (default: the document with .pptx)')
+    parser.add_argument('--split-level', type=int, default=DEFAULT_SPLIT_LEVEL, choices=range(1, 7),
+                        metavar='N', help=f'Deepest heading level that starts a slide (default: {DEFAULT_SPLIT_LEVEL})')
+    parser.add_argument('--compression', action='append', default=[], metavar='EXT=LEVEL',
+                        help='Deflate level (0-9) or "store" for parts with this extension, '
+                             'or "*" for the rest; repeatable (default: images stored, the rest at 6)')
+    parser.add_argument('--save-stats', action='store_true',
+                        help='Report the size and save time of each part type across the decks written')
+    parser.add_argument('--trace', type=Path, default=None, metavar='PATH',
+                        help='Write a Chrome trace-event JSON of the run to PATH and print a time '
+                             'summary per span (also enabled by $DECKKIT_TRACE)')
+    args = parser.parse_args()
+
+    if args.output and len(args.documents) > 1:
+        parser.error("--output needs a single document")
+    try:
+        compression = parse_compression(args.compression)
+    except ValueError as e:
+        parser.error(f"--compression: {e}")
+    save_stats = [] if args.save_stats else None
+
+    failed = 0
+    with trace.session(args.trace):
+        for document in args.documents:
+            output = args.output or document.with_suffix('.pptx')
+            try:
+                slides, written = convert_document(document, output, args.split_level,
+                                                   compression, save_stats)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Error: {document}: {e}")
+                failed += 1
+                continue
+            print(f"{'Created' if written else 'Unchanged'}: {output} ({slides} slides)")
+        if save_stats is not None:
+            print('\n'.join(format_stats(save_stats, top=0 if len(args.documents) > 1 else 5)))
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,607 @@
+"""
+Slide layout for HTML one-pagers
+
+Builds the single-slide one-pager deck, its table continuation slides and the
+combined multi-slide deck from the OnePager records (deckkit.records) parsed
+by create_pptx_from_html.py.
+Kept apart from the parsers because importing python-pptx dominates start-up
+time, so runs that build nothing (dry runs, up-to-date batches) never load it.
+"""
+
+import copy
+import io
+from functools import lru_cache
+
+from pptx import Presentation
+from pptx.util import Emu, Inches, Pt
+from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+
+from deckkit.bulk import renumber_shapes, set_fill, set_font_size, set_paragraph_text
+from deckkit.highlights import highlight_segments
+from deckkit.logos import add_logo
+from deckkit.reproducible import save_deck
+from deckkit.styles import StyleRegistry
+from deckkit.textmetrics import LINE_SPACING, font_metrics
+from deckkit.trace import traced
+
+
+def hex_to_rgb(hex_color):
+    """Convert hex color to RGB tuple"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+@traced('build')
+def remove_shadow(shape):
+    """Completely remove shadow from a shape by clearing XML elements"""
+    try:
+        # Access the shape's XML element
+        sp = shape._element
+        spPr = sp.spPr
+
+        # Find and remove effect list elements (which contain shadows)
+        for elem in list(spPr):
+            if 'effectLst' in str(elem.tag) or 'outerShdw' in str(elem.tag):
+                spPr.remove(elem)
+    except:
+        pass  # If XML manipulation fails, continue anyway
+
+
+# Color definitions
+PURPLE_CORE = RGBColor(117, 0, 192)      # #7500c0
+PURPLE_ACCENT = RGBColor(160, 85, 245)   # #a055f5
+BLACK = RGBColor(0, 0, 0)
+WHITE = RGBColor(255, 255, 255)
+GRAY = RGBColor(127, 140, 141)
+AMBER = RGBColor(217, 119, 6)            # #D97706
+GREEN = RGBColor(16, 185, 129)           # #10B981
+
+# Gradient colors for callouts
+GRADIENT_AMBER_START = RGBColor(254, 243, 199)  # #FEF3C7
+GRADIENT_GREEN_START = RGBColor(209, 250, 229)  # #D1FAE5
+GRADIENT_PURPLE_START = RGBColor(243, 232, 255) # #F3E8FF
+TABLE_RULE = RGBColor(233, 213, 255)            # #E9D5FF
+
+# Slide geometry (16:9 widescreen)
+SLIDE_WIDTH = Inches(13.333)
+SLIDE_HEIGHT = Inches(7.5)
+MARGIN = Inches(0.5)
+CONTENT_WIDTH = SLIDE_WIDTH - (2 * MARGIN)
+FOOTER_Y = SLIDE_HEIGHT - Inches(0.7)  # Adjusted to prevent bleeding below slide
+CONTENT_BOTTOM = FOOTER_Y - Inches(0.1)
+
+# Native table rows; heights are measured so rows can spill onto continuation slides
+TABLE_HEADER_HEIGHT = Inches(0.5)
+TABLE_MIN_ROW_HEIGHT = Inches(0.4)
+TABLE_CELL_MARGINS = (Inches(0.2), Inches(0.1))  # Default cell insets, (left+right, top+bottom)
+TEXTBOX_INSETS = (Inches(0.2), Inches(0.1))      # Default textbox insets, likewise
+BOTTOM_LINE_HEIGHT = Inches(0.75)
+
+# Measured text frames: the fixed heights are minimums, so short text keeps
+# the original layout. Longer text is shrunk towards the minimum size while it
+# overflows the maximum height, and its frame then grows to fit.
+TITLE_HEIGHT = Inches(0.6)
+TITLE_MIN_SIZE = 24             # Points; the title is kept to one line down to this size
+OVERVIEW_HEIGHT = Inches(0.8)
+OVERVIEW_MAX_HEIGHT = Inches(1.3)
+OVERVIEW_MIN_SIZE = 14
+CALLOUT_HEIGHT = Inches(0.7)
+CALLOUT_MAX_HEIGHT = Inches(1.2)
+CALLOUT_MIN_SIZE = 10
+BOTTOM_CONTENT_HEIGHT = Inches(0.44)
+BOTTOM_CONTENT_MAX_HEIGHT = Inches(0.8)
+BOTTOM_CONTENT_MIN_SIZE = 9
+
+# Tool logo at the right of the title line
+LOGO_HEIGHT = Inches(0.5)
+LOGO_MAX_WIDTH = Inches(2.0)
+
+# Combined deck index slides
+INDEX_TITLE = 'Tool Portfolio'
+INDEX_COLUMNS = 2
+INDEX_ROWS = 18
+CONTINUATION_TOP = MARGIN + Inches(0.75)
+
+
+# Graphik text styles, compiled once and applied as a single XML element
+STYLES = StyleRegistry(name='Graphik')
+STYLES.define('title', size=Pt(32), bold=True, color=BLACK)
+STYLES.define('overview', size=Pt(18), bold=True, color=BLACK)
+STYLES.define('overview-highlight', size=Pt(18), bold=True, color=PURPLE_CORE)
+STYLES.define('callout-title', size=Pt(16), bold=True, color=BLACK)
+STYLES.define('callout-content', size=Pt(12), color=BLACK)
+STYLES.define('header', size=Pt(14), bold=True, color=WHITE)
+STYLES.define('cell', size=Pt(11), color=BLACK)
+STYLES.define('footer-glyph', size=Pt(48), bold=True, color=PURPLE_CORE)
+STYLES.define('footer', size=Pt(10), color=GRAY)
+STYLES.define('index-number', size=Pt(12), bold=True, color=PURPLE_CORE)
+STYLES.define('index-entry', size=Pt(12), bold=False, color=BLACK)
+
+
+def _styled_textbox(shapes, style, word_wrap=True, anchor=None):
+    """Add a placeholder textbox whose first paragraph carries the given style"""
+    box = shapes.add_textbox(0, 0, 0, 0)
+    tf = box.text_frame
+    if word_wrap:
+        tf.word_wrap = True
+    if anchor is not None:
+        tf.vertical_anchor = anchor
+    p = tf.paragraphs[0]
+    p.text = 'x'
+    STYLES[style].apply(p)
+    return box
+
+
+def _plain_rectangle(shapes, color=None):
+    """Add a placeholder filled rectangle with no outline and no shadow"""
+    rect = shapes.add_shape(1, 0, 0, 0, 0)  # Rectangle
+    rect.fill.solid()
+    rect.fill.fore_color.rgb = color or WHITE
+    rect.line.fill.background()  # No outline
+    remove_shadow(rect)  # Remove shadow completely
+    return rect
+
+
+class SlideTemplate:
+    """Pre-built one-pager slide cloned for every deck
+
+    The package holds a blank 16:9 slide with the fixed chrome already in
+    place (title underline, `>` glyph, footer box). Every variable shape is
+    built once here with python-pptx, detached as a prototype element, and
+    later deep-copied, positioned and filled with text. This skips the
+    per-shape proxy objects, per-property style writes and `remove_shadow`
+    XML surgery that building each deck from scratch costs.
+    """
+
+    def __init__(self):
+        prs = Presentation()
+        prs.slide_width = SLIDE_WIDTH
+        prs.slide_height = SLIDE_HEIGHT
+        slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
+        shapes = slide.shapes
+
+        # Fixed chrome, kept in the template
+        underline = shapes.add_shape(
+            1,  # Rectangle
+            MARGIN, MARGIN + Inches(0.55),
+            CONTENT_WIDTH, Inches(0.03)
+        )
+        underline.fill.solid()
+        underline.fill.fore_color.rgb = PURPLE_CORE
+        underline.line.fill.background()  # No outline
+
+        gt_box = shapes.add_textbox(MARGIN, FOOTER_Y, Inches(0.5), Inches(0.4))
+        p = gt_box.text_frame.paragraphs[0]
+        p.text = '>'
+        STYLES['footer-glyph'].apply(p)
+
+        footer_box = shapes.add_textbox(
+            SLIDE_WIDTH - Inches(4.5), FOOTER_Y,
+            Inches(4.0), Inches(0.4)
+        )
+        p = footer_box.text_frame.paragraphs[0]
+        p.text = 'x'
+        STYLES['footer'].apply(p)
+        p.alignment = PP_ALIGN.RIGHT
+
+        # Variable shapes, detached as prototypes
+        overview = shapes.add_textbox(0, 0, 0, 0)
+        overview.text_frame.word_wrap = True
+        runs = []
+        for style in ('overview-highlight', 'overview'):
+            run = overview.text_frame.paragraphs[0].add_run()
+            run.text = 'x'
+            STYLES[style].apply_run(run)
+            runs.append(run._r)
+
+        self.prototypes = {
+            'title': _styled_textbox(shapes, 'title'),
+            'overview': overview,
+            'callout_bg': _plain_rectangle(shapes),
+            'callout_title': _styled_textbox(shapes, 'callout-title'),
+            'callout_content': _styled_textbox(shapes, 'callout-content', anchor=MSO_ANCHOR.MIDDLE),
+            'bottom_title': _styled_textbox(shapes, 'callout-title', word_wrap=False),
+            'bottom_content': _styled_textbox(shapes, 'cell', anchor=MSO_ANCHOR.MIDDLE),
+        }
+        for name, shape in self.prototypes.items():
+            elm = shape._element
+            elm.getparent().remove(elm)
+            self.prototypes[name] = elm
+        for r in runs:
+            r.getparent().remove(r)
+        self.highlight_run, self.plain_run = runs
+        self.chrome = [copy.deepcopy(shape._element) for shape in (underline, gt_box, footer_box)]
+
+        # Table cells: purple header and white body cell with a lavender rule
+        table_frame = shapes.add_table(1, 2, 0, 0, Inches(2), Inches(1))
+        header, body = table_frame.table.cell(0, 0), table_frame.table.cell(0, 1)
+        for cell, style, fill, anchor in ((header, 'header', PURPLE_CORE, MSO_ANCHOR.MIDDLE),
+                                          (body, 'cell', WHITE, MSO_ANCHOR.TOP)):
+            cell.fill.solid()
+            cell.fill.fore_color.rgb = fill
+            cell.vertical_anchor = anchor
+            p = cell.text_frame.paragraphs[0]
+            p.text = 'x'
+            STYLES[style].apply(p)
+            p.alignment = PP_ALIGN.LEFT
+        body._tc.get_or_add_tcPr().insert(0, parse_xml(
+            f'<a:lnB {nsdecls("a")} w="12700"><a:solidFill>'
+            f'<a:srgbClr val="{TABLE_RULE}"/></a:solidFill></a:lnB>'))
+        self.header_cell = copy.deepcopy(header._tc)
+        self.body_cell = copy.deepcopy(body._tc)
+        table_frame._element.getparent().remove(table_frame._element)
+
+        buffer = io.BytesIO()
+        prs.save(buffer)
+        self.blob = buffer.getvalue()
+
+
+@lru_cache(maxsize=None)
+def slide_template():
+    """The per-process SlideTemplate, built on first use"""
+    return SlideTemplate()
+
+
+def fit_text(style, text, width, max_height=None, min_size=None, insets=TEXTBOX_INSETS):
+    """(font size in points, frame height) for text in a style wrapped into width
+
+    With max_height and min_size, the size steps down from the style's until
+    the text fits max_height or min_size is reached. The height is that of the
+    wrapped text plus the frame's insets.
+    """
+    style = STYLES[style]
+    metrics = font_metrics(style.name, bool(style.bold), bool(style.italic))
+    size = style.size.pt
+    text_width = Emu(width - insets[0]).pt
+    if max_height is not None and min_size is not None:
+        size = metrics.fit_size(text, text_width, Emu(max_height - insets[1]).pt, size, min_size)
+    height = Pt(metrics.text_height(text, size, text_width)) + insets[1]
+    return size, Emu(int(height))
+
+
+def estimate_row_height(cells, num_cols):
+    """Height of a body row: the measured wrapped height of its tallest cell"""
+    col_width = CONTENT_WIDTH / num_cols
+    height = max((fit_text('cell', text, col_width, insets=TABLE_CELL_MARGINS)[1] for text in cells),
+                 default=0)
+    return max(TABLE_MIN_ROW_HEIGHT, int(height))
+
+
+def bottom_line_layout(callout, width):
+    """(font size, content height, block height) of a bottom-line callout's content in width"""
+    size, height = fit_text('cell', callout.content, width,
+                            BOTTOM_CONTENT_MAX_HEIGHT, BOTTOM_CONTENT_MIN_SIZE)
+    content_height = max(BOTTOM_CONTENT_HEIGHT, height)
+    return size, content_height, BOTTOM_LINE_HEIGHT + content_height - BOTTOM_CONTENT_HEIGHT
+
+
+def paginate_rows(row_heights, first_capacity, capacity, reserve=0):
+    """Split rows into (start, end) slices that fit the available heights
+
+    The last slice also leaves `reserve` free for content that follows the
+    table. Every slice holds at least one row, so an oversized row still
+    gets a slide of its own, except that the first slice is empty, (0, 0),
+    when the first row only fits the larger continuation capacity.
+    """
+    pages = []
+    start = 0
+    available = first_capacity
+    if row_heights and row_heights[0] > first_capacity and capacity > first_capacity:
+        pages.append((0, 0))
+        available = capacity
+    while start < len(row_heights):
+        remaining = row_heights[start:]
+        if sum(remaining) + reserve <= available:
+            pages.append((start, len(row_heights)))
+            break
+        end, used = start, 0
+        while end < len(row_heights) and used + row_heights[end] <= available:
+            used += row_heights[end]
+            end += 1
+        # Leave the final row(s) for the next slide rather than ending on a
+        # slide with no room for the reserved content
+        end = max(start + 1, min(end, len(row_heights) - 1))
+        pages.append((start, end))
+        start = end
+        available = capacity
+    return pages
+
+
+def add_one_pager_table(slide, headers, rows, row_heights, top):
+    """Add a native table with the purple header and return its graphicFrame element
+
+    Cells are cloned from the template's pre-styled header and body cells,
+    so styling costs one element copy per cell regardless of row count.
+    """
+    template = slide_template()
+    num_cols = len(headers)
+    frame = slide.shapes.add_table(
+        1, num_cols, MARGIN, top,
+        CONTENT_WIDTH, TABLE_HEADER_HEIGHT + sum(row_heights)
+    )._element
+    tbl = frame.graphic.graphicData.tbl
+    tbl.remove(tbl.tr_lst[0])
+    # Fills come from the cells, not the built-in table style's banding
+    tbl.tblPr.set('bandRow', '0')
+
+    def add_row(texts, height, prototype):
+        tr = tbl._add_tr(h=height)
+        for i in range(num_cols):
+            tc = copy.deepcopy(prototype)
+            set_paragraph_text(tc, texts[i] if i < len(texts) else '')
+            tr.append(tc)
+
+    add_row(headers, TABLE_HEADER_HEIGHT, template.header_cell)
+    for row, height in zip(rows, row_heights):
+        add_row(row.cells, height, template.body_cell)
+    return frame
+
+
+@traced('build')
+def fill_one_pager_slide(prs, slide, data, logo=None):
+    """Add the one-pager content to a slide that already carries the template chrome
+
+    logo is an optional PNG path shown at the right end of the title line.
+    Callouts and table rows that do not fit are continued on extra slides
+    appended to prs.
+    Returns the slides used, starting with slide.
+    """
+    template = slide_template()
+    slides = [slide]
+    sp_tree = slide.shapes._spTree
+    underline, gt_glyph, footer = list(sp_tree.iter_shape_elms())
+
+    def place(name, x, y, cx, cy, text=None, before=None):
+        elm = copy.deepcopy(template.prototypes[name])
+        elm.x, elm.y, elm.cx, elm.cy = int(x), int(y), int(cx), int(cy)
+        if text is not None:
+            set_paragraph_text(elm, text)
+        (before if before is not None else gt_glyph).addprevious(elm)
+        return elm
+
+    def continuation_slide():
+        """Finish the current slide and carry on below the title of a new one"""
+        nonlocal slide, sp_tree, underline, gt_glyph, footer
+        renumber_shapes(sp_tree)
+        slide = add_chrome_slide(prs)
+        slides.append(slide)
+        sp_tree = slide.shapes._spTree
+        underline, gt_glyph, footer = list(sp_tree.iter_shape_elms())
+        place('title', MARGIN, MARGIN, CONTENT_WIDTH, TITLE_HEIGHT,
+              text=f"{data.title} (continued)", before=underline)
+        set_paragraph_text(footer, data.footer_contact)
+        return CONTINUATION_TOP
+
+    y_pos = MARGIN
+
+    # Title, shortened to make room for the logo
+    title_width = CONTENT_WIDTH
+    if logo:
+        picture = add_logo(slide.shapes, logo, MARGIN + CONTENT_WIDTH, y_pos + Inches(0.05),
+                           LOGO_HEIGHT, LOGO_MAX_WIDTH)
+        title_width -= picture.width + Inches(0.2)
+    title = place('title', MARGIN, y_pos, title_width, TITLE_HEIGHT,
+                  text=data.title, before=underline)
+    # Shrunk to stay on one line above the underline
+    title_size = STYLES['title'].size.pt
+    one_line = Pt(title_size * LINE_SPACING) + TEXTBOX_INSETS[1]
+    size, _ = fit_text('title', data.title, title_width, one_line, TITLE_MIN_SIZE)
+    if size != title_size:
+        set_font_size(title, size)
+
+    y_pos += Inches(0.75)
+
+    # Overview text, measured as one paragraph: its runs keep the HTML's
+    # newlines, which PowerPoint shows as spaces
+    overview_size, overview_height = fit_text('overview', ' '.join(data.overview.split()), CONTENT_WIDTH,
+                                              OVERVIEW_MAX_HEIGHT, OVERVIEW_MIN_SIZE)
+    overview_height = max(OVERVIEW_HEIGHT, overview_height)
+    overview = place('overview', MARGIN, y_pos, CONTENT_WIDTH, overview_height)
+    p = overview.txBody.p_lst[0]
+
+    # Add overview with purple highlights, at the offsets the parser took from
+    # the DOM; data without them highlights every occurrence of each phrase
+    for text, highlighted in highlight_segments(data.overview, data.highlight_spans,
+                                                data.highlights):
+        run = copy.deepcopy(template.highlight_run if highlighted else template.plain_run)
+        run.text = text
+        p.append(run)
+    if overview_size != STYLES['overview'].size.pt:
+        set_font_size(overview, overview_size)
+
+    y_pos += overview_height + Inches(0.2)
+
+    # Callouts (first 2: critical finding and recommendation)
+    title_width = Inches(2.5)
+    content_width = CONTENT_WIDTH - title_width - Inches(0.5)
+    for callout in data.callouts[:2]:
+        content_size, content_height = fit_text(
+            'callout-content', callout.content, content_width,
+            CALLOUT_MAX_HEIGHT - Inches(0.2), CALLOUT_MIN_SIZE)
+        title_height = max(Inches(0.4), fit_text('callout-title', callout.title, title_width)[1])
+        callout_height = max(CALLOUT_HEIGHT, content_height + Inches(0.2), title_height + Inches(0.3))
+
+        # Moved whole to a continuation slide rather than run off this one
+        if y_pos + callout_height > CONTENT_BOTTOM and y_pos > CONTINUATION_TOP:
+            y_pos = continuation_slide()
+
+        # Determine colors
+        if callout.type == 'critical':
+            bg_color = GRADIENT_AMBER_START
+        elif callout.type == 'recommendation':
+            bg_color = GRADIENT_GREEN_START
+        else:
+            bg_color = GRADIENT_PURPLE_START
+
+        bg_box = place('callout_bg', MARGIN, y_pos, CONTENT_WIDTH, callout_height)
+        set_fill(bg_box, bg_color)
+
+        # Title (left side, bold)
+        place('callout_title',
+              MARGIN + Inches(0.2), y_pos + Inches(0.15),
+              title_width, title_height,
+              text=callout.title)
+
+        # Content (right side)
+        content = place('callout_content',
+                        MARGIN + title_width + Inches(0.3), y_pos + Inches(0.1),
+                        content_width, callout_height - Inches(0.2),
+                        text=callout.content)
+        if content_size != STYLES['callout-content'].size.pt:
+            set_font_size(content, content_size)
+
+        y_pos += callout_height + Inches(0.15)
+
+    bottom_title_width = Inches(2.0)
+    bottom_content_width = CONTENT_WIDTH - bottom_title_width - Inches(0.5)
+    if len(data.callouts) > 2:
+        bottom_size, bottom_height, bottom_block = bottom_line_layout(
+            data.callouts[2], bottom_content_width)
+
+    # Table, spilling onto continuation slides when the rows overflow
+    if data.table_headers and data.rows:
+        reserve = bottom_block if len(data.callouts) > 2 else 0
+        row_heights = [estimate_row_height(row.cells, len(data.table_headers))
+                       for row in data.rows]
+        pages = paginate_rows(
+            row_heights,
+            CONTENT_BOTTOM - y_pos - TABLE_HEADER_HEIGHT,
+            CONTENT_BOTTOM - CONTINUATION_TOP - TABLE_HEADER_HEIGHT,
+            reserve)
+
+        for page_index, (start, end) in enumerate(pages):
+            if page_index:
+                y_pos = continuation_slide()
+            if start == end:
+                continue  # No room for the first row; the table starts on the next slide
+
+            frame = add_one_pager_table(
+                slide, data.table_headers,
+                data.rows[start:end], row_heights[start:end], y_pos)
+            gt_glyph.addprevious(frame)
+            y_pos += frame.cy + Inches(0.35)
+
+    # Bottom line callout
+    if len(data.callouts) > 2:
+        callout = data.callouts[2]
+        bg_color = GRADIENT_GREEN_START if 'recommendation' in callout.type else GRADIENT_PURPLE_START
+        if y_pos + bottom_block > CONTENT_BOTTOM + Inches(0.15) and y_pos > CONTINUATION_TOP:
+            y_pos = continuation_slide()
+
+        bg_box = place('callout_bg', MARGIN, y_pos, CONTENT_WIDTH,
+                       bottom_height + Inches(0.16))
+        set_fill(bg_box, bg_color)
+
+        place('bottom_title',
+              MARGIN + Inches(0.2), y_pos + Inches(0.12),
+              bottom_title_width, Inches(0.35),
+              text=callout.title)
+
+        content = place('bottom_content',
+                        MARGIN + bottom_title_width + Inches(0.3), y_pos + Inches(0.08),
+                        bottom_content_width, bottom_height,
+                        text=callout.content)
+        if bottom_size != STYLES['cell'].size.pt:
+            set_font_size(content, bottom_size)
+
+        y_pos += bottom_block
+
+    # Footer info (right); the > glyph on the left is part of the template
+    set_paragraph_text(footer, data.footer_contact)
+
+    renumber_shapes(sp_tree)
+    return slides
+
+
+@traced('build')
+def build_pptx_slide(data, logo=None):
+    """Build the one-pager Presentation in memory from parsed data"""
+    prs = Presentation(io.BytesIO(slide_template().blob))
+    fill_one_pager_slide(prs, prs.slides[0], data, logo)
+    return prs
+
+
+def add_chrome_slide(prs):
+    """Append a blank slide carrying the template chrome (underline, > glyph, footer)"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
+    sp_tree = slide.shapes._spTree
+    for elm in slide_template().chrome:
+        sp_tree.append(copy.deepcopy(elm))
+    return slide
+
+
+def index_page_count(num_entries):
+    """Number of index slides needed for num_entries one-pagers"""
+    return max(1, -(-num_entries // (INDEX_COLUMNS * INDEX_ROWS)))
+
+
+def add_index_slides(prs, entries):
+    """Append index slides listing (title, slide number) entries"""
+    per_slide = INDEX_COLUMNS * INDEX_ROWS
+    pages = [entries[i:i + per_slide] for i in range(0, len(entries), per_slide)] or [[]]
+    column_width = CONTENT_WIDTH / INDEX_COLUMNS
+    row_height = Inches(0.27)
+
+    for page in pages:
+        slide = add_chrome_slide(prs)
+        sp_tree = slide.shapes._spTree
+        underline, gt_glyph, footer = list(sp_tree.iter_shape_elms())
+        title = copy.deepcopy(slide_template().prototypes['title'])
+        title.x, title.y, title.cx, title.cy = MARGIN, MARGIN, CONTENT_WIDTH, Inches(0.6)
+        set_paragraph_text(title, INDEX_TITLE)
+        underline.addprevious(title)
+        set_paragraph_text(footer, '')
+
+        for i, (entry, number) in enumerate(page):
+            column, row = divmod(i, INDEX_ROWS)
+            box = slide.shapes.add_textbox(
+                MARGIN + int(column * column_width), MARGIN + Inches(0.85) + row * row_height,
+                int(column_width), row_height
+            )
+            p = box.text_frame.paragraphs[0]
+            for text, style in ((f'{number}  ', 'index-number'), (entry, 'index-entry')):
+                run = p.add_run()
+                run.text = text
+                STYLES[style].apply_run(run)
+
+        renumber_shapes(sp_tree)
+
+    return len(pages)
+
+
+@traced('build')
+def build_combined_deck(datas, index=False, logos=None):
+    """Build one Presentation with a slide per parsed one-pager, optionally led by an index
+
+    logos, if given, holds a PNG path (or None) per one-pager.
+    """
+    prs = Presentation(io.BytesIO(slide_template().blob))
+    index_pages = index_page_count(len(datas)) if index and datas else 0
+    entries = []
+    for i, data in enumerate(datas):
+        entries.append((data.title, index_pages + len(prs.slides) + (1 if i else 0)))
+        slide = prs.slides[0] if i == 0 else add_chrome_slide(prs)
+        fill_one_pager_slide(prs, slide, data, logos[i] if logos else None)
+
+    if index_pages:
+        add_index_slides(prs, entries)
+
+        # Move the index slides from the end to the front of the deck
+        sld_id_lst = prs.slides._sldIdLst
+        for sld_id in list(sld_id_lst)[-index_pages:][::-1]:
+            sld_id_lst.remove(sld_id)
+            sld_id_lst.insert(0, sld_id)
+
+    return prs
+
+
+def create_pptx_slide(data, output_path, tool_name, logo=None, compression=None, stats=None):
+    """Create PowerPoint slide from parsed data, leaving an identical existing deck untouched"""
+    prs = build_pptx_slide(data, logo)
+    if save_deck(prs, output_path, compression, stats):
+        print(f"Created: {output_path}")
+    else:
+        print(f"Unchanged: {output_path}")
@@ -0,0 +1,188 @@
+"""
+Streaming .pptx package writer with per-part compression
+
+`prs.save` deflates every part at the default level, images included, and
+buffers the package in memory. `write_package` instead serialises one part
+at a time straight into the output zip. Each part is stored or deflated
+according to its extension: PNG, JPEG, AVIF, WebP and GIF are already
+compressed and are stored, and XML, .rels and everything else is deflated
+at DEFAULT_LEVEL. Entries come in the reproducible order and carry the
+fixed metadata described in deckkit.reproducible.
+
+The size and time of each part are recorded, so big batch runs can see
+where the saving goes (`format_stats`).
+
+The part contents are exactly those `prs.save` writes; the serialisation
+goes through python-pptx's own package writer helpers. They are imported
+on first use, so the scripts can parse --compression and print stats on
+runs that build nothing without loading python-pptx.
+
+A PackageStream writes a deck that is still being built: each slide goes
+into the zip as soon as it is finished and its XML is then dropped, so a
+deck of any length holds one slide's shapes in memory at a time. The
+finished slides come first in the zip, then the other entries in the usual
+order.
+"""
+
+import time
+import zipfile
+from collections import namedtuple
+
+STORE = None            # Level meaning "store uncompressed"
+DEFAULT_LEVEL = 6       # zlib's default trade-off
+# Extension -> deflate level (0-9) or STORE; unlisted extensions get the default level
+DEFAULT_COMPRESSION = {
+    'png': STORE, 'jpg': STORE, 'jpeg': STORE, 'gif': STORE, 'avif': STORE, 'webp': STORE,
+}
+
+PartStats = namedtuple('PartStats', 'name size stored_size seconds')
+
+
+def parse_compression(specs):
+    """{extension: level} from command-line 'ext=level' items, level being 0-9 or 'store'
+
+    '*=level' sets the level for every extension not listed.
+    """
+    compression = {}
+    for spec in specs or ():
+        ext, sep, level = spec.partition('=')
+        ext = ext.strip().lstrip('.').lower()
+        level = level.strip().lower()
+        if not sep or not ext:
+            raise ValueError(f"expected EXT=LEVEL, got {spec!r}")
+        if level == 'store':
+            compression[ext] = STORE
+        elif level.isdigit() and 0 <= int(level) <= 9:
+            compression[ext] = int(level)
+        else:
+            raise ValueError(f"{spec!r}: level must be 0-9 or 'store'")
+    return compression
+
+
+def _level_for(name, compression):
+    ext = name.rsplit('.', 1)[-1].lower()
+    if ext in compression:
+        return compression[ext]
+    return compression.get('*', DEFAULT_LEVEL)
+
+
+def package_entries(prs):
+    """[(member name, blob producer)] for every entry of the package, in reproducible order"""
+    from pptx.opc.oxml import serialize_part_xml
+    from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+    from pptx.opc.serialized import _ContentTypesItem
+
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    entries = [
+        (CONTENT_TYPES_URI.membername, lambda: serialize_part_xml(_ContentTypesItem.xml_for(parts))),
+        (PACKAGE_URI.rels_uri.membername, lambda: package._rels.xml),
+    ]
+    for part in parts:
+        entries.append((part.partname.membername, lambda part=part: part.blob))
+        if part._rels:
+            entries.append((part.partname.rels_uri.membername, lambda part=part: part.rels.xml))
+    # [Content_Types].xml first by convention, then by name
+    entries.sort(key=lambda entry: (entry[0] != CONTENT_TYPES_URI.membername, entry[0]))
+    return entries
+
+
+def _write_entry(zf, name, blob, date_time, compression):
+    """Write one entry with the fixed metadata, returning its PartStats"""
+    start = time.perf_counter()
+    data = blob()
+    level = _level_for(name, compression)
+    info = zipfile.ZipInfo(name, date_time)
+    info.compress_type = zipfile.ZIP_STORED if level is STORE else zipfile.ZIP_DEFLATED
+    info.create_system = 3  # Unix, whatever platform saved the deck
+    info.external_attr = 0o644 << 16
+    zf.writestr(info, data, compresslevel=level)
+    return PartStats(name, len(data), info.compress_size, time.perf_counter() - start)
+
+
+def write_package(prs, file, date_time, compression=None):
+    """Stream the presentation's package into file, returning a PartStats per entry
+
+    compression overrides DEFAULT_COMPRESSION per extension.
+    """
+    compression = {**DEFAULT_COMPRESSION, **(compression or {})}
+    with zipfile.ZipFile(file, 'w') as zf:
+        return [_write_entry(zf, name, blob, date_time, compression)
+                for name, blob in package_entries(prs)]
+
+
+class PackageStream:
+    """Package writer fed finished slides while the rest of the deck is built
+
+    `write_slide` writes a slide's part and relationships and swaps its XML
+    for an empty slide; `close` writes every entry not yet written. Slides
+    must not change once written.
+    """
+
+    def __init__(self, prs, file, date_time, compression=None):
+        self.prs = prs
+        self.stats = []
+        self._date_time = date_time
+        self._compression = {**DEFAULT_COMPRESSION, **(compression or {})}
+        self._written = set()
+        self._zf = zipfile.ZipFile(file, 'w')
+
+    def _write(self, name, blob):
+        self.stats.append(_write_entry(self._zf, name, blob, self._date_time, self._compression))
+        self._written.add(name)
+
+    def write_slide(self, slide):
+        from pptx.oxml.slide import CT_Slide
+
+        part = slide.part
+        self._write(part.partname.membername, lambda: part.blob)
+        if part._rels:
+            self._write(part.partname.rels_uri.membername, lambda: part.rels.xml)
+        # The part stays in the package for [Content_Types].xml and the
+        # presentation's relationships; only its shapes are released
+        part._element = CT_Slide.new()
+        part.__dict__.pop('slide', None)  # Slide proxy cached on the part
+
+    def close(self):
+        """Write the remaining entries and finish the zip, returning the PartStats"""
+        try:
+            for name, blob in package_entries(self.prs):
+                if name not in self._written:
+                    self._write(name, blob)
+        finally:
+            self._zf.close()
+        return self.stats
+
+
+def _kind(name):
+    """Part kind for the stats summary: media by extension, XML by folder"""
+    if name.endswith('.rels'):
+        return 'rels'
+    folder, _, filename = name.rpartition('/')
+    ext = filename.rsplit('.', 1)[-1].lower()
+    if ext != 'xml':
+        return ext
+    return folder.rsplit('/', 1)[-1] if folder else 'xml'
+
+
+def format_stats(stats, top=5):
+    """Report lines: totals, then size and time per part kind, then the largest parts"""
+    size = sum(s.size for s in stats)
+    stored = sum(s.stored_size for s in stats)
+    seconds = sum(s.seconds for s in stats)
+    lines = [f"  {len(stats)} entries, {size / 1024:.0f} KB -> {stored / 1024:.0f} KB in {seconds * 1000:.1f} ms"]
+
+    kinds = {}
+    for s in stats:
+        kind = kinds.setdefault(_kind(s.name), [0, 0, 0, 0.0])
+        kind[0] += 1
+        kind[1] += s.size
+        kind[2] += s.stored_size
+        kind[3] += s.seconds
+    for kind, (count, kind_size, kind_stored, kind_seconds) in sorted(
+            kinds.items(), key=lambda item: -item[1][2]):
+        lines.append(f"    {kind:<16}{count:>5} entries {kind_size / 1024:>9.1f} KB -> "
+                     f"{kind_stored / 1024:>8.1f} KB {kind_seconds * 1000:>8.1f} ms")
+    for s in sorted(stats, key=lambda s: -s.stored_size)[:top]:
+        lines.append(f"    {s.name:<44}{s.stored_size / 1024:>9.1f} KB {s.seconds * 1000:>8.1f} ms")
+    return lines
@@ -0,0 +1,158 @@
+"""
+Staged batch pipeline connected by bounded queues
+
+A batch job such as converting every one-pager is a chain of stages: read
+the source, turn it into a deck, write the deck. Running the whole chain per
+item in one worker leaves the CPU idle during disk I/O and the disk idle
+during CPU work. `run_pipeline` gives each stage its own workers instead:
+- threads for I/O stages
+- a process pool for CPU stages
+
+The stages are joined by bounded queues, so reads overlap with building and
+building with writes. Memory stays capped at a few queued items per stage
+however long the batch is.
+
+Each stage records how busy its workers were, how long they waited for
+input (starved) and how long they waited for room downstream (blocked). It
+also samples its input queue's depth. `format_stats` prints these for
+tuning: a stage that is never starved is the bottleneck, and a stage that
+is often blocked has more workers than its downstream can use.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+_DONE = object()
+
+
+class Stage:
+    """One step of a pipeline: func(value) -> value, run by workers threads or processes"""
+
+    def __init__(self, name, func, workers=1, processes=False):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        # A single process would only add pickling to a thread's work
+        self.processes = processes and self.workers > 1
+
+
+class StageStats:
+    """Counters for one stage of a pipeline run"""
+
+    def __init__(self, stage):
+        self.name = stage.name
+        self.workers = stage.workers
+        self.processes = stage.processes
+        self.items = 0
+        self.failures = 0
+        self.busy = 0.0       # Seconds spent in func, summed over workers
+        self.starved = 0.0    # Seconds waiting for input
+        self.blocked = 0.0    # Seconds waiting for room in the next queue
+        self.max_depth = 0
+        self.depth_total = 0
+        self.depth_samples = 0
+        self._lock = threading.Lock()
+
+    def sample_depth(self, depth):
+        with self._lock:
+            self.max_depth = max(self.max_depth, depth)
+            self.depth_total += depth
+            self.depth_samples += 1
+
+    def add(self, busy=0.0, starved=0.0, blocked=0.0, items=0, failures=0):
+        with self._lock:
+            self.busy += busy
+            self.starved += starved
+            self.blocked += blocked
+            self.items += items
+            self.failures += failures
+
+    @property
+    def mean_depth(self):
+        return self.depth_total / self.depth_samples if self.depth_samples else 0.0
+
+    def utilisation(self, wall):
+        """Fraction of the stage's worker time spent doing work"""
+        return self.busy / (self.workers * wall) if wall else 0.0
+
+
+def run_pipeline(items, stages, queue_depth=4):
+    """Push items through stages, returning (results, failures, stats, wall seconds)
+
+    results are the last stage's outputs in completion order; failures are
+    (item, exception) for items that raised in any stage, which drops them.
+    Every queue between stages holds at most queue_depth items.
+    """
+    queues = [queue.Queue(queue_depth) for _ in stages]
+    stats = [StageStats(stage) for stage in stages]
+    results, failures = [], []
+    pools = [ProcessPoolExecutor(max_workers=stage.workers) if stage.processes else None
+             for stage in stages]
+
+    def work(index):
+        stage, inbox, stage_stats = stages[index], queues[index], stats[index]
+        outbox = queues[index + 1] if index + 1 < len(stages) else None
+        pool = pools[index]
+        while True:
+            start = time.perf_counter()
+            entry = inbox.get()
+            got = time.perf_counter()
+            if entry is _DONE:
+                inbox.put(_DONE)  # Let the stage's other workers see it too
+                stage_stats.add(starved=got - start)
+                return
+            stage_stats.sample_depth(inbox.qsize())
+            item, value = entry
+            try:
+                value = pool.submit(stage.func, value).result() if pool else stage.func(value)
+            except Exception as e:
+                failures.append((item, e))
+                stage_stats.add(busy=time.perf_counter() - got, starved=got - start, failures=1)
+                continue
+            done = time.perf_counter()
+            if outbox is None:
+                results.append(value)
+            else:
+                outbox.put((item, value))
+            stage_stats.add(busy=done - got, starved=got - start,
+                            blocked=time.perf_counter() - done, items=1)
+
+    threads = []
+    wall_start = time.perf_counter()
+    try:
+        for index, stage in enumerate(stages):
+            stage_threads = [threading.Thread(target=work, args=(index,), daemon=True,
+                                              name=f'{stage.name}-{n}')
+                             for n in range(stage.workers)]
+            for thread in stage_threads:
+                thread.start()
+            threads.append(stage_threads)
+
+        for item in items:
+            queues[0].put((item, item))
+        # Close each stage once all of its workers have finished
+        for index, stage_threads in enumerate(threads):
+            queues[index].put(_DONE)
+            for thread in stage_threads:
+                thread.join()
+    finally:
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown()
+    return results, failures, stats, time.perf_counter() - wall_start
+
+
+def format_stats(stats, wall):
+    """Report lines: per stage workers, items, failures, utilisation, waits and input queue depth"""
+    lines = [f"  Pipeline: {wall:.2f} s",
+             f"    {'Stage':<10}{'Workers':>12}{'Items':>7}{'Failed':>8}{'Busy':>7}{'Starved':>9}"
+             f"{'Blocked':>9}  Queue max/mean"]
+    for s in stats:
+        worker_time = s.workers * wall or 1.0
+        workers = f"{s.workers} {'proc' if s.processes else 'thread'}"
+        lines.append(f"    {s.name:<10}{workers:>12}{s.items:>7}{s.failures:>8}{s.utilisation(wall):>7.0%}"
+                     f"{s.starved / worker_time:>9.0%}{s.blocked / worker_time:>9.0%}"
+                     f"  {s.max_depth}/{s.mean_depth:.1f}")
+    return lines
@@ -0,0 +1,148 @@
+"""
+Parsed one-pager records and their on-disk cache
+
+A parsed one-pager is a OnePager holding Callout and TableRow records, all
+slotted classes over tuples, so every renderer reads the same compact
+structure. The parser backends still produce the plain dicts that
+--verify-parser compares; `OnePager.from_dict` turns one into a record.
+
+Records serialise to a small binary form: a magic header, then the
+record's fields as nested tuples of strings and ints written with
+`marshal`. Loading one takes microseconds and, unlike pickle, cannot run
+code. `load_cached` keeps them under the SHA-256 of the source HTML, so a
+rerun, or another renderer working from the same HTML, loads the record
+instead of parsing the HTML again.
+
+The cache lives in $DECKKIT_PARSE_CACHE, else deckkit/parsed under the user
+cache directory. Entries are written atomically and caching is best effort:
+an unwritable cache only costs the reparse.
+"""
+
+import hashlib
+import marshal
+from pathlib import Path
+
+from deckkit import cache
+
+MAGIC = b'DKOP'
+# Bump when the record layout changes so cached records are reparsed
+FORMAT_VERSION = 1
+MARSHAL_VERSION = 4
+
+
+class Callout:
+    """One callout box: type is 'critical', 'recommendation', 'bottom-line' or 'default'"""
+    __slots__ = ('type', 'title', 'content')
+
+    def __init__(self, type, title, content):
+        self.type = type
+        self.title = title
+        self.content = content
+
+    def astuple(self):
+        return (self.type, self.title, self.content)
+
+    def __eq__(self, other):
+        return isinstance(other, Callout) and self.astuple() == other.astuple()
+
+    def __repr__(self):
+        return f'Callout({self.type!r}, {self.title!r}, {self.content!r})'
+
+
+class TableRow:
+    """One body row of the one-pager table"""
+    __slots__ = ('cells',)
+
+    def __init__(self, cells):
+        self.cells = tuple(cells)
+
+    def __eq__(self, other):
+        return isinstance(other, TableRow) and self.cells == other.cells
+
+    def __repr__(self):
+        return f'TableRow({self.cells!r})'
+
+
+class OnePager:
+    """Everything a renderer needs from one one-pager HTML file
+
+    highlight_spans holds the (start, end) offset of each highlight in
+    overview, or is None for data that predates them.
+    """
+    __slots__ = ('title', 'overview', 'highlights', 'highlight_spans', 'callouts',
+                 'table_headers', 'rows', 'footer_contact')
+
+    def __init__(self, title='', overview='', highlights=(), highlight_spans=None, callouts=(),
+                 table_headers=(), rows=(), footer_contact=''):
+        self.title = title
+        self.overview = overview
+        self.highlights = tuple(highlights)
+        self.highlight_spans = None if highlight_spans is None else tuple(map(tuple, highlight_spans))
+        self.callouts = tuple(callouts)
+        self.table_headers = tuple(table_headers)
+        self.rows = tuple(rows)
+        self.footer_contact = footer_contact
+
+    @classmethod
+    def from_dict(cls, data):
+        """Record for a parser backend's data dict"""
+        return cls(
+            data['title'], data['overview'], data['overview_highlights'],
+            data.get('overview_highlight_spans'),
+            [Callout(c['type'], c['title'], c['content']) for c in data['callouts']],
+            data['table_headers'], [TableRow(cells) for cells in data['table_content']],
+            data['footer_contact'])
+
+    def astuple(self):
+        """Fields as nested tuples of strings and ints"""
+        return (self.title, self.overview, self.highlights, self.highlight_spans,
+                tuple(c.astuple() for c in self.callouts), self.table_headers,
+                tuple(row.cells for row in self.rows), self.footer_contact)
+
+    @classmethod
+    def fromtuple(cls, fields):
+        title, overview, highlights, spans, callouts, headers, rows, footer = fields
+        return cls(title, overview, highlights, spans, [Callout(*c) for c in callouts],
+                   headers, [TableRow(cells) for cells in rows], footer)
+
+    def __eq__(self, other):
+        return isinstance(other, OnePager) and self.astuple() == other.astuple()
+
+    def __repr__(self):
+        return f'OnePager({self.title!r}, {len(self.callouts)} callouts, {len(self.rows)} rows)'
+
+
+def dumps(record):
+    """Binary form of a OnePager"""
+    return MAGIC + bytes([FORMAT_VERSION]) + marshal.dumps(record.astuple(), MARSHAL_VERSION)
+
+
+def loads(data):
+    """OnePager from its binary form; ValueError if data is not one of this version"""
+    if data[:len(MAGIC)] != MAGIC or data[len(MAGIC):len(MAGIC) + 1] != bytes([FORMAT_VERSION]):
+        raise ValueError("not a one-pager record of this version")
+    try:
+        return OnePager.fromtuple(marshal.loads(data[len(MAGIC) + 1:]))
+    except (EOFError, TypeError, ValueError) as e:
+        raise ValueError(f"corrupt one-pager record: {e}")
+
+
+def load_cached(source, parse, salt='', cache_dir=None):
+    """Record for the source bytes from the cache, else parse() stored in it
+
+    salt, typically the parser's version, is part of the key, so records
+    from another version of the parser are not reused.
+    """
+    key = hashlib.sha256(f'{FORMAT_VERSION}:{salt}:'.encode() + source).hexdigest()
+    path = Path(cache_dir or cache.cache_dir('DECKKIT_PARSE_CACHE', 'parsed')) / key[:2] / f'{key}.rec'
+    try:
+        return loads(path.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    record = parse()
+    try:
+        cache.atomic_write_bytes(path, dumps(record))
+    except OSError:
+        pass  # Caching is best effort, e.g. on a read-only home
+    return record
@@ -0,0 +1,264 @@
+"""
+Headless render verification for generated decks
+
+Renders every slide of a .pptx to PNG and compares it with a stored baseline
+image, so layout regressions show up without opening PowerPoint. Decks are
+converted to PDF by LibreOffice (`soffice --headless`), all in one process,
+and the PDF pages are rasterised in parallel by poppler's `pdftoppm`. Renders
+are cached by the SHA-256 of the deck, so an unchanged deck is never
+rendered twice.
+
+The comparison is perceptual rather than byte-exact. Both images are reduced
+to greyscale at a common width and lightly blurred, which absorbs font
+anti-aliasing and sub-pixel renderer jitter. A pixel counts as changed when
+it differs by more than PIXEL_THRESHOLD grey levels, and a slide fails when
+more than `tolerance` of its pixels change. Each failing slide gets a diff
+image with the changed pixels painted red over the new render.
+
+Baselines live in render-baselines/<deck name>/slide-NNN.png beside each deck
+unless a baseline root is given. They are created or replaced with --update.
+
+    python -m deckkit.render_check deck.pptx ...
+    python -m deckkit.render_check --update deck.pptx ...
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from deckkit import cache
+
+RENDER_DPI = 96
+# Bump when rendering changes so cached renders are regenerated
+RENDER_CACHE_VERSION = '1'
+BASELINE_DIR_NAME = 'render-baselines'
+COMPARE_WIDTH = 640     # Pixels; both images are scaled to this width before diffing
+BLUR_RADIUS = 1.0
+PIXEL_THRESHOLD = 32    # Grey levels (of 255) a pixel must change by to count
+TOLERANCE = 0.002       # Fraction of changed pixels a slide may have and still pass
+SOFFICE_TIMEOUT = 600   # Seconds for the whole batch conversion
+
+
+class RenderError(RuntimeError):
+    """Raised when a deck cannot be rendered"""
+
+
+def baseline_dir(pptx_path, baseline_root=None):
+    """Directory holding a deck's baseline slide images"""
+    pptx_path = Path(pptx_path)
+    root = Path(baseline_root) if baseline_root else pptx_path.parent / BASELINE_DIR_NAME
+    return root / pptx_path.stem
+
+
+def _tool(*names):
+    for name in names:
+        path = shutil.which(name)
+        if path:
+            return path
+    raise RenderError(f"{names[0]} not found; rendering needs LibreOffice and poppler-utils")
+
+
+def _run(argv, timeout=None):
+    result = subprocess.run(argv, capture_output=True, timeout=timeout)
+    if result.returncode:
+        message = result.stderr.decode(errors='replace').strip()
+        raise RenderError(message or f"{Path(argv[0]).name} exited with status {result.returncode}")
+    return result.stdout.decode(errors='replace')
+
+
+def decks_to_pdf(pptx_paths, out_dir):
+    """Convert decks to <out_dir>/<n>.pdf in a single LibreOffice run, returning the PDF paths"""
+    soffice = _tool('soffice', 'libreoffice')
+    out_dir = Path(out_dir)
+    # Numbered links keep decks with the same file name apart
+    links = []
+    for n, pptx_path in enumerate(pptx_paths):
+        link = out_dir / f'{n}.pptx'
+        os.symlink(Path(pptx_path).resolve(), link)
+        links.append(link)
+    # A private profile, so a desktop LibreOffice that is already running is not reused
+    profile = (out_dir / 'profile').as_uri()
+    _run([soffice, f'-env:UserInstallation={profile}', '--headless', '--norestore',
+          '--convert-to', 'pdf', '--outdir', str(out_dir)] + [str(link) for link in links],
+         timeout=SOFFICE_TIMEOUT)
+
+    pdfs = [link.with_suffix('.pdf') for link in links]
+    for pptx_path, pdf in zip(pptx_paths, pdfs):
+        if not pdf.is_file():
+            raise RenderError(f"LibreOffice did not convert {pptx_path}")
+    return pdfs
+
+
+def page_count(pdf_path):
+    match = re.search(r'^Pages:\s+(\d+)', _run([_tool('pdfinfo'), str(pdf_path)]), re.MULTILINE)
+    if not match:
+        raise RenderError(f"cannot read the page count of {pdf_path}")
+    return int(match.group(1))
+
+
+def rasterise_page(pdf_path, page, out_prefix, dpi=RENDER_DPI):
+    """Render one PDF page to <out_prefix>.png"""
+    _run([_tool('pdftoppm'), '-png', '-r', str(dpi), '-f', str(page), '-l', str(page),
+          '-singlefile', str(pdf_path), str(out_prefix)])
+
+
+def render_key(pptx_path, dpi=RENDER_DPI):
+    settings = f'{RENDER_CACHE_VERSION}:{dpi}:'.encode()
+    return hashlib.sha256(settings + Path(pptx_path).read_bytes()).hexdigest()
+
+
+def render_decks(pptx_paths, cache_dir=None, dpi=RENDER_DPI, workers=None):
+    """{deck path: [slide PNG paths]}, rendering only the decks not already cached"""
+    cache_dir = Path(cache_dir) if cache_dir else cache.cache_dir('DECKKIT_RENDER_CACHE', 'renders')
+    targets = {}
+    for pptx_path in pptx_paths:
+        key = render_key(pptx_path, dpi)
+        targets[pptx_path] = cache_dir / key[:2] / key
+
+    todo = [p for p in pptx_paths if not targets[p].is_dir()]
+    if todo:
+        with tempfile.TemporaryDirectory() as tmp:
+            pdfs = decks_to_pdf(todo, tmp)
+            stages, jobs = [], []
+            for pptx_path, pdf in zip(todo, pdfs):
+                stage = targets[pptx_path].with_name(f'{targets[pptx_path].name}.{os.getpid()}.tmp')
+                stage.mkdir(parents=True, exist_ok=True)
+                stages.append(stage)
+                jobs.extend((pdf, page, stage / f'slide-{page:03d}')
+                            for page in range(1, page_count(pdf) + 1))
+            # pdftoppm runs as a subprocess, so threads are enough to use every core
+            with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+                list(pool.map(lambda job: rasterise_page(*job, dpi), jobs))
+            for pptx_path, stage in zip(todo, stages):
+                try:
+                    os.rename(stage, targets[pptx_path])
+                except OSError:
+                    shutil.rmtree(stage)  # Rendered concurrently by another process
+
+    return {p: sorted(targets[p].glob('slide-*.png')) for p in pptx_paths}
+
+
+def compare_images(baseline_path, render_path, width=COMPARE_WIDTH):
+    """(fraction of pixels changed, changed-pixel mask) between two slide images"""
+    from PIL import Image, ImageChops, ImageFilter
+
+    with Image.open(baseline_path) as baseline, Image.open(render_path) as render:
+        # A render with another aspect ratio is stretched to the baseline's and
+        # fails on content, rather than being skipped
+        size = (width, max(1, round(width * baseline.height / baseline.width)))
+        a, b = (image.convert('L').resize(size, Image.BILINEAR).filter(ImageFilter.GaussianBlur(BLUR_RADIUS))
+                for image in (baseline, render))
+    mask = ImageChops.difference(a, b).point(lambda v: 255 if v > PIXEL_THRESHOLD else 0)
+    return mask.histogram()[255] / (size[0] * size[1]), mask
+
+
+def write_diff_image(render_path, mask, out_path):
+    """Save the render with the changed pixels painted red"""
+    from PIL import Image
+
+    with Image.open(render_path) as render:
+        base = render.convert('RGB').resize(mask.size, Image.BILINEAR)
+    Image.composite(Image.new('RGB', mask.size, (255, 0, 0)), base, mask).save(out_path)
+
+
+def check_slides(renders, baselines, tolerance=TOLERANCE, pool=None):
+    """[(slide name, status, changed fraction, diff image)] comparing renders with baselines
+
+    status is 'ok', 'changed', 'new' (no baseline yet) or 'missing' (the
+    baseline has a slide the deck no longer has).
+    """
+    baseline_paths = {p.name: p for p in Path(baselines).glob('slide-*.png')} if Path(baselines).is_dir() else {}
+
+    def check(render):
+        baseline = baseline_paths.get(render.name)
+        if baseline is None:
+            return render.stem, 'new', None, None
+        changed, mask = compare_images(baseline, render)
+        if changed <= tolerance:
+            return render.stem, 'ok', changed, None
+        diff_path = render.parent / 'diffs' / render.name
+        diff_path.parent.mkdir(exist_ok=True)
+        write_diff_image(render, mask, diff_path)
+        return render.stem, 'changed', changed, diff_path
+
+    results = list((pool.map if pool else map)(check, renders))
+    rendered = {render.name for render in renders}
+    results.extend((Path(name).stem, 'missing', None, None)
+                   for name in sorted(baseline_paths) if name not in rendered)
+    return results
+
+
+def update_baselines(renders, baselines):
+    """Replace a deck's baseline images with its current renders"""
+    baselines = Path(baselines)
+    baselines.mkdir(parents=True, exist_ok=True)
+    for old in baselines.glob('slide-*.png'):
+        old.unlink()
+    for render in renders:
+        shutil.copyfile(render, baselines / render.name)
+
+
+def verify_renders(pptx_paths, baseline_root=None, update=False, tolerance=TOLERANCE,
+                   dpi=RENDER_DPI, workers=None, cache_dir=None):
+    """Render decks and check them against their baselines, printing a report
+
+    With update=True the baselines are replaced instead. Returns True when
+    every slide of every deck matches.
+    """
+    pptx_paths = [Path(p) for p in pptx_paths]
+    renders = render_decks(pptx_paths, cache_dir, dpi, workers)
+    failures = 0
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for pptx_path in pptx_paths:
+            baselines = baseline_dir(pptx_path, baseline_root)
+            if update:
+                update_baselines(renders[pptx_path], baselines)
+                print(f"Updated: {baselines} ({len(renders[pptx_path])} slides)")
+                continue
+            results = check_slides(renders[pptx_path], baselines, tolerance, pool)
+            bad = [r for r in results if r[1] != 'ok']
+            failures += len(bad)
+            print(f"{'✓' if not bad else '✗'} {pptx_path}: "
+                  f"{len(results) - len(bad)}/{len(results)} slides match")
+            for name, status, changed, diff_path in bad:
+                if status == 'changed':
+                    print(f"    {name}: {changed:.2%} of pixels changed, see {diff_path}")
+                elif status == 'new':
+                    print(f"    {name}: no baseline (accept with --update)")
+                else:
+                    print(f"    {name}: in the baseline but no longer rendered")
+    return not failures
+
+
+def main():
+    """Verify deck renders against their baselines"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('decks', nargs='+', type=Path, help='.pptx files to render and check')
+    parser.add_argument('--baselines', type=Path, default=None, metavar='DIR',
+                        help=f'Baseline root, holding a directory per deck (default: {BASELINE_DIR_NAME}/ beside each deck)')
+    parser.add_argument('--update', action='store_true',
+                        help='Accept the current renders as the new baselines')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE * 100, metavar='PERCENT',
+                        help=f'Changed pixels allowed per slide (default: {TOLERANCE * 100:g}%%)')
+    parser.add_argument('--dpi', type=int, default=RENDER_DPI,
+                        help=f'Render resolution (default: {RENDER_DPI})')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(),
+                        help='Parallel page renders and comparisons (default: CPU count)')
+    args = parser.parse_args()
+
+    try:
+        ok = verify_renders(args.decks, args.baselines, args.update, args.tolerance / 100,
+                            args.dpi, args.workers)
+    except (RenderError, OSError, subprocess.TimeoutExpired) as e:
+        raise SystemExit(f"Error: {e}")
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""
+Reproducible deck output
+
+python-pptx stamps every zip entry with the time of saving, so the same
+deck saved twice differs byte for byte. Decks are written instead by
+deckkit.package_writer with fixed entry metadata:
+- [Content_Types].xml first, then the parts sorted by name
+- one timestamp for every entry
+- the same permissions for every entry, and compression by part type
+
+The timestamp is $SOURCE_DATE_EPOCH when set (the reproducible-builds
+convention), and the core properties' created and modified dates are set to
+it too. Otherwise the entries carry the zip epoch, 1980-01-01, and the
+template's dates are kept. Shape ids are deterministic already, since they
+are assigned in document order.
+
+Identical inputs therefore give identical bytes. `save_deck` streams the
+package to a temporary file beside the target, compares it with the file
+already on disk and leaves an unchanged deck untouched, mtime included.
+`write_if_changed` does the same for bytes from `deck_bytes`, for callers
+that build decks in one place and write them in another, and
+`streamed_deck` for decks written slide by slide as they are built.
+"""
+
+import contextlib
+import io
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from deckkit.cache import atomic_write_bytes, temp_path
+from deckkit.package_writer import PackageStream, write_package
+from deckkit.trace import traced
+
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)  # Earliest date a zip entry can carry
+COMPARE_CHUNK = 1 << 20
+
+
+def source_date():
+    """$SOURCE_DATE_EPOCH as a UTC datetime, or None when unset"""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if not epoch:
+        return None
+    try:
+        return datetime.fromtimestamp(int(epoch), timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        raise ValueError(f"SOURCE_DATE_EPOCH must be a Unix timestamp, got {epoch!r}")
+
+
+def _stamp(prs):
+    """Fix the core properties' dates to $SOURCE_DATE_EPOCH, returning the zip entry date"""
+    date = source_date()
+    if date is None:
+        return ZIP_EPOCH
+    core = prs.core_properties
+    # Naive UTC, which python-pptx writes with a Z suffix
+    core.created = core.modified = date.replace(tzinfo=None)
+    return max(ZIP_EPOCH, date.timetuple()[:6])
+
+
+@traced('save')
+def deck_bytes(prs, compression=None, stats=None):
+    """The presentation's .pptx bytes, identical for identical content
+
+    compression and stats are as for save_deck.
+    """
+    buffer = io.BytesIO()
+    part_stats = write_package(prs, buffer, _stamp(prs), compression)
+    if stats is not None:
+        stats.extend(part_stats)
+    return buffer.getvalue()
+
+
+def _same_file(a, b):
+    """True if the files at a and b hold the same bytes"""
+    try:
+        if a.stat().st_size != b.stat().st_size:
+            return False
+        with open(a, 'rb') as fa, open(b, 'rb') as fb:
+            while True:
+                chunk = fa.read(COMPARE_CHUNK)
+                if chunk != fb.read(COMPARE_CHUNK):
+                    return False
+                if not chunk:
+                    return True
+    except OSError:
+        return False
+
+
+@traced('save')
+def write_if_changed(path, data):
+    """Write deck bytes to path atomically unless the file already holds them; returns True if written"""
+    path = Path(path)
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+
+@traced('save')
+def save_deck(prs, path, compression=None, stats=None):
+    """Save a presentation reproducibly, skipping the write if the file is unchanged
+
+    The package is streamed to disk part by part rather than built in
+    memory. compression overrides the per-extension levels of
+    deckkit.package_writer; a list passed as stats receives a PartStats per
+    entry. Returns True if the file was written.
+    """
+    path = Path(path)
+    tmp_path = temp_path(path)
+    try:
+        with open(tmp_path, 'wb') as f:
+            part_stats = write_package(prs, f, _stamp(prs), compression)
+        if stats is not None:
+            stats.extend(part_stats)
+        if _same_file(tmp_path, path):
+            return False
+        os.replace(tmp_path, path)
+        return True
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+@contextlib.contextmanager
+def streamed_deck(prs, path, compression=None, stats=None):
+    """Context manager yielding a PackageStream writing prs to path
+
+    Slides passed to the stream's `write_slide` are written at once; on
+    leaving the block the rest of the package is written and the file
+    replaces path unless identical, as with save_deck. The stream's
+    `changed` attribute then says whether path was written. Nothing is
+    written if the block raises.
+    """
+    path = Path(path)
+    tmp_path = temp_path(path)
+    try:
+        with open(tmp_path, 'wb') as f:
+            stream = PackageStream(prs, f, _stamp(prs), compression)
+            try:
+                yield stream
+            finally:
+                part_stats = stream.close()
+        if stats is not None:
+            stats.extend(part_stats)
+        stream.changed = not _same_file(tmp_path, path)
+        if stream.changed:
+            os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
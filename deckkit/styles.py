@@ -0,0 +1,92 @@
+"""
+Memoized text styles for python-pptx paragraphs and runs
+
+Setting `font.name`, `font.size`, `font.bold` and `font.color.rgb` one at a
+time rewrites the run-properties XML four times for every paragraph. A
+TextStyle compiles its property set into an `a:defRPr` / `a:rPr` element on
+first use and applies it afterwards as a single element copy.
+"""
+
+import copy
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.text.text import Font
+
+
+class TextStyle:
+    """Immutable set of character properties, compiled lazily to XML"""
+    __slots__ = ('name', 'size', 'bold', 'italic', 'color', '_compiled')
+
+    def __init__(self, name=None, size=None, bold=None, italic=None, color=None):
+        self.name = name
+        self.size = size
+        self.bold = bold
+        self.italic = italic
+        self.color = color
+        self._compiled = {}
+
+    def _element(self, tag):
+        """The compiled properties element for tag ('defRPr' or 'rPr')"""
+        elm = self._compiled.get(tag)
+        if elm is None:
+            elm = parse_xml(f'<a:{tag} {nsdecls("a")}/>')
+            font = Font(elm)
+            if self.name is not None:
+                font.name = self.name
+            if self.size is not None:
+                font.size = self.size
+            if self.bold is not None:
+                font.bold = self.bold
+            if self.italic is not None:
+                font.italic = self.italic
+            if self.color is not None:
+                font.color.rgb = self.color
+            self._compiled[tag] = elm
+        return elm
+
+    def apply(self, paragraph):
+        """Set the paragraph's default run properties in one operation"""
+        pPr = paragraph._p.get_or_add_pPr()
+        pPr._remove_defRPr()
+        pPr._insert_defRPr(copy.deepcopy(self._element('defRPr')))
+
+    def apply_run(self, run):
+        """Set a run's properties in one operation"""
+        r = run._r
+        r._remove_rPr()
+        r._insert_rPr(copy.deepcopy(self._element('rPr')))
+
+    def apply_frame(self, text_frame):
+        """Apply the style to every paragraph of a text frame or table cell"""
+        for paragraph in text_frame.paragraphs:
+            self.apply(paragraph)
+
+    def derive(self, **changes):
+        """A new style with some properties replaced"""
+        props = {slot: getattr(self, slot) for slot in TextStyle.__slots__[:-1]}
+        props.update(changes)
+        return TextStyle(**props)
+
+
+class StyleRegistry:
+    """Named TextStyles, created on first lookup and shared afterwards"""
+
+    def __init__(self, **defaults):
+        self._defaults = defaults
+        self._specs = {}
+        self._styles = {}
+
+    def define(self, style_name, **props):
+        """Register a style; registry defaults fill any property not given"""
+        self._specs[style_name] = {**self._defaults, **props}
+        self._styles.pop(style_name, None)
+
+    def __getitem__(self, style_name):
+        style = self._styles.get(style_name)
+        if style is None:
+            style = self._styles[style_name] = TextStyle(**self._specs[style_name])
+        return style
+
+    def __contains__(self, style_name):
+        return style_name in self._specs
@@ -0,0 +1,172 @@
+"""
+Font-metrics text measurement for slide layout
+
+Predicts how tall a wrapped text frame will be, without rendering, from the
+advance widths of the brand fonts. The Graphik TTFs in docs/branding are
+measured once with Pillow. The resulting per-character width table (in ems)
+is cached on disk keyed by the font file's path, size and modification time,
+so later runs need neither Pillow nor the font's contents. Line breaking is PowerPoint's greedy word wrap, and word
+widths are memoised, so thousands of frames can be measured per second.
+
+Fallbacks, in order:
+- a character the font lacks gets the font's average letter width (East Asian
+  wide characters get 1 em)
+- a font file that is missing, or Pillow not installed, gives AVERAGE_CHAR_WIDTH
+  for every character, the estimate the layout used before measurement existed
+"""
+
+import hashlib
+import json
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+
+from deckkit import cache
+
+FONT_DIR = Path(__file__).resolve().parent.parent / 'docs' / 'branding' / 'Font_Graphik_GT' / 'Graphik'
+
+# (family, bold, italic) -> font file. No Bold cut ships with the brand kit;
+# Semibold is the closest in width to what PowerPoint shows for bold Graphik.
+FONT_FILES = {
+    ('Graphik', False, False): FONT_DIR / 'Graphik-Regular.ttf',
+    ('Graphik', True, False): FONT_DIR / 'Graphik-Semibold.ttf',
+    ('Graphik', False, True): FONT_DIR / 'Graphik-Regular Italic.ttf',
+    ('Graphik', True, True): FONT_DIR / 'Graphik-Semibold Italic.ttf',
+}
+
+AVERAGE_CHAR_WIDTH = 0.5  # Ems, when no font metrics are available
+LINE_SPACING = 1.2        # Line height as a multiple of the font size
+
+# Characters measured into the width table: Latin, general punctuation,
+# currency, letterlike symbols, arrows, maths operators, box drawing,
+# geometric shapes and dingbats (✓ ✗ ➜)
+MEASURED_RANGES = ((0x20, 0x250), (0x2000, 0x2300), (0x2500, 0x27C0))
+# Bump when the measurement changes so cached tables are rebuilt
+METRICS_VERSION = '1'
+MEASURE_SIZE = 1000  # Pixels per em when measuring, for 0.001 em precision
+
+
+class FontMetrics:
+    """Advance widths of one font, in ems, with greedy line wrapping"""
+    __slots__ = ('name', '_widths', '_missing', '_words')
+
+    def __init__(self, name, widths):
+        self.name = name
+        self._widths = widths
+        letters = [widths[c] for c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ' if c in widths]
+        self._missing = sum(letters) / len(letters) if letters else AVERAGE_CHAR_WIDTH
+        self._words = {}
+
+    def char_width(self, char):
+        width = self._widths.get(char)
+        if width is None:
+            if unicodedata.combining(char):
+                width = 0.0
+            elif unicodedata.east_asian_width(char) in ('W', 'F'):
+                width = 1.0
+            else:
+                width = self._missing
+            self._widths[char] = width
+        return width
+
+    def width(self, text):
+        """Advance width of text in ems (kerning ignored)"""
+        width = self._words.get(text)
+        if width is None:
+            width = sum(self.char_width(c) for c in text)
+            if len(self._words) < 100_000:
+                self._words[text] = width
+        return width
+
+    def line_count(self, text, size, max_width):
+        """Lines text wraps to at size points in a frame max_width points wide"""
+        available = max_width / size  # In ems
+        if available <= 0:
+            return max(1, len(text))
+        space = self.char_width(' ')
+        lines = 0
+        for paragraph in text.split('\n'):
+            lines += 1
+            x = 0.0
+            for word in paragraph.split(' '):
+                w = self.width(word)
+                if x and x + space + w > available:
+                    lines += 1
+                    x = 0.0
+                elif x:
+                    x += space
+                if w > available:
+                    # A word wider than the frame breaks between characters
+                    for char in word:
+                        cw = self.char_width(char)
+                        if x and x + cw > available:
+                            lines += 1
+                            x = 0.0
+                        x += cw
+                else:
+                    x += w
+        return lines
+
+    def text_height(self, text, size, max_width, line_spacing=LINE_SPACING):
+        """Height in points of text wrapped at size points into max_width points"""
+        return self.line_count(text, size, max_width) * size * line_spacing
+
+    def fit_size(self, text, max_width, max_height, size, min_size, step=0.5,
+                 line_spacing=LINE_SPACING):
+        """Largest size from size down to min_size (in steps) at which text fits max_height"""
+        while size > min_size and self.text_height(text, size, max_width, line_spacing) > max_height:
+            size -= step
+        return max(size, min_size)
+
+
+def _measure(font_path):
+    """{char: advance in ems} for the MEASURED_RANGES characters the font has"""
+    from PIL import ImageFont
+
+    font = ImageFont.truetype(str(font_path), MEASURE_SIZE)
+    # Unmapped characters render as the .notdef glyph; a private-use code point stands in for it
+    notdef = (font.getlength('\ue000'), font.getbbox('\ue000'))
+    widths = {}
+    for start, stop in MEASURED_RANGES:
+        for code in range(start, stop):
+            char = chr(code)
+            if unicodedata.category(char) in ('Cc', 'Cs', 'Cn'):
+                continue
+            length = font.getlength(char)
+            if (length, font.getbbox(char)) == notdef:
+                continue
+            widths[char] = length / MEASURE_SIZE
+    return widths
+
+
+def _width_table(font_path, cache_dir):
+    """Width table for a font file, from the disk cache or freshly measured"""
+    stat = font_path.stat()
+    identity = f'{METRICS_VERSION}:{font_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}'
+    key = hashlib.sha256(identity.encode()).hexdigest()
+    cache_path = cache_dir / f'{key}.json'
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    widths = _measure(font_path)
+    try:
+        cache.atomic_write_bytes(cache_path, json.dumps(widths, ensure_ascii=False).encode())
+    except OSError:
+        pass  # Caching is best effort
+    return widths
+
+
+@lru_cache(maxsize=None)
+def font_metrics(family='Graphik', bold=False, italic=False):
+    """FontMetrics for a family and style, falling back to the average-width estimate"""
+    font_path = FONT_FILES.get((family, bold, italic)) or FONT_FILES.get((family, bold, False))
+    name = f"{family}{' Bold' if bold else ''}{' Italic' if italic else ''}"
+    if font_path is not None:
+        try:
+            return FontMetrics(name, _width_table(font_path, cache.cache_dir('DECKKIT_METRICS_CACHE', 'metrics')))
+        except (OSError, ImportError):
+            pass
+    return FontMetrics(f'{name} (estimated)', {})
@@ -0,0 +1,207 @@
+"""
+Opt-in tracing of the deck generators
+
+Set $DECKKIT_TRACE to a path, or pass --trace PATH to create_pptx_from_html.py
+or generate_deck.py, to record a span around every parse, slide builder and
+save. Each span records its wall time and the net change in allocated
+memory blocks (`sys.getallocatedblocks`). At the end of the run the spans
+are written to PATH as Chrome trace-event JSON, which loads in
+chrome://tracing or https://ui.perfetto.dev, and a summary per span name is
+printed:
+- calls
+- total, mean and max milliseconds
+- net allocated blocks
+
+The times are inclusive: a slide builder's time includes the spans nested
+inside it.
+
+Worker processes inherit the setting through the environment. Each process
+appends its spans to its own file in PATH.parts/, and `finish` merges
+them, so process-pool runs show one track per worker. With tracing off,
+`traced` functions cost one extra call and `span` is a shared no-op
+context.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from deckkit.cache import atomic_write_bytes
+
+ENV_VAR = 'DECKKIT_TRACE'
+
+_NO_SPAN = contextlib.nullcontext()
+
+
+class Tracer:
+    """Span recorder writing this process's events to <path>.parts/<pid>.jsonl"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.parts_dir = self.path.with_name(self.path.name + '.parts')
+        self._pid = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _out(self):
+        # Reopened after a fork, so workers never share the parent's file
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self.parts_dir.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.parts_dir / f'{self._pid}.jsonl', 'a', encoding='utf-8', buffering=1)
+        return self._file
+
+    def record(self, name, cat, start_ns, end_ns, blocks, args=None):
+        event = {'name': name, 'cat': cat, 'ph': 'X', 'ts': start_ns / 1000,
+                 'dur': (end_ns - start_ns) / 1000, 'pid': os.getpid(),
+                 'tid': threading.get_ident(), 'args': {'alloc_blocks': blocks, **(args or {})}}
+        line = json.dumps(event) + '\n'
+        with self._lock:
+            self._out().write(line)
+
+    @contextlib.contextmanager
+    def span(self, name, cat, args=None):
+        blocks = sys.getallocatedblocks()
+        start = time.monotonic_ns()  # One clock for every process on the host
+        try:
+            yield
+        finally:
+            end = time.monotonic_ns()
+            self.record(name, cat, start, end, sys.getallocatedblocks() - blocks, args)
+
+    def close(self):
+        if self._file is not None and self._pid == os.getpid():
+            self._file.close()
+        self._file = self._pid = None
+
+
+_tracer = None
+_configured = False
+
+
+def tracer():
+    """The active Tracer, or None when tracing is off"""
+    global _tracer, _configured
+    if not _configured:
+        path = os.environ.get(ENV_VAR)
+        _tracer = Tracer(path) if path else None
+        _configured = True
+    return _tracer
+
+
+def _after_fork():
+    # A fork from a threaded run can copy the lock while another thread holds it
+    if _tracer is not None:
+        _tracer._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_after_fork)
+
+
+def start(path):
+    """Trace this run, and the worker processes it starts, into path"""
+    global _configured
+    os.environ[ENV_VAR] = str(path)
+    _configured = False
+    active = tracer()
+    for part in active.parts_dir.glob('*.jsonl'):
+        part.unlink()  # Left by an interrupted run
+    return active
+
+
+@contextlib.contextmanager
+def session(path=None):
+    """Trace the enclosed run into path, or $DECKKIT_TRACE if set, finishing however it exits"""
+    if path:
+        start(path)
+    try:
+        yield
+    finally:
+        finish()
+
+
+def span(name, cat='deckkit', **args):
+    """Context manager recording a span when tracing is on"""
+    active = tracer()
+    return active.span(name, cat, args) if active else _NO_SPAN
+
+
+def traced(cat='deckkit', name=None):
+    """Decorator recording a span around every call of the function when tracing is on"""
+    def decorate(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            active = tracer()
+            if active is None:
+                return func(*args, **kwargs)
+            with active.span(span_name, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def load_events(parts_dir):
+    events = []
+    for part in sorted(Path(parts_dir).glob('*.jsonl')):
+        with open(part, encoding='utf-8') as f:
+            # A worker killed mid-write leaves at most a partial last line
+            for line in f:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    pass
+    return events
+
+
+def summarise(events):
+    """[(name, calls, total ms, mean ms, max ms, net allocated blocks)], by total time"""
+    totals = {}
+    for event in events:
+        entry = totals.setdefault(event['name'], [0, 0.0, 0.0, 0])
+        entry[0] += 1
+        entry[1] += event['dur'] / 1000
+        entry[2] = max(entry[2], event['dur'] / 1000)
+        entry[3] += event['args'].get('alloc_blocks', 0)
+    rows = [(name, calls, total, total / calls, longest, blocks)
+            for name, (calls, total, longest, blocks) in totals.items()]
+    return sorted(rows, key=lambda row: -row[2])
+
+
+def format_summary(rows):
+    lines = [f"  {'Span':<32}{'Calls':>7}{'Total ms':>11}{'Mean ms':>10}{'Max ms':>10}{'Blocks':>10}"]
+    for name, calls, total, mean, longest, blocks in rows:
+        lines.append(f"  {name:<32}{calls:>7}{total:>11.1f}{mean:>10.2f}{longest:>10.2f}{blocks:>10}")
+    return lines
+
+
+def finish():
+    """Merge every process's spans into the trace file and print the summary
+
+    Does nothing when tracing is off. Tracing is then switched off for the
+    rest of the process, so a long-lived daemon traces only the run that
+    asked for it.
+    """
+    global _tracer, _configured
+    active = tracer()
+    if active is None:
+        return
+    active.close()
+    events = load_events(active.parts_dir)
+    events.sort(key=lambda event: event['ts'])
+    atomic_write_bytes(active.path, json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'}).encode())
+    for part in active.parts_dir.glob('*.jsonl'):
+        part.unlink()
+    with contextlib.suppress(OSError):
+        active.parts_dir.rmdir()
+
+    print(f"Trace: {active.path} ({len(events)} spans)")
+    print('\n'.join(format_summary(summarise(events))))
+    os.environ.pop(ENV_VAR, None)
+    _tracer, _configured = None, True
@@ -0,0 +1,222 @@
+"""
+Recursive file watching for the deck generators' watch modes
+
+Uses Linux inotify through ctypes (no extra dependency) and falls back to
+polling file mtimes where inotify is unavailable or out of watches. A
+subdirectory created while watching that cannot be watched is polled on its
+own, the rest of the tree staying on inotify. `watch`
+debounces bursts of events, such as an editor's write-then-rename save, into
+one batch of changed paths.
+"""
+
+import ctypes
+import errno
+import os
+import select
+import struct
+import time
+from pathlib import Path
+
+DEBOUNCE = 0.2       # Seconds of quiet before a batch of changes is reported
+POLL_INTERVAL = 1.0  # Seconds between scans for the polling fallback
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF | IN_ONLYDIR
+EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+def _walk_dirs(root):
+    """root and every directory below it, skipping hidden ones"""
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+        yield Path(dirpath)
+
+
+class InotifyWatcher:
+    """Recursive inotify watch reporting writes to files with the given names"""
+
+    def __init__(self, root, names):
+        import ctypes.util  # Pulls in subprocess and shutil, so only imported when watching
+
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name:
+            raise OSError(errno.ENOSYS, 'libc not found')
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, 'inotify is not supported on this platform')
+        self._libc.inotify_add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+
+        self.root = Path(root)
+        self.names = frozenset(names)
+        self._dirs = {}
+        self._pollers = []  # PollingWatchers for new subtrees inotify could not watch
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        try:
+            for directory in _walk_dirs(self.root):
+                self._add_watch(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):  # Removed before we got to it
+                return
+            # Including ENOSPC (fs.inotify.max_user_watches), which open_watcher turns into polling
+            raise OSError(err, os.strerror(err), str(directory))
+        self._dirs[wd] = directory
+
+    def _rescan(self):
+        """Every matching file, used after the kernel event queue overflows"""
+        return {path for directory in _walk_dirs(self.root) for path in directory.iterdir()
+                if path.name in self.names}
+
+    def changes(self, timeout=None):
+        """Matching files written since the last call, waiting up to timeout seconds"""
+        if self._pollers:
+            timeout = POLL_INTERVAL if timeout is None else min(timeout, POLL_INTERVAL)
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        changed = set()
+        for poller in self._pollers:
+            changed |= poller.poll()
+        if not ready:
+            return changed
+
+        data = os.read(self._fd, 64 * 1024)
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                changed |= self._rescan()
+                continue
+            if mask & (IN_IGNORED | IN_DELETE_SELF):
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            path = directory / name
+            if mask & IN_ISDIR:
+                # New subdirectory: watch it and pick up anything already written into it
+                if mask & (IN_CREATE | IN_MOVED_TO) and not name.startswith('.'):
+                    changed |= self._watch_subtree(path)
+            elif name in self.names:
+                changed.add(path)
+        return changed
+
+    def _watch_subtree(self, path):
+        """Watch a new directory tree, returning the matching files already in it
+
+        If a directory cannot be watched, typically for want of inotify
+        watches, the subtree is polled instead.
+        """
+        found = set()
+        try:
+            for subdir in _walk_dirs(path):
+                self._add_watch(subdir)
+                found |= {p for p in subdir.iterdir() if p.name in self.names}
+        except FileNotFoundError:
+            pass  # Removed again before it could be watched
+        except OSError as e:
+            print(f"Warning: cannot watch {path} ({e.strerror}); polling it every {POLL_INTERVAL:g}s")
+            poller = PollingWatcher(path, self.names)
+            self._pollers.append(poller)
+            found |= set(poller._snapshot)
+        return found
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PollingWatcher:
+    """Fallback watcher comparing (mtime, size) snapshots every interval seconds"""
+
+    def __init__(self, root, names, interval=POLL_INTERVAL):
+        self.root = Path(root)
+        self.names = frozenset(names)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for directory in _walk_dirs(self.root):
+            for name in self.names:
+                path = directory / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def changes(self, timeout=None):
+        """Matching files created or modified since the last scan"""
+        time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+        return self.poll()
+
+    def poll(self):
+        """Matching files created or modified since the last scan, without waiting"""
+        snapshot = self._scan()
+        changed = {path for path, stamp in snapshot.items() if self._snapshot.get(path) != stamp}
+        self._snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_watcher(root, names, poll_interval=POLL_INTERVAL):
+    """An inotify watcher where possible, else a polling one"""
+    try:
+        return InotifyWatcher(root, names)
+    except OSError:
+        return PollingWatcher(root, names, poll_interval)
+
+
+def watch(root, names, debounce=DEBOUNCE, poll_interval=POLL_INTERVAL):
+    """Yield sorted lists of changed files, once each burst of writes has settled"""
+    with open_watcher(root, names, poll_interval) as watcher:
+        pending = set()
+        while True:
+            changed = watcher.changes(debounce if pending else None)
+            if changed:
+                pending |= changed
+            elif pending:
+                existing = sorted(path for path in pending if path.exists())
+                pending = set()
+                if existing:
+                    yield existing